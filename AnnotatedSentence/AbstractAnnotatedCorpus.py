@@ -0,0 +1,630 @@
+from __future__ import annotations
+
+import itertools
+import os
+import re
+from collections import deque
+
+from Corpus.AbstractCorpus import AbstractCorpus
+from DependencyParser.ParserEvaluationScore import ParserEvaluationScore
+
+from AnnotatedSentence.AnnotatedSentence import AnnotatedSentence
+from AnnotatedSentence.AnnotatedWord import AnnotatedWord
+from AnnotatedSentence.CorpusComparison import CorpusComparison
+from AnnotatedSentence.CoverageReport import CoverageReport
+from AnnotatedSentence.ExportStatistics import ExportStatistics
+from AnnotatedSentence.ViewLayerType import ViewLayerType
+
+
+class AbstractAnnotatedCorpus(AbstractCorpus):
+    """
+    Base class of the annotated corpora. Holds the operations that only need to visit the sentences one by one, so
+    that they work both on a corpus kept in memory and on a corpus streamed from its folder.
+    """
+
+    def __iter__(self):
+        """
+        Iterates over the sentences of the corpus in order, using the open, getNextSentence and close methods.
+        """
+        self.open()
+        sentence = self.getNextSentence()
+        while sentence is not None:
+            yield sentence
+            sentence = self.getNextSentence()
+        self.close()
+
+    @staticmethod
+    def sentenceFileNames(folder: str, pattern: str = None) -> list:
+        """
+        Returns the names of the sentence files inside the given folder, whose names satisfy the given pattern, in
+        the order they are visited while walking the folder.
+
+        PARAMETERS
+        ----------
+        folder : str
+            Folder where all sentences reside.
+        pattern : str
+            File pattern such as "." ".train" ".test".
+
+        RETURNS
+        -------
+        list
+            Names of the sentence files.
+        """
+        file_names = []
+        for root, dirs, files in os.walk(folder):
+            for file in files:
+                file_name = os.path.join(root, file)
+                if (pattern is None or pattern in file_name) and re.match("\\d+\\.", file):
+                    file_names.append(file_name)
+        return file_names
+
+    def getColumnarCorpus(self, layers: list = None):
+        """
+        Builds a columnar view of the corpus, where each annotation layer of all words is stored as one NumPy array.
+        Requires NumPy.
+
+        PARAMETERS
+        ----------
+        layers : list
+            Layers to be stored. If not given, named entity, shallow parse, pos tag and dependency layers are stored.
+
+        RETURNS
+        -------
+        ColumnarCorpus
+            Columnar view of the corpus.
+        """
+        from AnnotatedSentence.ColumnarCorpus import ColumnarCorpus
+        return ColumnarCorpus(self, layers)
+
+    @staticmethod
+    def layerStatistics(sentences, layers: list, pairs: list = None):
+        """
+        Counts the values of the given layers in the given sentences. Used by the worker processes of the parallel
+        count. Requires NumPy.
+
+        PARAMETERS
+        ----------
+        sentences
+            Annotated sentences to be counted, visited once.
+        layers : list
+            Counted layers.
+        pairs : list
+            Pairs of layers whose co-occurrences are counted.
+
+        RETURNS
+        -------
+        LayerStatistics
+            Statistics of the sentences.
+        """
+        from AnnotatedSentence.ColumnarCorpus import ColumnarCorpus
+        from AnnotatedSentence.LayerStatistics import LayerStatistics
+        statistics = LayerStatistics(layers, pairs)
+        statistics.addColumnarCorpus(ColumnarCorpus(sentences, layers))
+        return statistics
+
+    def getLayerStatistics(self,
+                           layers: list,
+                           pairs: list = None,
+                           workerCount: int = 1,
+                           chunkSize: int = 1024):
+        """
+        Counts the values of the given layers in a single pass over the corpus: the number of words having each value,
+        the number of words having each value in each sentence, and the number of words having each pair of values of
+        the given pairs of layers. The words are stored in a columnar corpus and counted with array operations.
+        Requires NumPy.
+
+        PARAMETERS
+        ----------
+        layers : list
+            Counted layers. PART_OF_SPEECH is counted as the universal dependency pos of the morphological parse,
+            DEPENDENCY as the dependency label, NER as the named entity type such as PERSON, any other layer as the
+            value returned by getLayerInfo.
+        pairs : list
+            Pairs of layers whose co-occurrences are counted. Both layers of a pair must be in layers.
+        workerCount : int
+            Number of processes counting the sentences. If it is larger than 1, chunks of sentences are counted by the
+            worker processes and their statistics are merged in the original order.
+        chunkSize : int
+            Number of sentences counted by a worker process in one task.
+
+        RETURNS
+        -------
+        LayerStatistics
+            Statistics of the corpus.
+        """
+        if workerCount <= 1:
+            return AbstractAnnotatedCorpus.layerStatistics(self, layers, pairs)
+        from concurrent.futures import ProcessPoolExecutor
+        from AnnotatedSentence.LayerStatistics import LayerStatistics
+        statistics = LayerStatistics(layers, pairs)
+        with ProcessPoolExecutor(max_workers=workerCount) as executor:
+            pending = deque()
+            for chunk in AbstractAnnotatedCorpus.__chunks(self, chunkSize):
+                pending.append(executor.submit(AbstractAnnotatedCorpus.layerStatistics, chunk, layers, pairs))
+                if len(pending) > 2 * workerCount:
+                    statistics.add(pending.popleft().result())
+            while len(pending) > 0:
+                statistics.add(pending.popleft().result())
+        return statistics
+
+    @staticmethod
+    def __sentenceSpans(sentence: AnnotatedSentence, layer: ViewLayerType) -> list:
+        """
+        Returns the shallow parse or named entity spans of the sentence.
+        """
+        if layer == ViewLayerType.SHALLOW_PARSE:
+            return sentence.getShallowParseSpans()
+        elif layer == ViewLayerType.NER:
+            return sentence.getNamedEntitySpans()
+        raise ValueError("Spans are only extracted for SHALLOW_PARSE and NER layers")
+
+    def getSpans(self, layer: ViewLayerType) -> list:
+        """
+        Extracts the shallow parse groups or the named entities of all sentences as spans, in a single pass over the
+        corpus, without creating a phrase for each of them.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            SHALLOW_PARSE for the shallow parse groups, NER for the named entities.
+
+        RETURNS
+        -------
+        list
+            (sentence index, start, end, tag) tuple of each span, where the span consists of the words of the sentence
+            from index start up to but not including index end.
+        """
+        result = []
+        i = 0
+        for sentence in self:
+            if isinstance(sentence, AnnotatedSentence):
+                for start, end, tag in AbstractAnnotatedCorpus.__sentenceSpans(sentence, layer):
+                    result.append((i, start, end, tag))
+            i += 1
+        return result
+
+    def getPhrases(self, layer: ViewLayerType) -> list:
+        """
+        Extracts the shallow parse groups or the named entities of all sentences as phrases.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            SHALLOW_PARSE for the shallow parse groups, NER for the named entities.
+
+        RETURNS
+        -------
+        list
+            List of the AnnotatedPhrase objects of each sentence, in the order of the sentences.
+        """
+        result = []
+        for sentence in self:
+            if isinstance(sentence, AnnotatedSentence):
+                result.append(sentence.getPhrases(AbstractAnnotatedCorpus.__sentenceSpans(sentence, layer)))
+        return result
+
+    def compareParses(self, corpus: AbstractAnnotatedCorpus) -> ParserEvaluationScore:
+        """
+        Compares the corpus with the given corpus and returns a parser evaluation score for this comparison. The result
+        is calculated by summing up the parser evaluation scores of sentence by sentence dependency relation comparisons.
+        Both corpora are visited sentence by sentence, therefore any of them can be a streamed corpus. Sentences are
+        paired by their positions, so both corpora must have the same number of sentences; compareLayers pairs the
+        sentences by their names instead.
+        :param corpus: Corpus to be compared.
+        :return: A parser evaluation score object.
+        :raises ValueError: If the corpora have a different number of sentences.
+        """
+        result = ParserEvaluationScore()
+        missing = object()
+        for sentence1, sentence2 in itertools.zip_longest(self, corpus, fillvalue=missing):
+            if sentence1 is missing or sentence2 is missing:
+                raise ValueError("Compared corpora have a different number of sentences")
+            result.add(sentence1.compareParses(sentence2))
+        return result
+
+    def evaluateParses(self, corpus, lengthBucketSize: int = 10):
+        """
+        Compares the dependency layer of the corpus, taken as the gold standard, with the dependency layer of the given
+        corpus, as compareParses does, but with array operations over columnar views of both corpora. Besides the
+        scores of the whole corpus, the returned report has the scores for each gold dependency label, each gold
+        universal dependency pos and each range of sentence lengths. Both corpora are visited once, therefore any of
+        them can be a streamed corpus. Sentences and words are paired by their positions, so the corpora must have the
+        same number of sentences and corresponding sentences the same number of words. Requires NumPy.
+
+        PARAMETERS
+        ----------
+        corpus
+            Parsed corpus to be evaluated, or any iterable of annotated sentences.
+        lengthBucketSize : int
+            Number of different sentence lengths in a range of sentence lengths.
+
+        RETURNS
+        -------
+        ParserEvaluationReport
+            Scores of the parsed corpus.
+
+        RAISES
+        ------
+        ValueError
+            If the corpora have a different number of sentences, or two corresponding sentences have a different
+            number of words.
+        """
+        from AnnotatedSentence.ColumnarCorpus import ColumnarCorpus
+        from AnnotatedSentence.ParserEvaluationReport import ParserEvaluationReport
+        report = ParserEvaluationReport(lengthBucketSize)
+        report.addColumnarCorpora(ColumnarCorpus(self, [ViewLayerType.DEPENDENCY, ViewLayerType.PART_OF_SPEECH]),
+                                  ColumnarCorpus(corpus, [ViewLayerType.DEPENDENCY]))
+        return report
+
+    def getFolder(self) -> str:
+        """
+        Returns the folder the sentences of the corpus are read from.
+
+        RETURNS
+        -------
+        str
+            Folder of the corpus, None if the sentences are not read from a folder.
+        """
+        return None
+
+    def sentenceName(self, sentence: AnnotatedSentence) -> str:
+        """
+        Returns the name used to match the sentence with the sentence of another corpus: the file name relative to
+        the folder of the corpus, or the file name itself if the corpus is not read from a folder, as for a bundle,
+        whose file names are already relative, or a universal dependency file, whose file names are sentence ids.
+
+        PARAMETERS
+        ----------
+        sentence : AnnotatedSentence
+            Sentence of the corpus.
+
+        RETURNS
+        -------
+        str
+            Name of the sentence, None if the sentence has no file name.
+        """
+        if sentence.getFileName() is None:
+            return None
+        if self.getFolder() is None:
+            return sentence.getFileName()
+        return os.path.relpath(sentence.getFileName(), self.getFolder())
+
+    def compareLayers(self, corpus, layers: list = None) -> CorpusComparison:
+        """
+        Compares the given layers of the sentences of the corpus with the sentences of the given corpus having the same
+        name, where the name of a sentence is given by sentenceName of its corpus, such as train/0001.dev for the
+        sentence file 0001.dev in the train folder of a corpus. The sentences of an iterable which is not an annotated
+        corpus are named by their file names. Unlike compareParses, sentences are matched by name instead of by
+        position, so that corpora read from folders with different contents or in different orders are compared
+        correctly, and the sentences found in only one of them are reported.
+
+        Both corpora are visited once and in turns, and a sentence is kept only until the sentence with the same name
+        is read from the other corpus. Therefore, if both corpora list the common sentences in the same order, as two
+        streams of the same folder structure do, only a few sentences are kept in memory at any time; the names of the
+        visited sentences are kept to detect duplicates. A sentence whose name has already been seen in its own corpus
+        is reported as a duplicate and not compared. Sentences without a file name can not be matched and are reported
+        as missing from the other corpus.
+
+        PARAMETERS
+        ----------
+        corpus
+            Corpus to be compared, or any iterable of annotated sentences such as an AnnotatedCorpusStream.
+        layers : list
+            Layers to be compared. If not given, the dependency layer is compared. When the dependency layer is
+            compared, the parser evaluation score of the second corpus is computed as well.
+
+        RETURNS
+        -------
+        CorpusComparison
+            Result of the comparison.
+        """
+        if layers is None:
+            layers = [ViewLayerType.DEPENDENCY]
+        comparison = CorpusComparison(layers)
+        corpora = [self, corpus]
+        iterators = [iter(self), iter(corpus)]
+        pending = [{}, {}]
+        seen = [set(), set()]
+        active = [True, True]
+        while active[0] or active[1]:
+            for side in range(2):
+                if not active[side]:
+                    continue
+                sentence = next(iterators[side], None)
+                if sentence is None:
+                    active[side] = False
+                    continue
+                if isinstance(corpora[side], AbstractAnnotatedCorpus):
+                    name = corpora[side].sentenceName(sentence)
+                else:
+                    name = sentence.getFileName()
+                if name is None:
+                    comparison.addMissing(name, side == 0)
+                elif name in seen[side]:
+                    comparison.addDuplicate(name, side == 0)
+                elif name in pending[1 - side]:
+                    seen[side].add(name)
+                    other = pending[1 - side].pop(name)
+                    if side == 0:
+                        comparison.addSentences(name, sentence, other)
+                    else:
+                        comparison.addSentences(name, other, sentence)
+                else:
+                    seen[side].add(name)
+                    pending[side][name] = sentence
+        for side in range(2):
+            for name in sorted(pending[side]):
+                comparison.addMissing(name, side == 0)
+        return comparison
+
+    @staticmethod
+    def universalDependencyFormat(sentences: list, path: str = None) -> tuple:
+        """
+        Converts the given sentences into connlu format. Used by the worker processes of the parallel export.
+
+        PARAMETERS
+        ----------
+        sentences : list
+            Annotated sentences to be converted.
+        path : str
+            Current path for the part of the annotated corpus.
+
+        RETURNS
+        -------
+        tuple
+            Connlu format of the sentences, one after another, and the export statistics of the conversion.
+        """
+        parse_cache = AnnotatedWord.getParseCache()
+        hit_count = parse_cache.getColumnHitCount()
+        miss_count = parse_cache.getColumnMissCount()
+        result = []
+        word_count = 0
+        for sentence in sentences:
+            if isinstance(sentence, AnnotatedSentence):
+                result.append(sentence.getUniversalDependencyFormat(path))
+                word_count += sentence.wordCount()
+        return "".join(result), ExportStatistics(len(result),
+                                                 word_count,
+                                                 parse_cache.getColumnHitCount() - hit_count,
+                                                 parse_cache.getColumnMissCount() - miss_count)
+
+    @staticmethod
+    def openOutputFile(outputFileName: str, bufferSize: int = 1 << 20):
+        """
+        Opens the given file for writing UTF-8 text. If the file name ends with .gz, .bz2 or .xz, the output is
+        compressed with gzip, bzip2 or lzma respectively.
+
+        PARAMETERS
+        ----------
+        outputFileName : str
+            Name of the output file.
+        bufferSize : int
+            Size of the write buffer of an uncompressed file in bytes.
+
+        RETURNS
+        -------
+        Text file opened for writing.
+        """
+        if outputFileName.endswith(".gz"):
+            import gzip
+            return gzip.open(outputFileName, "wt", encoding="utf8")
+        elif outputFileName.endswith(".bz2"):
+            import bz2
+            return bz2.open(outputFileName, "wt", encoding="utf8")
+        elif outputFileName.endswith(".xz"):
+            import lzma
+            return lzma.open(outputFileName, "wt", encoding="utf8")
+        return open(outputFileName, "w", encoding="utf8", buffering=bufferSize)
+
+    @staticmethod
+    def openInputFile(inputFileName: str):
+        """
+        Opens the given UTF-8 text file for reading. If the file name ends with .gz, .bz2 or .xz, the file is
+        decompressed with gzip, bzip2 or lzma respectively.
+
+        PARAMETERS
+        ----------
+        inputFileName : str
+            Name of the input file.
+
+        RETURNS
+        -------
+        Text file opened for reading.
+        """
+        if inputFileName.endswith(".gz"):
+            import gzip
+            return gzip.open(inputFileName, "rt", encoding="utf8")
+        elif inputFileName.endswith(".bz2"):
+            import bz2
+            return bz2.open(inputFileName, "rt", encoding="utf8")
+        elif inputFileName.endswith(".xz"):
+            import lzma
+            return lzma.open(inputFileName, "rt", encoding="utf8")
+        return open(inputFileName, "r", encoding="utf8")
+
+    def exportUniversalDependencyFormat(self,
+                                        outputFileName: str,
+                                        path: str = None,
+                                        workerCount: int = 1,
+                                        chunkSize: int = 256):
+        """
+        Exports the annotated corpus as a UD file in connlu format. Every sentence is converted into connlu format and
+        appended to the output file. Multiple paths are possible in the annotated corpus. This method outputs the
+        sentences in the given path. The corpus is visited sentence by sentence, so a streamed corpus is exported
+        without keeping it in memory. The sentences are converted in chunks and each chunk is written to a large
+        buffered UTF-8 file in one call; if the file name ends with .gz, .bz2 or .xz the output is compressed.
+        :param outputFileName: Output file name in connlu format.
+        :param path: Current path for the part of the annotated corpus.
+        :param workerCount: Number of processes converting the chunks. If it is larger than 1, the chunks are sent to
+        the worker processes and written in their original order. Since the sentences are copied to the workers, this
+        pays off for lazily read sentences, which are copied much faster than their object forms.
+        :param chunkSize: Number of sentences converted in one step.
+        :return: Export statistics with the number of sentences and words written and the number of words whose
+        lemma, universal pos and feature columns are taken from the parse cache.
+        """
+        file = AbstractAnnotatedCorpus.openOutputFile(outputFileName)
+        statistics = ExportStatistics()
+        if workerCount > 1:
+            # Imported here, since concurrent.futures.process loads multiprocessing, which is not needed by the
+            # serial export.
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workerCount) as executor:
+                pending = deque()
+                for chunk in AbstractAnnotatedCorpus.__chunks(self, chunkSize):
+                    pending.append(executor.submit(AbstractAnnotatedCorpus.universalDependencyFormat, chunk, path))
+                    if len(pending) > 2 * workerCount:
+                        text, chunk_statistics = pending.popleft().result()
+                        file.write(text)
+                        statistics.add(chunk_statistics)
+                while len(pending) > 0:
+                    text, chunk_statistics = pending.popleft().result()
+                    file.write(text)
+                    statistics.add(chunk_statistics)
+        else:
+            for chunk in AbstractAnnotatedCorpus.__chunks(self, chunkSize):
+                text, chunk_statistics = AbstractAnnotatedCorpus.universalDependencyFormat(chunk, path)
+                file.write(text)
+                statistics.add(chunk_statistics)
+        file.close()
+        return statistics
+
+    @staticmethod
+    def __chunks(sentences, chunkSize: int):
+        """
+        Splits the given sentences into lists of at most chunkSize sentences, visiting them only once.
+        """
+        chunk = []
+        for sentence in sentences:
+            chunk.append(sentence)
+            if len(chunk) == chunkSize:
+                yield chunk
+                chunk = []
+        if len(chunk) > 0:
+            yield chunk
+
+    @staticmethod
+    def coverageReport(sentences: list, layers: list) -> CoverageReport:
+        """
+        Checks the given layers of all words of the given sentences. Used by the worker processes of the parallel
+        check.
+
+        PARAMETERS
+        ----------
+        sentences : list
+            Annotated sentences to be checked.
+        layers : list
+            Layers to be checked.
+
+        RETURNS
+        -------
+        CoverageReport
+            Coverage report of the sentences.
+        """
+        report = CoverageReport(layers)
+        for sentence in sentences:
+            if isinstance(sentence, AnnotatedSentence):
+                report.addSentence(sentence)
+        return report
+
+    def checkCoverage(self,
+                      layers: list = None,
+                      workerCount: int = 1,
+                      chunkSize: int = 256) -> CoverageReport:
+        """
+        Checks the given annotation layers of all words in a single pass over the corpus and returns, for each layer,
+        the positions of the words that do not have it and the coverage ratio of each sentence.
+        :param layers: Layers to be checked. If not given, the morphological analysis, named entity, shallow parse and
+        semantic layers are checked.
+        :param workerCount: Number of processes checking the sentences. If it is larger than 1, chunks of sentences
+        are sent to the worker processes and their reports are joined in the original order.
+        :param chunkSize: Number of sentences checked in one step.
+        :return: Coverage report of the corpus. Sentences are numbered in the order they are visited.
+        """
+        if layers is None:
+            layers = [ViewLayerType.INFLECTIONAL_GROUP, ViewLayerType.NER, ViewLayerType.SHALLOW_PARSE,
+                      ViewLayerType.SEMANTICS]
+        report = CoverageReport(layers)
+        if workerCount > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workerCount) as executor:
+                pending = deque()
+                for chunk in AbstractAnnotatedCorpus.__chunks(self, chunkSize):
+                    pending.append(executor.submit(AbstractAnnotatedCorpus.coverageReport, chunk, layers))
+                    if len(pending) > 2 * workerCount:
+                        report.add(pending.popleft().result())
+                while len(pending) > 0:
+                    report.add(pending.popleft().result())
+        else:
+            for sentence in self:
+                if isinstance(sentence, AnnotatedSentence):
+                    report.addSentence(sentence)
+        return report
+
+    def checkDependencyTrees(self) -> dict:
+        """
+        Checks the dependency trees of all sentences in a single pass over the corpus, in time linear in the number of
+        words, and returns the sentences having each kind of problem.
+
+        RETURNS
+        -------
+        dict
+            Indexes of the sentences, in the order they are visited, for each of the problems "missingHeads" (words
+            without a dependency relation), "outOfRangeHeads", "noRoot", "multipleRoots", "cycles" and
+            "nonProjective".
+        """
+        result = {"missingHeads": [], "outOfRangeHeads": [], "noRoot": [], "multipleRoots": [], "cycles": [],
+                  "nonProjective": []}
+        i = 0
+        for sentence in self:
+            if isinstance(sentence, AnnotatedSentence):
+                tree = sentence.getDependencyTree()
+                if tree.missingHeadCount() > 0:
+                    result["missingHeads"].append(i)
+                if tree.outOfRangeHeadCount() > 0:
+                    result["outOfRangeHeads"].append(i)
+                if tree.rootCount() == 0:
+                    result["noRoot"].append(i)
+                elif tree.rootCount() > 1:
+                    result["multipleRoots"].append(i)
+                if tree.hasCycle():
+                    result["cycles"].append(i)
+                if not tree.isProjective():
+                    result["nonProjective"].append(i)
+            i += 1
+        return result
+
+    def __printIncompleteSentences(self, layer: ViewLayerType, message: str):
+        """
+        Prints the given message followed by the file name of each sentence having words without the given layer.
+        """
+        report = self.checkCoverage([layer])
+        file_names = report.getFileNames()
+        for i in report.getIncompleteSentences(layer):
+            print(f"{message}{file_names[i]}")
+
+    def checkMorphologicalAnalysis(self):
+        """
+        The method traverses all words in all sentences and prints the words which do not have a morphological analysis.
+        """
+        self.__printIncompleteSentences(ViewLayerType.INFLECTIONAL_GROUP,
+                                        "Morphological Analysis does not exist for sentence ")
+
+    def checkNer(self):
+        """
+        The method traverses all words in all sentences and prints the words which do not have named entity annotation.
+        """
+        self.__printIncompleteSentences(ViewLayerType.NER, "NER annotation does not exist for sentence ")
+
+    def checkShallowParse(self):
+        """
+        The method traverses all words in all sentences and prints the words which do not have shallow parse annotation.
+        """
+        self.__printIncompleteSentences(ViewLayerType.SHALLOW_PARSE,
+                                        "Shallow parse annotation does not exist for sentence ")
+
+    def checkSemantic(self):
+        """
+        The method traverses all words in all sentences and prints the words which do not have sense annotation.
+        """
+        self.__printIncompleteSentences(ViewLayerType.SEMANTICS, "Semantic annotation does not exist for sentence ")
@@ -1,20 +1,34 @@
 from __future__ import annotations
 
+import hashlib
 import os
-import re
+import pickle
 
 from Corpus.Corpus import Corpus
 
+from AnnotatedSentence.AbstractAnnotatedCorpus import AbstractAnnotatedCorpus
 from AnnotatedSentence.AnnotatedSentence import AnnotatedSentence
-from AnnotatedSentence.AnnotatedWord import AnnotatedWord
-from DependencyParser.ParserEvaluationScore import ParserEvaluationScore
+from AnnotatedSentence.LayerIndex import LayerIndex
+from AnnotatedSentence.LayerValuePool import LayerValuePool
+from AnnotatedSentence.ViewLayerType import ViewLayerType
 
 
-class AnnotatedCorpus(Corpus):
+class AnnotatedCorpus(Corpus, AbstractAnnotatedCorpus):
+
+    __layer_index: LayerIndex
+    __folder: str
+
+    snapshot_version = 6
 
     def __init__(self,
-                 folder: str,
-                 pattern: str = None):
+                 folder: str = None,
+                 pattern: str = None,
+                 lazy: bool = False,
+                 workerCount: int = 1,
+                 chunkSize: int = 64,
+                 pool: LayerValuePool = None,
+                 snapshotFileName: str = None,
+                 useContentHash: bool = False):
         """
         A constructor of AnnotatedCorpus class which reads all AnnotatedSentence files with the file
         name satisfying the given pattern inside the given folder. For each file inside that folder, the constructor
@@ -26,99 +40,289 @@ class AnnotatedCorpus(Corpus):
             Folder where all sentences reside.
         pattern : str
             File pattern such as "." ".train" ".test".
+        lazy : bool
+            If True, object valued annotation layers of the words are converted only when they are first accessed.
+            Useful for jobs that read only a few of the layers.
+        workerCount : int
+            Number of processes reading the files. If it is larger than 1, the files are split into chunks and each
+            chunk is read by one of the worker processes. Sentences are stored in the same order as in the serial
+            read.
+        chunkSize : int
+            Number of files read by a worker process in one task.
+        pool : LayerValuePool
+            If given, equal layer values of all words in the corpus are stored once, as the copy kept in the pool. The
+            same pool can be shared by several corpora.
+        snapshotFileName : str
+            If given, the parsed sentences are also kept in this snapshot file. When the corpus is read again, the
+            sentences of the files that have not changed since the snapshot was written are taken from the snapshot,
+            only the changed and new files are read, and the snapshot is updated. The changed files are read with
+            workerCount and chunkSize as without a snapshot, and lazy and pool are applied to all sentences.
+        useContentHash : bool
+            If True, a file is considered unchanged when its content hash is equal to the one in the snapshot,
+            otherwise when its size and modification time are equal.
         """
         self.sentences = []
-        for root, dirs, files in os.walk(folder):
-            for file in files:
-                file_name = os.path.join(root, file)
-                if (pattern is None or pattern in file_name) and re.match("\\d+\\.", file):
-                    f = open(file_name, "r", encoding='utf8')
-                    sentence = AnnotatedSentence(f, file_name)
-                    self.sentences.append(sentence)
-
-    def compareParses(self, corpus: AnnotatedCorpus) -> ParserEvaluationScore:
-        """
-        Compares the corpus with the given corpus and returns a parser evaluation score for this comparison. The result
-        is calculated by summing up the parser evaluation scores of sentence by sentence dependency relation comparisons.
-        :param corpus: Corpus to be compared.
-        :return: A parser evaluation score object.
-        """
-        result = ParserEvaluationScore()
+        self.__layer_index = None
+        self.__folder = folder
+        if folder is None:
+            return
+        file_names = AbstractAnnotatedCorpus.sentenceFileNames(folder, pattern)
+        if snapshotFileName is not None:
+            self.sentences = AnnotatedCorpus.__readSentencesWithSnapshot(file_names, snapshotFileName, useContentHash,
+                                                                         workerCount, chunkSize)
+        elif workerCount > 1 and len(file_names) > chunkSize:
+            self.sentences = AnnotatedCorpus.__readSentencesInParallel(file_names, workerCount, chunkSize)
+        else:
+            self.sentences = AnnotatedCorpus.readSentences(file_names, lazy, pool)
+            return
+        # Sentences read by the worker processes or kept in the snapshot are in lazy mode without a pool; they are
+        # converted to the requested mode here.
+        if not lazy or pool is not None:
+            for sentence in self.sentences:
+                for word in sentence.words:
+                    if pool is not None:
+                        word.internLayers(pool)
+                    if not lazy:
+                        word.decodeLayers()
+
+    @staticmethod
+    def __fileSignature(fileName: str, useContentHash: bool) -> tuple:
+        """
+        Returns the signature of a file used to decide whether it has changed since the snapshot was written.
+        """
+        if useContentHash:
+            file = open(fileName, "rb")
+            digest = hashlib.blake2b(file.read(), digest_size=16).digest()
+            file.close()
+            return (digest,)
+        status = os.stat(fileName)
+        return status.st_size, status.st_mtime_ns
+
+    @staticmethod
+    def __readSentencesInParallel(fileNames: list,
+                                  workerCount: int,
+                                  chunkSize: int) -> list:
+        """
+        Reads the sentences in the given files in lazy mode, with the files split into chunks that are read by the
+        worker processes. Sentences are returned in the order of the files.
+        """
+        # Imported here, since concurrent.futures.process loads multiprocessing, which is not needed by the serial
+        # read.
+        from concurrent.futures import ProcessPoolExecutor
+        sentences = []
+        chunks = [fileNames[i:i + chunkSize] for i in range(0, len(fileNames), chunkSize)]
+        with ProcessPoolExecutor(max_workers=workerCount) as executor:
+            for chunk_sentences in executor.map(AnnotatedCorpus.readSentences, chunks):
+                sentences.extend(chunk_sentences)
+        return sentences
+
+    @staticmethod
+    def __readSentencesWithSnapshot(fileNames: list,
+                                    snapshotFileName: str,
+                                    useContentHash: bool,
+                                    workerCount: int,
+                                    chunkSize: int) -> list:
+        """
+        Reads the sentences in the given files using the snapshot file. Sentences of the unchanged files are taken
+        from the snapshot, other files are read in lazy mode, by the worker processes if there are more than chunkSize
+        of them and workerCount is larger than 1. If any file has changed, has been added or removed, the snapshot is
+        rewritten; a snapshot that can not be read is rebuilt. Sentences are kept in the snapshot in lazy mode, since
+        lazily kept layers are loaded much faster than their object forms.
+        """
+        entries = {}
+        if os.path.exists(snapshotFileName):
+            try:
+                with open(snapshotFileName, "rb") as snapshot_file:
+                    header, entries = pickle.load(snapshot_file)
+                if header != (AnnotatedCorpus.snapshot_version, useContentHash) or not isinstance(entries, dict):
+                    entries = {}
+            except (pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError, ImportError):
+                entries = {}
+        signatures = [AnnotatedCorpus.__fileSignature(file_name, useContentHash) for file_name in fileNames]
+        changed_file_names = []
+        for file_name, signature in zip(fileNames, signatures):
+            entry = entries.get(file_name)
+            # Entries of a corrupt snapshot that are not (signature, sentence) pairs are read again.
+            if not isinstance(entry, tuple) or len(entry) != 2 or entry[0] != signature:
+                changed_file_names.append(file_name)
+        if workerCount > 1 and len(changed_file_names) > chunkSize:
+            changed_sentences = AnnotatedCorpus.__readSentencesInParallel(changed_file_names, workerCount, chunkSize)
+        else:
+            changed_sentences = AnnotatedCorpus.readSentences(changed_file_names)
+        read_sentences = dict(zip(changed_file_names, changed_sentences))
+        sentences = []
+        new_entries = {}
+        for file_name, signature in zip(fileNames, signatures):
+            sentence = read_sentences[file_name] if file_name in read_sentences else entries[file_name][1]
+            new_entries[file_name] = (signature, sentence)
+            sentences.append(sentence)
+        if len(changed_file_names) > 0 or len(entries) != len(fileNames):
+            AnnotatedSentence.writeFileAtomically(snapshotFileName, lambda snapshot_file: pickle.dump(
+                ((AnnotatedCorpus.snapshot_version, useContentHash), new_entries), snapshot_file,
+                protocol=pickle.HIGHEST_PROTOCOL), binary=True)
+        return sentences
+
+    @staticmethod
+    def readSentences(fileNames: list,
+                      lazy: bool = True,
+                      pool: LayerValuePool = None) -> list:
+        """
+        Reads the annotated sentences in the given files. Used by the worker processes of the parallel read, where
+        the words are kept in lazy mode, since lazily kept layers are transferred to the parent process much faster
+        than their object forms.
+
+        PARAMETERS
+        ----------
+        fileNames : list
+            Names of the sentence files.
+        lazy : bool
+            If True, object valued annotation layers of the words are converted only when they are first accessed.
+        pool : LayerValuePool
+            If given, equal layer values of the words are stored once, as the copy kept in the pool.
+
+        RETURNS
+        -------
+        list
+            Annotated sentences read from the files.
+        """
+        sentences = []
+        for file_name in fileNames:
+            f = open(file_name, "r", encoding='utf8')
+            sentences.append(AnnotatedSentence(f, file_name, lazy, pool))
+        return sentences
+
+    def __iter__(self):
+        """
+        Iterates over the sentences of the corpus in order.
+        """
+        return iter(self.sentences)
+
+    def getFolder(self) -> str:
+        """
+        Returns the folder the sentences of the corpus are read from.
+
+        RETURNS
+        -------
+        str
+            Folder of the corpus, None if the corpus is not read from a folder.
+        """
+        return self.__folder
+
+    def save(self):
+        """
+        Saves all sentences of the corpus to the files they are read from. Words that have not been modified since
+        they were last written are not converted to string again. Only a corpus kept in memory can be saved, since
+        the sentences of a streamed corpus or a bundle are read again each time they are visited.
+        """
+        for sentence in self.sentences:
+            sentence.save()
+
+    def saveModified(self) -> list:
+        """
+        Saves only the sentences that have been modified since they were read or last saved, each to the file it is
+        read from. Every file is written to a temporary file first, which then replaces the file, so that an
+        interrupted save never leaves a partially written sentence behind.
+
+        RETURNS
+        -------
+        list
+            Names of the files written.
+        """
+        file_names = []
+        for sentence in self.sentences:
+            if sentence.isModified():
+                sentence.save(atomic=True)
+                file_names.append(sentence.getFileName())
+        return file_names
+
+    def createLayerIndex(self, layers: list = None) -> LayerIndex:
+        """
+        Builds an index from the values of the given annotation layers to the positions of the words having them, in
+        one pass over the sentences. The index is kept up to date while the words are modified with their setters.
+        If the corpus already has an index, it is replaced. Sentences added to or removed from the corpus after the
+        index is built are not seen by it, in that case the index should be created again.
+
+        PARAMETERS
+        ----------
+        layers : list
+            Layers to be indexed. If not given, all layers are indexed.
+
+        RETURNS
+        -------
+        LayerIndex
+            Index of the layer values.
+        """
+        if self.__layer_index is not None:
+            self.__layer_index.close()
+        self.__layer_index = LayerIndex(self.sentences, layers)
+        return self.__layer_index
+
+    def getLayerIndex(self) -> LayerIndex:
+        """
+        Returns the layer index of the corpus.
+
+        RETURNS
+        -------
+        LayerIndex
+            Layer index created with createLayerIndex, None if there is no index.
+        """
+        return self.__layer_index
+
+    def updateConnectedPredicates(self, idMap: dict) -> list:
+        """
+        Replaces the predicate ids in the propbank and framenet layers of all words with the ids they are mapped to,
+        as calling updateConnectedPredicate of every sentence for each id would do, but with all ids replaced at
+        once. Only the words having one of the previous ids as a predicate are visited: they are found with the
+        layer index of the corpus if it covers both layers, otherwise with an index built for this call.
+
+        PARAMETERS
+        ----------
+        idMap : dict
+            Maps previous ids of synsets to their replacement ids.
+
+        RETURNS
+        -------
+        list
+            Modified sentences in the order of the corpus, which can then be saved.
+        """
+        index = self.__layer_index
+        if index is None or ViewLayerType.PROPBANK not in index.getLayers() \
+                or ViewLayerType.FRAMENET not in index.getLayers():
+            index = LayerIndex(self.sentences, [ViewLayerType.PROPBANK, ViewLayerType.FRAMENET], listen=False)
+        positions = set()
+        for layer in [ViewLayerType.PROPBANK, ViewLayerType.FRAMENET]:
+            for value in index.getValues(layer):
+                if value.startswith("PREDICATE$") and value[value.rfind("$") + 1:] in idMap:
+                    positions.update(index.lookup(layer, value))
+        modified = {}
+        for i, j in positions:
+            if self.sentences[i].words[j].updateConnectedPredicates(idMap):
+                modified[i] = self.sentences[i]
+        return [modified[i] for i in sorted(modified)]
+
+    def findWords(self, layer: ViewLayerType, value: str) -> list:
+        """
+        Returns the positions of the words whose given layer has the given value. If the corpus has a layer index
+        covering the layer, the positions are taken from the index, otherwise all words are visited.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Layer to be searched.
+        value : str
+            Value of the layer, as kept by LayerIndex.
+
+        RETURNS
+        -------
+        list
+            Sorted list of (sentence index, word index) pairs.
+        """
+        if self.__layer_index is not None and layer in self.__layer_index.getLayers():
+            return self.__layer_index.lookup(layer, value)
+        result = []
         for i in range(len(self.sentences)):
-            sentence1 = self.sentences[i]
-            sentence2 = corpus.getSentence(i)
-            result.add(sentence1.compareParses(sentence2))
+            words = self.sentences[i].words
+            for j in range(len(words)):
+                if value in LayerIndex.layerValues(words[j], layer):
+                    result.append((i, j))
         return result
-
-    def exportUniversalDependencyFormat(self,
-                                        outputFileName: str,
-                                        path: str = None):
-        """
-        Exports the annotated corpus as a UD file in connlu format. Every sentence is converted into connlu format and
-        appended to the output file. Multiple paths are possible in the annotated corpus. This method outputs the
-        sentences in the given path.
-        :param outputFileName: Output file name in connlu format.
-        :param path: Current path for the part of the annotated corpus.
-        """
-        file = open(outputFileName, "w")
-        for i in range(self.sentenceCount()):
-            sentence = self.getSentence(i)
-            if isinstance(sentence, AnnotatedSentence):
-                file.write(sentence.getUniversalDependencyFormat(path))
-        file.close()
-
-    def checkMorphologicalAnalysis(self):
-        """
-        The method traverses all words in all sentences and prints the words which do not have a morphological analysis.
-        """
-        for i in range(self.sentenceCount()):
-            sentence = self.getSentence(i)
-            if isinstance(sentence, AnnotatedSentence):
-                for j in range(sentence.wordCount()):
-                    word = sentence.getWord(j)
-                    if isinstance(word, AnnotatedWord):
-                        if word.getParse() is None:
-                            print("Morphological Analysis does not exist for sentence " + sentence.getFileName())
-                            break
-
-    def checkNer(self):
-        """
-        The method traverses all words in all sentences and prints the words which do not have named entity annotation.
-        """
-        for i in range(self.sentenceCount()):
-            sentence = self.getSentence(i)
-            if isinstance(sentence, AnnotatedSentence):
-                for j in range(sentence.wordCount()):
-                    word = sentence.getWord(j)
-                    if isinstance(word, AnnotatedWord):
-                        if word.getNamedEntityType() is None:
-                            print("NER annotation does not exist for sentence " + sentence.getFileName())
-                            break
-
-    def checkShallowParse(self):
-        """
-        The method traverses all words in all sentences and prints the words which do not have shallow parse annotation.
-        """
-        for i in range(self.sentenceCount()):
-            sentence = self.getSentence(i)
-            if isinstance(sentence, AnnotatedSentence):
-                for j in range(sentence.wordCount()):
-                    word = sentence.getWord(j)
-                    if isinstance(word, AnnotatedWord):
-                        if word.getShallowParse() is None:
-                            print("Shallow parse annotation does not exist for sentence " + sentence.getFileName())
-                            break
-
-    def checkSemantic(self):
-        """
-        The method traverses all words in all sentences and prints the words which do not have sense annotation.
-        """
-        for i in range(self.sentenceCount()):
-            sentence = self.getSentence(i)
-            if isinstance(sentence, AnnotatedSentence):
-                for j in range(sentence.wordCount()):
-                    word = sentence.getWord(j)
-                    if isinstance(word, AnnotatedWord):
-                        if word.getSemantic() is None:
-                            print("Semantic annotation does not exist for sentence " + sentence.getFileName())
-                            break
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import mmap
+import os
+from array import array
+
+from AnnotatedSentence.AbstractAnnotatedCorpus import AbstractAnnotatedCorpus
+from AnnotatedSentence.AnnotatedSentence import AnnotatedSentence
+
+
+class AnnotatedCorpusBundle(AbstractAnnotatedCorpus):
+
+    __file_names: list
+    __name_indexes: dict
+    __offsets: array
+    __data: mmap.mmap
+    __lazy: bool
+    __sentence_index: int
+
+    def __init__(self,
+                 bundleFileName: str,
+                 lazy: bool = False):
+        """
+        Constructor for AnnotatedCorpusBundle. A bundle keeps all sentences of an annotated corpus in one data file,
+        one sentence per line, together with an index file that stores the name of each sentence file and the byte
+        offset of its line. The data file is memory mapped when the first sentence is read, so any sentence can be read
+        without reading the others. The mapping is released with close, or at the end of a with block.
+
+        PARAMETERS
+        ----------
+        bundleFileName : str
+            Name of the data file of the bundle. The index file has the same name with the extension .index.
+        lazy : bool
+            If True, object valued annotation layers of the words are converted only when they are first accessed.
+        """
+        self.file_name = bundleFileName
+        self.__lazy = lazy
+        self.__sentence_index = 0
+        self.__file_names = []
+        self.__name_indexes = {}
+        self.__offsets = array('q')
+        index_file = open(bundleFileName + ".index", "r", encoding='utf8')
+        for line in index_file:
+            items = line.rstrip("\n").split("\t")
+            self.__name_indexes[items[0]] = len(self.__file_names)
+            self.__file_names.append(items[0])
+            self.__offsets.append(int(items[1]))
+        index_file.close()
+        self.__data = None
+        self.__offsets.append(os.path.getsize(bundleFileName))
+
+    def __mapDataFile(self):
+        """
+        Memory maps the data file of the bundle.
+        """
+        with open(self.file_name, "rb") as data_file:
+            self.__data = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @staticmethod
+    def createBundle(folder: str,
+                     bundleFileName: str,
+                     pattern: str = None):
+        """
+        Converts the sentence files inside the given folder into a bundle. The line of each sentence file is copied to
+        the data file as it is, therefore a sentence read from the bundle is identical to the sentence read from its
+        file. The names of the sentence files are stored relative to the folder.
+
+        PARAMETERS
+        ----------
+        folder : str
+            Folder where all sentences reside.
+        bundleFileName : str
+            Name of the data file of the bundle. The index file has the same name with the extension .index.
+        pattern : str
+            File pattern such as "." ".train" ".test".
+        """
+        data_file = open(bundleFileName, "wb")
+        index_file = open(bundleFileName + ".index", "w", encoding='utf8')
+        offset = 0
+        for file_name in AbstractAnnotatedCorpus.sentenceFileNames(folder, pattern):
+            input_file = open(file_name, "r", encoding='utf8')
+            line = (input_file.readline().rstrip() + "\n").encode('utf8')
+            input_file.close()
+            data_file.write(line)
+            index_file.write(os.path.relpath(file_name, folder) + "\t" + str(offset) + "\n")
+            offset += len(line)
+        data_file.close()
+        index_file.close()
+
+    def sentenceCount(self) -> int:
+        """
+        Returns the number of sentences in the bundle.
+
+        RETURNS
+        -------
+        int
+            Number of sentences in the bundle.
+        """
+        return len(self.__file_names)
+
+    def getSentenceLine(self, index: int) -> str:
+        """
+        Returns the line of the sentence at the given index as it is stored in the data file.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the sentence.
+
+        RETURNS
+        -------
+        str
+            Line of the sentence without the new line character.
+        """
+        if self.__data is None:
+            self.__mapDataFile()
+        return self.__data[self.__offsets[index]:self.__offsets[index + 1] - 1].decode('utf8')
+
+    def getSentence(self, index: int) -> AnnotatedSentence:
+        """
+        Reads the sentence at the given index from the data file.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the sentence.
+
+        RETURNS
+        -------
+        AnnotatedSentence
+            Sentence at the given index.
+        """
+        return AnnotatedSentence(self.getSentenceLine(index), self.__file_names[index], self.__lazy)
+
+    def getSentenceWithName(self, fileName: str) -> AnnotatedSentence:
+        """
+        Reads the sentence of the given sentence file from the data file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the sentence file relative to the folder the bundle is created from.
+
+        RETURNS
+        -------
+        AnnotatedSentence
+            Sentence of the given file, None if the bundle does not contain the file.
+        """
+        if fileName in self.__name_indexes:
+            return self.getSentence(self.__name_indexes[fileName])
+        return None
+
+    def getFileNames(self) -> list:
+        """
+        Returns the names of the sentence files in the bundle in the order they are stored.
+
+        RETURNS
+        -------
+        list
+            Names of the sentence files.
+        """
+        return self.__file_names
+
+    def open(self):
+        """
+        Implements open method in AbstractCorpus. Initializes sentence pointer to zero.
+        """
+        self.__sentence_index = 0
+
+    def close(self):
+        """
+        Implements close method in AbstractCorpus. Initializes sentence pointer to zero and unmaps the data file, so
+        that the file can be replaced or removed. The data file is mapped again when a sentence is read afterwards.
+        Also called at the end of a with block using the bundle.
+        """
+        self.__sentence_index = 0
+        if self.__data is not None:
+            self.__data.close()
+            self.__data = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def getNextSentence(self) -> AnnotatedSentence:
+        """
+        Implements getNextSentence method in AbstractCorpus. Returns the next sentence in the bundle and increments
+        the sentence pointer. If there are no sentences to be read, returns None.
+        :return: Next sentence in the bundle or None.
+        """
+        if self.__sentence_index < len(self.__file_names):
+            self.__sentence_index = self.__sentence_index + 1
+            return self.getSentence(self.__sentence_index - 1)
+        else:
+            return None
+
+    def __iter__(self):
+        """
+        Iterates over the sentences of the bundle in the order they are stored.
+        """
+        for i in range(len(self.__file_names)):
+            yield self.getSentence(i)
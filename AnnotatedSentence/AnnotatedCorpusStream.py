@@ -0,0 +1,83 @@
+from AnnotatedSentence.AbstractAnnotatedCorpus import AbstractAnnotatedCorpus
+from AnnotatedSentence.AnnotatedSentence import AnnotatedSentence
+
+
+class AnnotatedCorpusStream(AbstractAnnotatedCorpus):
+
+    __folder: str
+    __pattern: str
+    __lazy: bool
+    __file_names: list
+    __file_index: int
+
+    def __init__(self,
+                 folder: str,
+                 pattern: str = None,
+                 lazy: bool = False):
+        """
+        Constructor for AnnotatedCorpusStream. AnnotatedCorpusStream is used for processing annotated corpora that do
+        not fit in memory as a whole. The sentence files inside the folder are selected as in AnnotatedCorpus, but
+        each sentence is read only when it is requested and is not kept afterwards.
+
+        PARAMETERS
+        ----------
+        folder : str
+            Folder where all sentences reside.
+        pattern : str
+            File pattern such as "." ".train" ".test".
+        lazy : bool
+            If True, object valued annotation layers of the words are converted only when they are first accessed.
+        """
+        self.file_name = folder
+        self.__folder = folder
+        self.__pattern = pattern
+        self.__lazy = lazy
+        self.__file_names = []
+        self.__file_index = 0
+
+    def getFolder(self) -> str:
+        """
+        Returns the folder the sentences of the stream are read from.
+
+        RETURNS
+        -------
+        str
+            Folder of the stream.
+        """
+        return self.__folder
+
+    def open(self):
+        """
+        Implements open method in AbstractCorpus. Collects the names of the sentence files and initializes the file
+        pointer to zero.
+        """
+        self.__file_names = AbstractAnnotatedCorpus.sentenceFileNames(self.__folder, self.__pattern)
+        self.__file_index = 0
+
+    def close(self):
+        """
+        Implements close method in AbstractCorpus. Releases the file names and initializes the file pointer to zero.
+        """
+        self.__file_names = []
+        self.__file_index = 0
+
+    def getNextSentence(self) -> AnnotatedSentence:
+        """
+        Implements getNextSentence method in AbstractCorpus. Reads the next sentence file and returns its sentence. If
+        there are no sentences to be read, returns None.
+        :return: Next read sentence or None.
+        """
+        if self.__file_index < len(self.__file_names):
+            file_name = self.__file_names[self.__file_index]
+            self.__file_index = self.__file_index + 1
+            return AnnotatedSentence(open(file_name, "r", encoding='utf8'), file_name, self.__lazy)
+        else:
+            return None
+
+    def __iter__(self):
+        """
+        Iterates over the sentences of the corpus, reading one sentence file at each step. Independent of the open,
+        getNextSentence and close methods, so that the same stream can be iterated more than once at the same time.
+        """
+        for file_name in AbstractAnnotatedCorpus.sentenceFileNames(self.__folder, self.__pattern):
+            yield AnnotatedSentence(open(file_name, "r", encoding='utf8'), file_name, self.__lazy)
@@ -3,6 +3,8 @@ from Corpus.Sentence import Sentence
 
 class AnnotatedPhrase(Sentence):
 
+    __slots__ = ("__word_index", "__tag")
+
     __word_index: int
     __tag: str
 
@@ -1,24 +1,46 @@
 from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+from array import array
 from io import TextIOWrapper
+from typing import TYPE_CHECKING
 
 from Corpus.Sentence import Sentence
 from DependencyParser.ParserEvaluationScore import ParserEvaluationScore
-from FrameNet.FrameNet import FrameNet
-from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
-from PropBank.FramesetList import FramesetList
-from WordNet.WordNet import WordNet
+from NamedEntityRecognition.NamedEntityType import NamedEntityType
 
 from AnnotatedSentence.AnnotatedPhrase import AnnotatedPhrase
 from AnnotatedSentence.AnnotatedWord import AnnotatedWord
+from AnnotatedSentence.AnnotatedWordParser import AnnotatedWordParser
+from AnnotatedSentence.DependencyTree import DependencyTree
+from AnnotatedSentence.LayerValuePool import LayerValuePool
+
+if TYPE_CHECKING:
+    # FrameNet, WordNet, PropBank and the morphological analyzer load their resources through pkg_resources, which
+    # dominates the import time of the package. They are only passed in by the callers, so they are imported for
+    # type checking only.
+    from FrameNet.FrameNet import FrameNet
+    from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+    from PropBank.FramesetList import FramesetList
+    from WordNet.WordNet import WordNet
 
 
 class AnnotatedSentence(Sentence):
 
+    __slots__ = ("__file_name", "__modified", "__listener", "__dependency_tree")
+
     __file_name: str
+    __modified: bool
+    __listener: object
+    __dependency_tree: DependencyTree
 
     def __init__(self,
                  fileOrStr=None,
-                 fileName=None):
+                 fileName=None,
+                 lazy: bool = False,
+                 pool: LayerValuePool = None):
         """
         Converts a simple sentence to an annotated sentence
 
@@ -26,21 +48,99 @@ class AnnotatedSentence(Sentence):
         ----------
         fileOrStr
             Simple sentence
+        fileName : str
+            Name of the file the sentence is read from.
+        lazy : bool
+            If True, object valued annotation layers of the words are converted only when they are first accessed.
+        pool : LayerValuePool
+            If given, equal layer values of the words are stored once, as the copy kept in the pool.
         """
         self.words = []
-        word_array = []
+        self.__file_name = fileName
+        self.__modified = False
+        self.__listener = None
+        self.__dependency_tree = None
         if fileOrStr is not None:
-            if fileName is not None:
-                self.__file_name = fileName
+            line = ""
             if isinstance(fileOrStr, TextIOWrapper):
-                line = fileOrStr.readline()
+                line = fileOrStr.readline().rstrip()
                 fileOrStr.close()
-                word_array = line.rstrip().split(" ")
             elif isinstance(fileOrStr, str):
-                word_array = fileOrStr.split(" ")
-            for word in word_array:
-                if len(word) > 0:
-                    self.words.append(AnnotatedWord(word))
+                line = fileOrStr
+            for layers in AnnotatedWordParser.splitSentence(line):
+                self.words.append(AnnotatedWord(layers, lazy=lazy, pool=pool))
+
+    def getShallowParseSpans(self) -> list:
+        """
+        Returns the shallow parse groups of the sentence as spans, without creating a phrase for each group. A group
+        consists of consecutive words with the same shallow parse tag; a word following a word without a shallow parse
+        tag is put in the group of that word.
+
+        RETURNS
+        -------
+        list
+            (start, end, tag) tuple of each group, where the group consists of the words from index start up to but
+            not including index end, and tag is the shallow parse tag of its first word.
+        """
+        spans = []
+        start = 0
+        previous_tag = None
+        for i in range(len(self.words)):
+            tag = self.words[i].getShallowParse()
+            if i > 0 and previous_tag is not None and previous_tag != tag:
+                spans.append((start, i, self.words[start].getShallowParse()))
+                start = i
+            previous_tag = tag
+        if len(self.words) > 0:
+            spans.append((start, len(self.words), self.words[start].getShallowParse()))
+        return spans
+
+    def getNamedEntitySpans(self) -> list:
+        """
+        Returns the named entities of the sentence as spans. A named entity consists of consecutive words with the
+        same named entity tag other than NONE, so consecutive named entities of the same type form one span.
+
+        RETURNS
+        -------
+        list
+            (start, end, tag) tuple of each named entity, where the entity consists of the words from index start up
+            to but not including index end, and tag is its named entity tag such as PERSON.
+        """
+        spans = []
+        start = 0
+        previous_tag = None
+        for i in range(len(self.words) + 1):
+            tag = self.words[i].getNamedEntityType() if i < len(self.words) else None
+            if tag == NamedEntityType.NONE:
+                tag = None
+            if tag != previous_tag:
+                if previous_tag is not None:
+                    spans.append((start, i, NamedEntityType.getNamedEntityString(previous_tag)))
+                start = i
+                previous_tag = tag
+        return spans
+
+    def getPhrases(self, spans: list) -> list:
+        """
+        Creates the phrases of the given spans of the sentence.
+
+        PARAMETERS
+        ----------
+        spans : list
+            (start, end, tag) tuples as returned by getShallowParseSpans or getNamedEntitySpans.
+
+        RETURNS
+        -------
+        list
+            AnnotatedPhrase of each span, containing the words of the span.
+        """
+        phrases = []
+        for start, end, tag in spans:
+            phrase = AnnotatedPhrase(start, tag)
+            for i in range(start, end):
+                phrase.addWord(self.words[i])
+            phrases.append(phrase)
+        return phrases
 
     def getShallowParseGroups(self) -> list:
         """
@@ -51,23 +151,9 @@ class AnnotatedSentence(Sentence):
         list
             Shallow parse groups of a sentence.
         """
-        shallow_parse_groups = []
-        previous_word = None
-        current = None
-        for i in range(self.wordCount()):
-            word = self.getWord(i)
-            if isinstance(word, AnnotatedWord):
-                if previous_word is None:
-                    current = AnnotatedPhrase(i, word.getShallowParse())
-                else:
-                    if isinstance(previous_word, AnnotatedWord) and previous_word.getShallowParse() is not None \
-                            and previous_word.getShallowParse() != word.getShallowParse():
-                        shallow_parse_groups.append(current)
-                        current = AnnotatedPhrase(i, word.getShallowParse())
-                current.addWord(word)
-                previous_word = word
-        shallow_parse_groups.append(current)
-        return shallow_parse_groups
+        if len(self.words) == 0:
+            return [None]
+        return self.getPhrases(self.getShallowParseSpans())
 
     def containsPredicate(self) -> bool:
         """
@@ -116,16 +202,30 @@ class AnnotatedSentence(Sentence):
         modified = False
         for word in self.words:
             if isinstance(word, AnnotatedWord):
-                argument_list = word.getArgumentList()
-                if argument_list is not None:
-                    if argument_list.containsPredicateWithId(previousId):
-                        argument_list.updateConnectedId(previousId, currentId)
-                        modified = True
-                frame_element_list = word.getFrameElementList()
-                if frame_element_list is not None:
-                    if frame_element_list.containsPredicateWithId(previousId):
-                        frame_element_list.updateConnectedId(previousId, currentId)
-                        modified = True
+                if word.updateConnectedPredicate(previousId, currentId):
+                    modified = True
+        return modified
+
+    def updateConnectedPredicates(self, idMap: dict) -> bool:
+        """
+        Replaces the predicate ids of the words with the ids they are mapped to, as updateConnectedPredicate does for
+        a single id. All ids are replaced at once.
+
+        PARAMETERS
+        ----------
+        idMap : dict
+            Maps previous ids of synsets to their replacement ids.
+
+        RETURNS
+        -------
+        bool
+            True if any replacement has been done, False otherwise.
+        """
+        modified = False
+        for word in self.words:
+            if isinstance(word, AnnotatedWord):
+                if word.updateConnectedPredicates(idMap):
+                    modified = True
         return modified
 
     def predicateCandidates(self, framesetList: FramesetList) -> list:
@@ -254,6 +354,163 @@ class AnnotatedSentence(Sentence):
             Word index
         """
         self.words.pop(index)
+        self.__setModified()
+
+    def addWord(self, word: AnnotatedWord):
+        """
+        Adds the given word to the end of the sentence.
+
+        PARAMETERS
+        ----------
+        word : AnnotatedWord
+            Word to be added.
+        """
+        self.words.append(word)
+        self.__setModified(word)
+
+    def insertWord(self, i: int, newWord: AnnotatedWord):
+        """
+        Inserts the given word at the given index of the sentence.
+
+        PARAMETERS
+        ----------
+        i : int
+            Index where the word is inserted.
+        newWord : AnnotatedWord
+            Word to be inserted.
+        """
+        self.words.insert(i, newWord)
+        self.__setModified(newWord)
+
+    def replaceWord(self, i: int, newWord: AnnotatedWord):
+        """
+        Replaces the word at the given index of the sentence with the given word.
+
+        PARAMETERS
+        ----------
+        i : int
+            Index of the word to be replaced.
+        newWord : AnnotatedWord
+            New word.
+        """
+        self.words[i] = newWord
+        self.__setModified(newWord)
+
+    def __setModified(self, newWord: AnnotatedWord = None):
+        """
+        Marks the sentence as modified after its words are added, removed or replaced, drops its dependency tree,
+        connects the new word to the sentence and notifies the listener of the sentence.
+        """
+        self.__modified = True
+        self.__dependency_tree = None
+        if isinstance(newWord, AnnotatedWord):
+            newWord.setListener(self)
+        if self.__listener is not None:
+            self.__listener.sentenceModified(self)
+
+    def __getstate__(self):
+        """
+        Returns the state of the sentence for pickling without its listener and its dependency tree, so that copying
+        the sentence to a worker process or to a snapshot does not copy the index listening to it.
+        """
+        slots = {}
+        for name in AnnotatedSentence.__slots__:
+            attribute = "_AnnotatedSentence" + name
+            if hasattr(self, attribute):
+                slots[attribute] = getattr(self, attribute)
+        slots["_AnnotatedSentence__listener"] = None
+        slots["_AnnotatedSentence__dependency_tree"] = None
+        return self.__dict__.copy(), slots
+
+    def setListener(self, listener):
+        """
+        Sets the object notified after the sentence or one of its words is modified. The listener's wordModified
+        method is called with the sentence and the index of a modified word, its sentenceModified method with the
+        sentence after words are added, removed or replaced. The sentence becomes the listener of its words.
+
+        PARAMETERS
+        ----------
+        listener
+            Object with wordModified and sentenceModified methods, such as a LayerIndex, None to stop notifications.
+        """
+        self.__listener = listener
+        for word in self.words:
+            if isinstance(word, AnnotatedWord):
+                word.setListener(self)
+
+    def getListener(self):
+        """
+        Returns the object notified after the sentence or one of its words is modified.
+
+        RETURNS
+        -------
+        Listener of the sentence, None if there is no listener.
+        """
+        return self.__listener
+
+    def wordModified(self, word: AnnotatedWord):
+        """
+        Called by a word of the sentence after it is modified. Drops the dependency tree of the sentence and notifies
+        the listener of the sentence with the index of the word.
+
+        PARAMETERS
+        ----------
+        word : AnnotatedWord
+            Modified word.
+        """
+        self.__dependency_tree = None
+        if self.__listener is not None:
+            for i in range(len(self.words)):
+                if self.words[i] is word:
+                    self.__listener.wordModified(self, i)
+                    return
+
+    def getDependencyTree(self) -> DependencyTree:
+        """
+        Returns the dependency tree of the sentence, built from the heads of the universal dependency relations of its
+        words. The tree is kept until a word is modified with one of its setters, such as setUniversalDependency, or
+        words are added, removed or replaced. A relation modified through the object returned by
+        getUniversalDependency is not seen by the sentence.
+
+        RETURNS
+        -------
+        DependencyTree
+            Dependency tree of the sentence.
+        """
+        if self.__dependency_tree is None:
+            heads = array('i')
+            for word in self.words:
+                relation = word.getUniversalDependency()
+                heads.append(-1 if relation is None else relation.to())
+                word.setListener(self)
+            self.__dependency_tree = DependencyTree(heads)
+        return self.__dependency_tree
+
+    def isModified(self) -> bool:
+        """
+        Checks if the sentence has been modified since it was read or last saved, either by adding, removing or
+        replacing its words, or by modifying any of its words.
+
+        RETURNS
+        -------
+        bool
+            True if the sentence has been modified, False otherwise.
+        """
+        if self.__modified:
+            return True
+        for word in self.words:
+            if isinstance(word, AnnotatedWord) and word.isModified():
+                return True
+        return False
+
+    def clearModified(self):
+        """
+        Marks the sentence and all its words as not modified, as done after the sentence is saved.
+        """
+        self.__modified = False
+        for word in self.words:
+            if isinstance(word, AnnotatedWord):
+                word.clearModified()
 
     def toStems(self) -> str:
         """
@@ -296,11 +553,71 @@ class AnnotatedSentence(Sentence):
                 score.add(relation1.compareRelations(relation2))
         return score
 
-    def save(self):
+    def __str__(self) -> str:
+        """
+        Returns the words of the sentence in string form, separated by spaces.
+
+        RETURNS
+        -------
+        str
+            String form of the sentence.
+        """
+        return " ".join([word.__str__() for word in self.words])
+
+    @staticmethod
+    def writeFileAtomically(fileName: str, write, binary: bool = False):
         """
-        Saves the current sentence.
+        Writes a file by writing a new temporary file in the same folder and replacing the file with it, so that the
+        file never contains partially written content. The temporary file has a unique name, so that concurrent
+        writers of the same file do not overwrite each other's temporary files, and it is removed if writing fails.
+        The file keeps its permissions; a new file gets the default permissions of the process.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            File to be written.
+        write
+            Function writing the content to the file object it is given.
+        binary : bool
+            If True, the file is opened in binary mode, otherwise as a UTF-8 text file.
+        """
+        handle, temporary_file_name = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(fileName)),
+                                                       prefix=os.path.basename(fileName) + ".", suffix=".tmp")
+        try:
+            with open(handle, "wb") if binary else open(handle, "w", encoding="utf8") as out_file:
+                write(out_file)
+            if os.path.exists(fileName):
+                shutil.copymode(fileName, temporary_file_name)
+            else:
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(temporary_file_name, 0o666 & ~umask)
+            os.replace(temporary_file_name, fileName)
+        except BaseException:
+            os.remove(temporary_file_name)
+            raise
+
+    def save(self, fileName: str = None, atomic: bool = False):
         """
-        self.writeToFile(self.__file_name)
+        Saves the current sentence and marks it as not modified.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            File the sentence is written to. If not given, the sentence is written to the file it is read from.
+        atomic : bool
+            If True, the sentence is written with writeFileAtomically, so that the file never contains a partially
+            written sentence.
+        """
+        if fileName is None:
+            fileName = self.__file_name
+        if atomic:
+            AnnotatedSentence.writeFileAtomically(fileName, lambda out_file: out_file.write(self.__str__() + "\n"))
+        else:
+            out_file = open(fileName, "w", encoding="utf8")
+            out_file.write(self.__str__() + "\n")
+            out_file.close()
+        self.clearModified()
 
     def getUniversalDependencyFormat(self, path: str = None) -> str:
         """
@@ -309,15 +626,16 @@ class AnnotatedSentence(Sentence):
         :return: The connlu format of the sentence with appended prefix string based on the path.
         """
         if path is None:
-            result = "# sent_id = " + self.getFileName() + "\n" + "# text = " + self.toString() + "\n"
-        else:
-            result = "# sent_id = " + path + self.getFileName() + "\n" + "# text = " + self.toString() + "\n"
-        for i in range(self.wordCount()):
-            word = self.getWord(i)
+            path = ""
+        words = [word.getName() for word in self.words]
+        result = ["# sent_id = " + path + self.getFileName() + "\n" + "# text = " + " ".join(words) + "\n"]
+        word_count = self.wordCount()
+        for i in range(word_count):
+            word = self.words[i]
             if isinstance(word, AnnotatedWord):
-                result += str(i + 1) + "\t" + word.getUniversalDependencyFormat(self.wordCount()) + "\n"
-        result += "\n"
-        return result
+                result.append(str(i + 1) + "\t" + word.getUniversalDependencyFormat(word_count) + "\n")
+        result.append("\n")
+        return "".join(result)
 
     def constructLiterals(self, wordNet: WordNet, fsm: FsmMorphologicalAnalyzer, wordIndex: int) -> list:
         """
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from Corpus.WordFormat import WordFormat
 from DependencyParser.Universal.UniversalDependencyRelation import UniversalDependencyRelation
 from Dictionary.Word import Word
@@ -6,18 +10,21 @@ from MorphologicalAnalysis.FsmParse import FsmParse
 from MorphologicalAnalysis.MetamorphicParse import MetamorphicParse
 from MorphologicalAnalysis.MorphologicalParse import MorphologicalParse
 from MorphologicalAnalysis.MorphologicalTag import MorphologicalTag
-from NamedEntityRecognition.Gazetteer import Gazetteer
 from NamedEntityRecognition.NamedEntityType import NamedEntityType
 from NamedEntityRecognition.Slot import Slot
 from PropBank.Argument import Argument
 from PropBank.ArgumentList import ArgumentList
 from SentiNet.PolarityType import PolarityType
 
-import re
-
+from AnnotatedSentence.AnnotatedWordParser import AnnotatedWordParser
 from AnnotatedSentence.LanguageType import LanguageType
+from AnnotatedSentence.LayerValuePool import LayerValuePool
+from AnnotatedSentence.ParseCache import ParseCache
 from AnnotatedSentence.ViewLayerType import ViewLayerType
 
+if TYPE_CHECKING:
+    from NamedEntityRecognition.Gazetteer import Gazetteer
+
 
 class AnnotatedWord(Word):
     """
@@ -31,6 +38,11 @@ class AnnotatedWord(Word):
      * 7. Update getLayerInfo.
      * 8. Add getter and setter methods.
     """
+    __slots__ = ("__parse", "__metamorphic_parse", "__semantic", "__named_entity_type", "__argument_list",
+                 "__frame_element_list", "__shallow_parse", "__universal_dependency", "__slot", "__polarity", "__ccg",
+                 "__pos_tag", "__language", "__unparsed_layers", "__parse_string", "__serialized",
+                 "__serialized_name", "__layers_exposed", "__modified", "__listener")
+
     __parse: MorphologicalParse
     __metamorphic_parse: MetamorphicParse
     __semantic: str
@@ -44,10 +56,41 @@ class AnnotatedWord(Word):
     __ccg: str
     __pos_tag: str
     __language: LanguageType
+    __unparsed_layers: dict
+    __parse_string: str
+    __serialized: str
+    __serialized_name: str
+    __layers_exposed: bool
+    __modified: bool
+    __listener: object
+
+    lazy_layers = {"morphologicalAnalysis": "morphologicalAnalysis",
+                   "metaMorphemes": "metaMorphemes",
+                   "propbank": "propbank",
+                   "propBank": "propbank",
+                   "framenet": "framenet",
+                   "frameNet": "framenet",
+                   "slot": "slot",
+                   "universalDependency": "universalDependency"}
+
+    parse_cache = ParseCache()
+
+    lazy_view_layers = {ViewLayerType.INFLECTIONAL_GROUP: "morphologicalAnalysis",
+                        ViewLayerType.META_MORPHEME: "metaMorphemes",
+                        ViewLayerType.PROPBANK: "propbank",
+                        ViewLayerType.FRAMENET: "framenet",
+                        ViewLayerType.SLOT: "slot",
+                        ViewLayerType.DEPENDENCY: "universalDependency"}
+
+    language_prefixes = {LanguageType.TURKISH: "{turkish=",
+                         LanguageType.ENGLISH: "{english=",
+                         LanguageType.PERSIAN: "{persian="}
 
     def __init__(self,
                  word: str,
-                 layerType=None):
+                 layerType=None,
+                 lazy: bool = False,
+                 pool: LayerValuePool = None):
         """
         Constructor for the AnnotatedWord class. Gets the word with its annotation layers as input and sets the
         corresponding layers.
@@ -55,7 +98,14 @@ class AnnotatedWord(Word):
         PARAMETERS
         ----------
         word : str
-            Input word with annotation layers
+            Input word with annotation layers. Can also be the list of (name, value) tuples of the layers as returned
+            by AnnotatedWordParser.
+        lazy : bool
+            If True, the morphological, metamorphic, propbank, framenet, slot and universal dependency layers are
+            kept in string form and converted to their objects only when they are first accessed.
+        pool : LayerValuePool
+            If given, the layer values are replaced with their pooled copies, so that equal values of different words
+            are stored once.
         """
         self.__parse = None
         self.__metamorphic_parse = None
@@ -70,44 +120,27 @@ class AnnotatedWord(Word):
         self.__ccg = None
         self.__pos_tag = None
         self.__language = LanguageType.TURKISH
+        self.__unparsed_layers = None
+        self.__parse_string = None
+        self.__serialized = None
+        self.__serialized_name = None
+        self.__layers_exposed = False
+        self.__listener = None
         if layerType is None:
-            split_layers = re.compile("[{}]").split(word)
-            for layer in split_layers:
-                if len(layer) == 0:
-                    continue
-                if "=" not in layer:
-                    self.name = layer
-                    continue
-                layerType = layer[:layer.index("=")]
-                layer_value = layer[layer.index("=") + 1:]
-                if layerType == "turkish" or layerType == "english" or layerType == "persian":
+            if isinstance(word, str):
+                word = AnnotatedWordParser.splitLayers(word)
+            layer_readers = AnnotatedWord.__layer_readers
+            for layer_name, layer_value in word:
+                if pool is not None:
+                    layer_value = pool.intern(layer_value)
+                if layer_name is None:
                     self.name = layer_value
-                    self.__language = AnnotatedWord.getLanguageFromString(layerType)
-                elif layerType == "morphologicalAnalysis":
-                    self.__parse = MorphologicalParse(layer_value)
-                elif layerType == "metaMorphemes":
-                    self.__metamorphic_parse = MetamorphicParse(layer_value)
-                elif layerType == "namedEntity":
-                    self.__named_entity_type = NamedEntityType.getNamedEntityType(layer_value)
-                elif layerType == "propbank" or layerType == "propBank":
-                    self.__argument_list = ArgumentList(layer_value)
-                elif layerType == "framenet" or layerType == "frameNet":
-                    self.__frame_element_list = FrameElementList(layer_value)
-                elif layerType == "shallowParse":
-                    self.__shallow_parse = layer_value
-                elif layerType == "semantics":
-                    self.__semantic = layer_value
-                elif layerType == "slot":
-                    self.__slot = Slot(layer_value)
-                elif layerType == "polarity":
-                    self.setPolarity(layer_value)
-                elif layerType == "universalDependency":
-                    values = layer_value.split("$")
-                    self.__universal_dependency = UniversalDependencyRelation(int(values[0]), values[1])
-                elif layerType == "ccg":
-                    self.__ccg = layer_value
-                elif layerType == "posTag":
-                    self.__pos_tag = layer_value
+                elif lazy and layer_name in AnnotatedWord.lazy_layers:
+                    if self.__unparsed_layers is None:
+                        self.__unparsed_layers = {}
+                    self.__unparsed_layers[AnnotatedWord.lazy_layers[layer_name]] = layer_value
+                elif layer_name in layer_readers:
+                    layer_readers[layer_name](self, layer_name, layer_value)
         elif isinstance(layerType, NamedEntityType):
             super().__init__(word)
             self.__named_entity_type = layerType
@@ -120,50 +153,416 @@ class AnnotatedWord(Word):
             self.__parse = layerType
             self.__named_entity_type = NamedEntityType.NONE
             self.setMetamorphicParse(layerType.withList())
+        self.__modified = False
+
+    def __readLanguage(self, layerName: str, layerValue: str):
+        """
+        Sets the surface form and the language of the word from a turkish, english or persian layer.
+        """
+        self.name = layerValue
+        self.__language = AnnotatedWord.getLanguageFromString(layerName)
+
+    def __readMorphologicalAnalysis(self, layerName: str, layerValue: str):
+        """
+        Sets the morphological parse layer from its string form.
+        """
+        self.__parse, self.__parse_string = AnnotatedWord.parse_cache.getParseAndString(layerValue)
+
+    def __readMetaMorphemes(self, layerName: str, layerValue: str):
+        """
+        Sets the metamorphic parse layer from its string form. Unlike the morphological parse, the metamorphic parse
+        is not taken from the parse cache, since it can be modified in place through getMetamorphicParse.
+        """
+        self.__metamorphic_parse = MetamorphicParse(layerValue)
+
+    def __readNamedEntity(self, layerName: str, layerValue: str):
+        """
+        Sets the named entity layer from its string form.
+        """
+        self.__named_entity_type = NamedEntityType.getNamedEntityType(layerValue)
+
+    def __readPropbank(self, layerName: str, layerValue: str):
+        """
+        Sets the propbank layer from its string form.
+        """
+        self.__argument_list = ArgumentList(layerValue)
+
+    def __readFramenet(self, layerName: str, layerValue: str):
+        """
+        Sets the framenet layer from its string form.
+        """
+        self.__frame_element_list = FrameElementList(layerValue)
+
+    def __readShallowParse(self, layerName: str, layerValue: str):
+        """
+        Sets the shallow parse layer.
+        """
+        self.__shallow_parse = layerValue
+
+    def __readSemantics(self, layerName: str, layerValue: str):
+        """
+        Sets the semantic layer.
+        """
+        self.__semantic = layerValue
+
+    def __readSlot(self, layerName: str, layerValue: str):
+        """
+        Sets the slot layer from its string form.
+        """
+        self.__slot = Slot(layerValue)
+
+    def __readPolarity(self, layerName: str, layerValue: str):
+        """
+        Sets the polarity layer from its string form.
+        """
+        self.setPolarity(layerValue)
+
+    def __readUniversalDependency(self, layerName: str, layerValue: str):
+        """
+        Sets the universal dependency layer from its to$type string form.
+        """
+        values = layerValue.split("$")
+        self.__universal_dependency = UniversalDependencyRelation(int(values[0]), values[1])
+
+    def __readCcg(self, layerName: str, layerValue: str):
+        """
+        Sets the ccg layer.
+        """
+        self.__ccg = layerValue
+
+    def __readPosTag(self, layerName: str, layerValue: str):
+        """
+        Sets the posTag layer.
+        """
+        self.__pos_tag = layerValue
+
+    __layer_readers = {"turkish": __readLanguage,
+                       "english": __readLanguage,
+                       "persian": __readLanguage,
+                       "morphologicalAnalysis": __readMorphologicalAnalysis,
+                       "metaMorphemes": __readMetaMorphemes,
+                       "namedEntity": __readNamedEntity,
+                       "propbank": __readPropbank,
+                       "propBank": __readPropbank,
+                       "framenet": __readFramenet,
+                       "frameNet": __readFramenet,
+                       "shallowParse": __readShallowParse,
+                       "semantics": __readSemantics,
+                       "slot": __readSlot,
+                       "polarity": __readPolarity,
+                       "universalDependency": __readUniversalDependency,
+                       "ccg": __readCcg,
+                       "posTag": __readPosTag}
+
+    def __decodeLayer(self, layerName: str):
+        """
+        Converts the string value of a lazily kept layer to its object form and stores it in the corresponding
+        attribute. Does nothing if the layer has already been converted or does not exist.
+
+        PARAMETERS
+        ----------
+        layerName : str
+            Name of the layer as given in the word format, such as morphologicalAnalysis or propbank.
+        """
+        if layerName not in self.__unparsed_layers:
+            return
+        layer_value = self.__unparsed_layers.pop(layerName)
+        if len(self.__unparsed_layers) == 0:
+            self.__unparsed_layers = None
+        AnnotatedWord.__layer_readers[layerName](self, layerName, layer_value)
+
+    def decodeLayers(self):
+        """
+        Converts all lazily kept layers of the word to their object forms. After this call the word behaves as if it
+        has been constructed in eager mode.
+        """
+        if self.__unparsed_layers is not None:
+            for layer_name in list(self.__unparsed_layers):
+                self.__decodeLayer(layer_name)
+
+    def __discardLayer(self, layerName: str):
+        """
+        Removes the string value of a lazily kept layer, so that a newly set value is not overwritten when the layer
+        is accessed.
+
+        PARAMETERS
+        ----------
+        layerName : str
+            Name of the layer as given in the word format, such as morphologicalAnalysis or propbank.
+        """
+        if self.__unparsed_layers is not None:
+            self.__unparsed_layers.pop(layerName, None)
+            if len(self.__unparsed_layers) == 0:
+                self.__unparsed_layers = None
+
+    def internLayers(self, pool: LayerValuePool):
+        """
+        Replaces the string valued layers of the word, and the layers kept in lazy string form, with their pooled
+        copies.
+
+        PARAMETERS
+        ----------
+        pool : LayerValuePool
+            Pool keeping one copy of each distinct layer value.
+        """
+        self.name = pool.intern(self.name)
+        self.__semantic = pool.intern(self.__semantic)
+        self.__shallow_parse = pool.intern(self.__shallow_parse)
+        self.__ccg = pool.intern(self.__ccg)
+        self.__pos_tag = pool.intern(self.__pos_tag)
+        if self.__unparsed_layers is not None:
+            for layer_name in self.__unparsed_layers:
+                self.__unparsed_layers[layer_name] = pool.intern(self.__unparsed_layers[layer_name])
+
+    def isDecoded(self) -> bool:
+        """
+        Checks if all annotation layers of the word have been converted to their object forms.
+
+        RETURNS
+        -------
+        bool
+            True if no layer is kept in lazy string form, False otherwise.
+        """
+        return self.__unparsed_layers is None
+
+    def isModified(self) -> bool:
+        """
+        Checks if the word has been modified since it was read or last saved. A word is modified by its setters and
+        by updateConnectedPredicate; changes made directly on the objects returned by the getters are not tracked.
+
+        RETURNS
+        -------
+        bool
+            True if the word has been modified, False otherwise.
+        """
+        return self.__modified
+
+    def clearModified(self):
+        """
+        Marks the word as not modified, as done after the word is saved.
+        """
+        self.__modified = False
+
+    def __setModified(self):
+        """
+        Marks the word as modified after one of its layers has changed, drops its kept string form and notifies the
+        listener of the word.
+        """
+        self.__serialized = None
+        self.__modified = True
+        if self.__listener is not None:
+            self.__listener.wordModified(self)
+
+    def __getstate__(self):
+        """
+        Returns the state of the word for pickling without its listener, so that copying the word to a worker
+        process or to a snapshot does not copy the index listening to it.
+        """
+        slots = {}
+        for name in AnnotatedWord.__slots__:
+            attribute = "_AnnotatedWord" + name
+            if hasattr(self, attribute):
+                slots[attribute] = getattr(self, attribute)
+        slots["_AnnotatedWord__listener"] = None
+        return self.__dict__.copy(), slots
+
+    def setListener(self, listener):
+        """
+        Sets the object notified after the word is modified. The listener's wordModified method is called with the
+        word, as done by an AnnotatedSentence to keep a LayerIndex up to date.
+
+        PARAMETERS
+        ----------
+        listener
+            Object with a wordModified method, None to stop notifications.
+        """
+        self.__listener = listener
+
+    def setName(self, name: str):
+        """
+        Sets the surface form of the word.
+
+        PARAMETERS
+        ----------
+        name : str
+            New surface form of the word.
+        """
+        super().setName(name)
+        self.__setModified()
+
+    def updateConnectedPredicate(self,
+                                 previousId: str,
+                                 currentId: str) -> bool:
+        """
+        Replaces the predicate id previousId with currentId in the propbank and framenet layers of the word.
+
+        PARAMETERS
+        ----------
+        previousId : str
+            Previous id of the synset.
+        currentId : str
+            Replacement id.
+
+        RETURNS
+        -------
+        bool
+            True if any replacement has been done, False otherwise.
+        """
+        modified = False
+        if self.__unparsed_layers is not None:
+            self.__decodeLayer("propbank")
+        if self.__unparsed_layers is not None:
+            self.__decodeLayer("framenet")
+        argument_list = self.__argument_list
+        if argument_list is not None and argument_list.containsPredicateWithId(previousId):
+            argument_list.updateConnectedId(previousId, currentId)
+            modified = True
+        frame_element_list = self.__frame_element_list
+        if frame_element_list is not None and frame_element_list.containsPredicateWithId(previousId):
+            frame_element_list.updateConnectedId(previousId, currentId)
+            modified = True
+        if modified:
+            self.__setModified()
+        return modified
+
+    @staticmethod
+    def __updatePredicateIds(layer: str, idMap: dict) -> str:
+        """
+        Replaces the ids of the arguments or frame elements in the given propbank or framenet layer, which are mapped
+        in idMap and are the id of a predicate in the same layer. Returns None if nothing is replaced.
+        """
+        items = layer.split("#")
+        predicate_ids = set()
+        for item in items:
+            if item.startswith("PREDICATE$"):
+                item_id = item[item.rfind("$") + 1:]
+                if item_id in idMap:
+                    predicate_ids.add(item_id)
+        if len(predicate_ids) == 0:
+            return None
+        for i in range(len(items)):
+            index = items[i].rfind("$")
+            if index != -1 and items[i][index + 1:] in predicate_ids:
+                items[i] = items[i][:index + 1] + idMap[items[i][index + 1:]]
+        return "#".join(items)
+
+    def updateConnectedPredicates(self, idMap: dict) -> bool:
+        """
+        Replaces the predicate ids in the propbank and framenet layers of the word with the ids they are mapped to,
+        as updateConnectedPredicate does for a single id. All ids are replaced at once, so an id is replaced at most
+        once even if it is mapped to an id which is mapped as well.
+
+        PARAMETERS
+        ----------
+        idMap : dict
+            Maps previous ids of synsets to their replacement ids.
+
+        RETURNS
+        -------
+        bool
+            True if any replacement has been done, False otherwise.
+        """
+        modified = False
+        argument_list = self.getLayerInfo(ViewLayerType.PROPBANK)
+        if argument_list is not None:
+            argument_list = AnnotatedWord.__updatePredicateIds(argument_list, idMap)
+            if argument_list is not None:
+                self.setArgumentList(argument_list)
+                modified = True
+        frame_element_list = self.getLayerInfo(ViewLayerType.FRAMENET)
+        if frame_element_list is not None:
+            frame_element_list = AnnotatedWord.__updatePredicateIds(frame_element_list, idMap)
+            if frame_element_list is not None:
+                self.setFrameElementList(frame_element_list)
+                modified = True
+        return modified
 
     def __str__(self) -> str:
         """
         Converts an AnnotatedWord to string. For each annotation layer, the method puts a left brace, layer name,
-        equal sign and layer value finishing with right brace.
+        equal sign and layer value finishing with right brace. The string is kept until the word is modified through
+        one of its setters. Once one of its modifiable layers, the argument list, the frame element list or the
+        metamorphic parse, is requested with its getter, the string is no longer kept, since the returned object may be
+        modified in place.
 
         RETURNS
         -------
         str
             String form of the AnnotatedWord.
         """
-        result = ""
-        if self.__language == LanguageType.TURKISH:
-            result = "{turkish=" + self.name + "}"
-        elif self.__language == LanguageType.ENGLISH:
-            result = "{english=" + self.name + "}"
-        elif self.__language == LanguageType.PERSIAN:
-            result = "{persian=" + self.name + "}"
+        if self.__serialized is not None and self.__serialized_name is self.name:
+            return self.__serialized
+        self.decodeLayers()
+        result = []
+        if self.__language in AnnotatedWord.language_prefixes:
+            result.append(AnnotatedWord.language_prefixes[self.__language])
+            result.append(self.name)
+            result.append("}")
         if self.__parse is not None:
-            result = result + "{morphologicalAnalysis=" + self.__parse.__str__() + "}"
+            result.append("{morphologicalAnalysis=")
+            result.append(self.__parseString())
+            result.append("}")
         if self.__metamorphic_parse is not None:
-            result = result + "{metaMorphemes=" + self.__metamorphic_parse.__str__() + "}"
+            result.append("{metaMorphemes=")
+            result.append(self.__metamorphic_parse.__str__())
+            result.append("}")
         if self.__semantic is not None:
-            result = result + "{semantics=" + self.__semantic + "}"
+            result.append("{semantics=")
+            result.append(self.__semantic)
+            result.append("}")
         if self.__named_entity_type is not None:
-            result = result + "{namedEntity=" + NamedEntityType.getNamedEntityString(self.__named_entity_type) + "}"
+            result.append("{namedEntity=")
+            result.append(NamedEntityType.getNamedEntityString(self.__named_entity_type))
+            result.append("}")
         if self.__argument_list is not None:
-            result = result + "{propbank=" + self.__argument_list.__str__() + "}"
+            result.append("{propbank=")
+            result.append(self.__argument_list.__str__())
+            result.append("}")
         if self.__frame_element_list is not None:
-            result = result + "{framenet=" + self.__frame_element_list.__str__() + "}"
+            result.append("{framenet=")
+            result.append(self.__frame_element_list.__str__())
+            result.append("}")
         if self.__slot is not None:
-            result = result + "{slot=" + self.__slot.__str__() + "}"
+            result.append("{slot=")
+            result.append(self.__slot.__str__())
+            result.append("}")
         if self.__shallow_parse is not None:
-            result = result + "{shallowParse=" + self.__shallow_parse + "}"
+            result.append("{shallowParse=")
+            result.append(self.__shallow_parse)
+            result.append("}")
         if self.__polarity is not None:
-            result = result + "{polarity=" + self.getPolarityString() + "}"
+            result.append("{polarity=")
+            result.append(self.getPolarityString())
+            result.append("}")
         if self.__universal_dependency is not None:
-            result = result + "{universalDependency=" + self.__universal_dependency.to().__str__() + "$" + \
-                     self.__universal_dependency.__str__() + "}"
+            result.append("{universalDependency=")
+            result.append(self.__universal_dependency.to().__str__())
+            result.append("$")
+            result.append(self.__universal_dependency.__str__())
+            result.append("}")
         if self.__ccg is not None:
-            result = result + "{ccg=" + self.__ccg + "}"
+            result.append("{ccg=")
+            result.append(self.__ccg)
+            result.append("}")
         if self.__pos_tag is not None:
-            result = result + "{posTag=" + self.__pos_tag + "}"
-        return result
+            result.append("{posTag=")
+            result.append(self.__pos_tag)
+            result.append("}")
+        if self.__layers_exposed:
+            # A metamorphic parse, argument list or frame element list returned by its getter may be modified in
+            # place later, which the word is not notified of, so the string can not be kept.
+            return "".join(result)
+        self.__serialized = "".join(result)
+        self.__serialized_name = self.name
+        return self.__serialized
+
+    def __parseString(self) -> str:
+        """
+        Returns the string form of the morphological parse, taking it from the parse cache when possible.
+        """
+        if self.__parse_string is not None:
+            return self.__parse_string
+        return self.__parse.__str__()
 
     def getLayerInfo(self, viewLayerType: ViewLayerType) -> str:
         """
@@ -179,9 +578,11 @@ class AnnotatedWord(Word):
         str
             The value of the given layer.
         """
+        if self.__unparsed_layers is not None and viewLayerType in AnnotatedWord.lazy_view_layers:
+            self.__decodeLayer(AnnotatedWord.lazy_view_layers[viewLayerType])
         if viewLayerType == ViewLayerType.INFLECTIONAL_GROUP:
             if self.__parse is not None:
-                return self.__parse.__str__()
+                return self.__parseString()
         elif viewLayerType == ViewLayerType.META_MORPHEME:
             if self.__metamorphic_parse is not None:
                 return self.__metamorphic_parse.__str__()
@@ -216,15 +617,39 @@ class AnnotatedWord(Word):
         else:
             return None
 
+    def getLayerString(self, viewLayerType: ViewLayerType) -> str:
+        """
+        Returns the value of a given layer in string form, as getLayerInfo does, but without converting a lazily kept
+        layer to its object form: such a layer is returned as it is read from the file.
+
+        PARAMETERS
+        ----------
+        viewLayerType : ViewLayerType
+            Layer for which the value questioned.
+
+        RETURNS
+        -------
+        str
+            The value of the given layer.
+        """
+        if self.__unparsed_layers is not None and viewLayerType in AnnotatedWord.lazy_view_layers:
+            layer_value = self.__unparsed_layers.get(AnnotatedWord.lazy_view_layers[viewLayerType])
+            if layer_value is not None:
+                return layer_value
+        return self.getLayerInfo(viewLayerType)
+
     def getParse(self) -> MorphologicalParse:
         """
-        Returns the morphological parse layer of the word.
+        Returns the morphological parse layer of the word. The parse is shared through the parse cache with the other
+        words having the same analysis; it has no methods modifying it, and setParse replaces it.
 
         RETURNS
         -------
         MorphologicalParse
             The morphological parse of the word.
         """
+        if self.__unparsed_layers is not None:
+            self.__decodeLayer("morphologicalAnalysis")
         return self.__parse
 
     def setParse(self, parseString: MorphologicalParse):
@@ -236,10 +661,15 @@ class AnnotatedWord(Word):
         parseString : str
             The new morphological parse of the word in string form.
         """
-        if parseString is not None:
+        self.__discardLayer("morphologicalAnalysis")
+        self.__parse_string = None
+        if isinstance(parseString, str):
+            self.__parse, self.__parse_string = AnnotatedWord.parse_cache.getParseAndString(parseString)
+        elif parseString is not None:
             self.__parse = MorphologicalParse(parseString)
         else:
             self.__parse = None
+        self.__setModified()
 
     def getMetamorphicParse(self) -> MetamorphicParse:
         """
@@ -250,6 +680,10 @@ class AnnotatedWord(Word):
         MetamorphicParse
             The metamorphic parse of the word.
         """
+        if self.__unparsed_layers is not None:
+            self.__decodeLayer("metaMorphemes")
+        self.__serialized = None
+        self.__layers_exposed = True
         return self.__metamorphic_parse
 
     def setMetamorphicParse(self, parseString: str):
@@ -261,7 +695,9 @@ class AnnotatedWord(Word):
         parseString : str
             The new metamorphic parse of the word in string form.
         """
+        self.__discardLayer("metaMorphemes")
         self.__metamorphic_parse = MetamorphicParse(parseString)
+        self.__setModified()
 
     def getSemantic(self) -> str:
         """
@@ -284,6 +720,7 @@ class AnnotatedWord(Word):
             New sense id of the word.
         """
         self.__semantic = semantic
+        self.__setModified()
 
     def getNamedEntityType(self) -> NamedEntityType:
         """
@@ -309,6 +746,7 @@ class AnnotatedWord(Word):
             self.__named_entity_type = NamedEntityType.getNamedEntityType(namedEntity)
         else:
             self.__named_entity_type = None
+        self.__setModified()
 
     def getArgumentList(self) -> ArgumentList:
         """
@@ -319,6 +757,10 @@ class AnnotatedWord(Word):
         ArgumentList
             Semantic role tag of the word.
         """
+        if self.__unparsed_layers is not None:
+            self.__decodeLayer("propbank")
+        self.__serialized = None
+        self.__layers_exposed = True
         return self.__argument_list
 
     def setArgumentList(self, argumentList: str):
@@ -330,10 +772,12 @@ class AnnotatedWord(Word):
         argumentList : Argument
             New semantic role tag of the word.
         """
+        self.__discardLayer("propbank")
         if argumentList is not None:
             self.__argument_list = ArgumentList(argumentList)
         else:
             self.__argument_list = None
+        self.__setModified()
 
     def getFrameElementList(self) -> FrameElementList:
         """
@@ -344,6 +788,10 @@ class AnnotatedWord(Word):
         FrameElementList
             Framenet tag of the word.
         """
+        if self.__unparsed_layers is not None:
+            self.__decodeLayer("framenet")
+        self.__serialized = None
+        self.__layers_exposed = True
         return self.__frame_element_list
 
     def setFrameElementList(self, frameElementList: str):
@@ -355,10 +803,12 @@ class AnnotatedWord(Word):
         frameElementList : str
             New framenet tag of the word.
         """
+        self.__discardLayer("framenet")
         if frameElementList is not None:
             self.__frame_element_list = FrameElementList(frameElementList)
         else:
             self.__frame_element_list = None
+        self.__setModified()
 
     def getSlot(self) -> Slot:
         """
@@ -369,6 +819,8 @@ class AnnotatedWord(Word):
         Slot
             Slot tag of the word.
         """
+        if self.__unparsed_layers is not None:
+            self.__decodeLayer("slot")
         return self.__slot
 
     def setSlot(self, slot: str):
@@ -380,10 +832,12 @@ class AnnotatedWord(Word):
         slot : str
             New slot tag of the word.
         """
+        self.__discardLayer("slot")
         if slot is not None:
             self.__slot = Slot(slot)
         else:
             self.__slot = None
+        self.__setModified()
 
     def getPolarity(self) -> PolarityType:
         """
@@ -432,6 +886,7 @@ class AnnotatedWord(Word):
                 self.__polarity = PolarityType.NEUTRAL
         else:
             self.__polarity = None
+        self.__setModified()
 
     def getShallowParse(self) -> str:
         """
@@ -454,6 +909,7 @@ class AnnotatedWord(Word):
             New shallow parse tag of the word.
         """
         self.__shallow_parse = parse
+        self.__setModified()
 
     def getCcg(self) -> str:
         """
@@ -476,6 +932,7 @@ class AnnotatedWord(Word):
             New ccg tag of the word.
         """
         self.__ccg = ccg
+        self.__setModified()
 
     def getPosTag(self) -> str:
         """
@@ -498,6 +955,7 @@ class AnnotatedWord(Word):
             New pos tag of the word.
         """
         self.__pos_tag = posTag
+        self.__setModified()
 
     def getUniversalDependency(self) -> UniversalDependencyRelation:
         """
@@ -508,6 +966,8 @@ class AnnotatedWord(Word):
         UniversalDependencyRelation
             Universal dependency relation of the word.
         """
+        if self.__unparsed_layers is not None:
+            self.__decodeLayer("universalDependency")
         return self.__universal_dependency
 
     def setUniversalDependency(self, to: int, dependencyType: str):
@@ -521,10 +981,12 @@ class AnnotatedWord(Word):
         dependencyType : str
             type of dependency the word is related to.
         """
+        self.__discardLayer("universalDependency")
         if to < 0:
             self.__universal_dependency = None
         else:
             self.__universal_dependency = UniversalDependencyRelation(to, dependencyType)
+        self.__setModified()
 
     def getUniversalDependencyFormat(self, sentenceLength: int) -> str:
         """
@@ -533,22 +995,13 @@ class AnnotatedWord(Word):
         :param sentenceLength: Number of words in the sentence.
         :return: The connlu format string for this word.
         """
+        if self.__unparsed_layers is not None:
+            self.__decodeLayer("morphologicalAnalysis")
+            if self.__unparsed_layers is not None:
+                self.__decodeLayer("universalDependency")
         if self.__parse is not None:
-            uPos = self.__parse.getUniversalDependencyPos()
-            result = self.name + "\t" + self.__parse.getWord().getName() + "\t" + \
-                     uPos + "\t_\t"
-            features = self.__parse.getUniversalDependencyFeatures(uPos)
-            if len(features) == 0:
-                result = result + "_"
-            else:
-                first = True
-                for feature in features:
-                    if first:
-                        first = False
-                    else:
-                        result += "|"
-                    result += feature
-            result += "\t"
+            columns = AnnotatedWord.parse_cache.getUniversalDependencyColumns(self.__parseString(), self.__parse)
+            result = self.name + "\t" + columns + "\t"
             if self.__universal_dependency is not None and self.__universal_dependency.to() <= sentenceLength:
                 result += self.__universal_dependency.to().__str__() + "\t" + \
                           self.__universal_dependency.__str__().lower() + "\t"
@@ -569,6 +1022,8 @@ class AnnotatedWord(Word):
         Checks the gazetteer and sets the named entity tag accordingly.
         :param gazetteer: Gazetteer used to set named entity tag.
         """
+        if self.__unparsed_layers is not None:
+            self.__decodeLayer("morphologicalAnalysis")
         word_lower_case = self.name.lower()
         if gazetteer.contains(word_lower_case) and self.__parse.containsTag(MorphologicalTag.PROPERNOUN):
             self.setNamedEntityType(gazetteer.getName())
@@ -586,6 +1041,31 @@ class AnnotatedWord(Word):
         """
         return self.__language
 
+    @staticmethod
+    def setParseCache(parseCache: ParseCache):
+        """
+        Sets the cache used for constructing the morphological parses of all words.
+
+        PARAMETERS
+        ----------
+        parseCache : ParseCache
+            New parse cache. A cache of size 0 disables caching.
+        """
+        AnnotatedWord.parse_cache = parseCache
+
+    @staticmethod
+    def getParseCache() -> ParseCache:
+        """
+        Returns the cache used for constructing the morphological parses of all words. Its hit and miss counts show
+        how many parses have been shared.
+
+        RETURNS
+        -------
+        ParseCache
+            Parse cache of the words.
+        """
+        return AnnotatedWord.parse_cache
+
     @staticmethod
     def getLanguageFromString(languageString: str) -> LanguageType:
         """
@@ -0,0 +1,62 @@
+class AnnotatedWordParser:
+
+    @staticmethod
+    def splitLayers(word: str) -> list:
+        """
+        Splits a word given in the {layer=value} format into its layers. Every layer is returned as a (name, value)
+        tuple in the order it appears in the word. A part of the word that does not contain an equal sign is returned
+        with name None, it is the surface form of a word without any annotation.
+
+        PARAMETERS
+        ----------
+        word : str
+            Word with its annotation layers such as {turkish=Gelir}{morphologicalAnalysis=gelir+NOUN+A3SG+PNON+NOM}
+
+        RETURNS
+        -------
+        list
+            List of (name, value) tuples of the layers.
+        """
+        layers = []
+        for layer in word.replace("}", "{").split("{"):
+            if len(layer) == 0:
+                continue
+            index = layer.find("=")
+            if index == -1:
+                layers.append((None, layer))
+            else:
+                layers.append((layer[:index], layer[index + 1:]))
+        return layers
+
+    @staticmethod
+    def splitSentence(line: str) -> list:
+        """
+        Splits a sentence line, where words are separated with spaces and each word is given in the {layer=value}
+        format, into the layers of its words. Braces of the whole line are normalized in one pass, then each word is
+        split into its layers.
+
+        PARAMETERS
+        ----------
+        line : str
+            Sentence line as stored in an annotated sentence file.
+
+        RETURNS
+        -------
+        list
+            List of words, where each word is a list of (name, value) tuples of its layers.
+        """
+        words = []
+        for word in line.replace("}", "{").split(" "):
+            if len(word) == 0:
+                continue
+            layers = []
+            for layer in word.split("{"):
+                if len(layer) == 0:
+                    continue
+                index = layer.find("=")
+                if index == -1:
+                    layers.append((None, layer))
+                else:
+                    layers.append((layer[:index], layer[index + 1:]))
+            words.append(layers)
+        return words
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+from array import array
+
+import numpy as np
+from NamedEntityRecognition.NamedEntityType import NamedEntityType
+from SentiNet.PolarityType import PolarityType
+
+from AnnotatedSentence.AnnotatedWord import AnnotatedWord
+from AnnotatedSentence.ViewLayerType import ViewLayerType
+
+
+class ColumnarCorpus:
+
+    __file_names: list
+    __sentence_offsets: np.ndarray
+    __heads: np.ndarray
+    __codes: dict
+    __vocabularies: dict
+
+    default_layers = [ViewLayerType.NER, ViewLayerType.SHALLOW_PARSE, ViewLayerType.POS_TAG, ViewLayerType.DEPENDENCY]
+
+    value_getters = {ViewLayerType.PART_OF_SPEECH: AnnotatedWord.getParse,
+                     ViewLayerType.NER: AnnotatedWord.getNamedEntityType,
+                     ViewLayerType.POLARITY: AnnotatedWord.getPolarity,
+                     ViewLayerType.SEMANTICS: AnnotatedWord.getSemantic,
+                     ViewLayerType.SHALLOW_PARSE: AnnotatedWord.getShallowParse,
+                     ViewLayerType.CCG: AnnotatedWord.getCcg,
+                     ViewLayerType.POS_TAG: AnnotatedWord.getPosTag}
+
+    polarity_strings = {PolarityType.POSITIVE: "positive",
+                        PolarityType.NEGATIVE: "negative",
+                        PolarityType.NEUTRAL: "neutral"}
+
+    def __init__(self,
+                 corpus,
+                 layers: list = None):
+        """
+        Constructor for ColumnarCorpus. A columnar corpus stores one annotation layer of all words in a corpus as one
+        NumPy array, so that corpus wide statistics can be computed with array operations. Words of all sentences are
+        stored one after another; the words of the i'th sentence are between sentence offsets i and i + 1. A
+        categorical layer is stored as an array of integer codes together with its vocabulary, which maps each code to
+        its string value. Words that do not have the layer get the code -1.
+
+        PARAMETERS
+        ----------
+        corpus
+            Annotated corpus, or any iterable of annotated sentences such as an AnnotatedCorpusStream. It is visited
+            once.
+        layers : list
+            Layers to be stored. PART_OF_SPEECH is stored as the universal dependency pos of the morphological parse,
+            DEPENDENCY as the heads and the dependency labels, NER as the named entity type as it is written in the
+            sentence files, such as PERSON, any other layer as the value returned by getLayerInfo. If not given,
+            default_layers are stored.
+        """
+        if layers is None:
+            layers = ColumnarCorpus.default_layers
+        categorical_layers = [layer for layer in layers if layer != ViewLayerType.DEPENDENCY]
+        store_dependency = ViewLayerType.DEPENDENCY in layers
+        self.__file_names = []
+        offsets = array('q', [0])
+        heads = array('i')
+        labels = array('i')
+        label_codes = {}
+        codes = {layer: array('i') for layer in categorical_layers}
+        value_codes = {layer: {} for layer in categorical_layers}
+        layer_columns = [(layer, ColumnarCorpus.value_getters.get(layer), codes[layer], value_codes[layer])
+                         for layer in categorical_layers]
+        word_count = 0
+        for sentence in corpus:
+            self.__file_names.append(sentence.getFileName())
+            for word in sentence.words:
+                for layer, getter, layer_codes, layer_value_codes in layer_columns:
+                    value = getter(word) if getter is not None else word.getLayerInfo(layer)
+                    if value is None:
+                        layer_codes.append(-1)
+                    else:
+                        layer_codes.append(layer_value_codes.setdefault(value, len(layer_value_codes)))
+                if store_dependency:
+                    relation = word.getUniversalDependency()
+                    if relation is None:
+                        heads.append(-1)
+                        labels.append(-1)
+                    else:
+                        heads.append(relation.to())
+                        label = ColumnarCorpus.dependencyLabel(word)
+                        labels.append(-1 if label is None else label_codes.setdefault(label, len(label_codes)))
+            word_count += sentence.wordCount()
+            offsets.append(word_count)
+        self.__sentence_offsets = np.frombuffer(offsets, dtype=np.int64).copy()
+        self.__codes = {}
+        self.__vocabularies = {}
+        for layer in categorical_layers:
+            self.__codes[layer], self.__vocabularies[layer] = ColumnarCorpus.__toStringCodes(layer, codes[layer],
+                                                                                            list(value_codes[layer]))
+        if store_dependency:
+            self.__heads = np.frombuffer(heads, dtype=np.int32).copy()
+            self.__codes[ViewLayerType.DEPENDENCY] = ColumnarCorpus.__toCodeArray(labels, len(label_codes))
+            self.__vocabularies[ViewLayerType.DEPENDENCY] = list(label_codes)
+        else:
+            self.__heads = None
+
+    @staticmethod
+    def __valueString(layer: ViewLayerType, value) -> str:
+        """
+        Converts a value returned by the getter of the given layer to the string form returned by getLayerInfo, to
+        the universal dependency pos for PART_OF_SPEECH, or to the named entity type as it is written in the sentence
+        files for NER.
+        """
+        if layer == ViewLayerType.PART_OF_SPEECH:
+            return value.getUniversalDependencyPos()
+        elif layer == ViewLayerType.NER:
+            return NamedEntityType.getNamedEntityString(value)
+        elif layer == ViewLayerType.POLARITY:
+            return ColumnarCorpus.polarity_strings.get(value, "neutral")
+        return value
+
+    @staticmethod
+    def __toStringCodes(layer: ViewLayerType, codes: array, values: list) -> tuple:
+        """
+        Converts the codes of a layer, given as codes of the values returned by its getter, to the codes of their
+        string forms. Each distinct value is converted once; values with the same string form, such as the parses of
+        the same universal dependency pos, get the same code.
+        """
+        result = ColumnarCorpus.__toCodeArray(codes, len(values))
+        if ColumnarCorpus.value_getters.get(layer) is None:
+            return result, values
+        string_codes = {}
+        code_map = [string_codes.setdefault(ColumnarCorpus.__valueString(layer, value), len(string_codes))
+                    for value in values]
+        vocabulary = list(string_codes)
+        if len(vocabulary) < len(values) or vocabulary != values:
+            code_map.append(-1)
+            result = ColumnarCorpus.__toCodeArray(np.array(code_map, dtype=np.int32)[result], len(vocabulary))
+        return result, vocabulary
+
+    @staticmethod
+    def __toCodeArray(codes, vocabularySize: int) -> np.ndarray:
+        """
+        Converts the codes of a layer to the smallest integer array that can hold its vocabulary.
+        """
+        result = np.frombuffer(codes, dtype=np.int32)
+        if vocabularySize < np.iinfo(np.int8).max:
+            return result.astype(np.int8)
+        elif vocabularySize < np.iinfo(np.int16).max:
+            return result.astype(np.int16)
+        return result.copy()
+
+    @staticmethod
+    def dependencyLabel(word: AnnotatedWord) -> str:
+        """
+        Returns the dependency label of the word, None if the word has no dependency relation or its label is not a
+        known universal dependency type.
+
+        PARAMETERS
+        ----------
+        word : AnnotatedWord
+            Word whose dependency label is requested.
+
+        RETURNS
+        -------
+        str
+            Dependency label of the word.
+        """
+        relation = word.getUniversalDependency()
+        if relation is None:
+            return None
+        try:
+            return relation.__str__()
+        except AttributeError:
+            return None
+
+    def sentenceCount(self) -> int:
+        """
+        Returns the number of sentences.
+
+        RETURNS
+        -------
+        int
+            Number of sentences.
+        """
+        return len(self.__file_names)
+
+    def wordCount(self) -> int:
+        """
+        Returns the number of words in all sentences.
+
+        RETURNS
+        -------
+        int
+            Number of words.
+        """
+        return int(self.__sentence_offsets[-1])
+
+    def getFileNames(self) -> list:
+        """
+        Returns the file names of the sentences.
+
+        RETURNS
+        -------
+        list
+            File names of the sentences in order.
+        """
+        return self.__file_names
+
+    def getSentenceOffsets(self) -> np.ndarray:
+        """
+        Returns the sentence offsets. The words of the i'th sentence are stored between offsets i and i + 1.
+
+        RETURNS
+        -------
+        np.ndarray
+            Array of sentenceCount() + 1 offsets.
+        """
+        return self.__sentence_offsets
+
+    def getSentenceLengths(self) -> np.ndarray:
+        """
+        Returns the number of words of each sentence.
+
+        RETURNS
+        -------
+        np.ndarray
+            Sentence lengths.
+        """
+        return np.diff(self.__sentence_offsets)
+
+    def getSentenceIndexes(self) -> np.ndarray:
+        """
+        Returns the index of the sentence of each word.
+
+        RETURNS
+        -------
+        np.ndarray
+            Sentence index of each word.
+        """
+        return np.repeat(np.arange(self.sentenceCount()), self.getSentenceLengths())
+
+    def getHeads(self) -> np.ndarray:
+        """
+        Returns the heads of the words as given in the dependency layer, where 0 is the root and -1 means the word
+        has no dependency relation.
+
+        RETURNS
+        -------
+        np.ndarray
+            Heads of the words as int32, None if the dependency layer is not stored.
+        """
+        return self.__heads
+
+    def getCodes(self, layer: ViewLayerType) -> np.ndarray:
+        """
+        Returns the codes of the given layer for all words. For DEPENDENCY, the codes of the dependency labels are
+        returned.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Layer whose codes are requested.
+
+        RETURNS
+        -------
+        np.ndarray
+            Codes of the words, -1 for the words without the layer. None if the layer is not stored.
+        """
+        return self.__codes.get(layer)
+
+    def getVocabulary(self, layer: ViewLayerType) -> list:
+        """
+        Returns the vocabulary of the given layer, where the i'th item is the value with code i.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Layer whose vocabulary is requested.
+
+        RETURNS
+        -------
+        list
+            Values of the layer, None if the layer is not stored.
+        """
+        return self.__vocabularies.get(layer)
+
+    def getValueCounts(self, layer: ViewLayerType) -> dict:
+        """
+        Counts the words having each value of the given layer.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Layer whose values are counted.
+
+        RETURNS
+        -------
+        dict
+            Number of words for each value of the layer.
+        """
+        vocabulary = self.__vocabularies[layer]
+        codes = self.__codes[layer]
+        counts = np.bincount(codes[codes >= 0], minlength=len(vocabulary))
+        return {vocabulary[i]: int(counts[i]) for i in range(len(vocabulary))}
+
+    def getSpans(self, layer: ViewLayerType, skipValues: list = None) -> tuple:
+        """
+        Finds the runs of consecutive words of each sentence having the same value of the given layer, with array
+        operations. For SHALLOW_PARSE, the runs are the spans AnnotatedSentence.getShallowParseSpans returns: a word
+        following a word without the layer continues the run of that word, and a run starting with words without the
+        layer is returned with code -1, even if it also contains tagged words.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Layer whose runs are found.
+        skipValues : list
+            Values whose runs are not returned, such as NONE for the NER layer. Except for SHALLOW_PARSE, runs of
+            words without the layer are never returned.
+
+        RETURNS
+        -------
+        tuple
+            Arrays of the sentence index, the start word index, the end word index (exclusive) and the code of each
+            run; the word indexes are relative to the sentence.
+        """
+        codes = self.__codes[layer].astype(np.int32)
+        word_count = len(codes)
+        starts = np.zeros(word_count, dtype=bool)
+        if word_count > 0:
+            if layer == ViewLayerType.SHALLOW_PARSE:
+                starts[1:] = (codes[1:] != codes[:-1]) & (codes[:-1] != -1)
+            else:
+                starts[1:] = codes[1:] != codes[:-1]
+            starts[self.__sentence_offsets[:-1][self.getSentenceLengths() > 0]] = True
+        run_starts = np.flatnonzero(starts)
+        run_ends = np.append(run_starts[1:], word_count)
+        sentence_indexes = self.getSentenceIndexes()[run_starts]
+        run_ends = np.minimum(run_ends, self.__sentence_offsets[sentence_indexes + 1])
+        run_codes = codes[run_starts]
+        if layer == ViewLayerType.SHALLOW_PARSE:
+            keep = np.ones(len(run_codes), dtype=bool)
+        else:
+            keep = run_codes != -1
+        if skipValues is not None:
+            vocabulary = self.__vocabularies[layer]
+            for value in skipValues:
+                if value in vocabulary:
+                    keep &= run_codes != vocabulary.index(value)
+        offsets = self.__sentence_offsets[sentence_indexes]
+        return (sentence_indexes[keep], (run_starts - offsets)[keep], (run_ends - offsets)[keep], run_codes[keep])
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+from DependencyParser.ParserEvaluationScore import ParserEvaluationScore
+
+from AnnotatedSentence.AnnotatedWord import AnnotatedWord
+from AnnotatedSentence.ViewLayerType import ViewLayerType
+
+
+class CorpusComparison:
+
+    __layers: list
+    __matched_count: int
+    __missing_from_first: list
+    __missing_from_second: list
+    __duplicates_in_first: list
+    __duplicates_in_second: list
+    __length_mismatches: list
+    __compared_counts: dict
+    __agreed_counts: dict
+    __disagreements: dict
+    __dependency_counts: list
+
+    def __init__(self, layers: list):
+        """
+        Constructor for CorpusComparison. A corpus comparison keeps the result of comparing the sentences of two
+        corpora having the same name: for each compared annotation layer, the number of compared words, the number of
+        words having the same value in both sentences and the names of the sentences having a different value in any
+        of their words. The names of the sentences found only in one of the corpora, and of the matched sentences with
+        a different number of words, are also kept.
+
+        PARAMETERS
+        ----------
+        layers : list
+            Compared layers.
+        """
+        self.__layers = layers
+        self.__matched_count = 0
+        self.__missing_from_first = []
+        self.__missing_from_second = []
+        self.__duplicates_in_first = []
+        self.__duplicates_in_second = []
+        self.__length_mismatches = []
+        self.__compared_counts = {layer: 0 for layer in layers}
+        self.__agreed_counts = {layer: 0 for layer in layers}
+        self.__disagreements = {layer: [] for layer in layers}
+        self.__dependency_counts = [0, 0, 0, 0]
+
+    @staticmethod
+    def layerValue(word: AnnotatedWord, layer: ViewLayerType) -> str:
+        """
+        Returns the value of the given layer of the word as returned by getLayerInfo, None if the word does not have
+        the layer or its value can not be converted to string.
+
+        PARAMETERS
+        ----------
+        word : AnnotatedWord
+            Word whose layer value is requested.
+        layer : ViewLayerType
+            Layer whose value is requested.
+
+        RETURNS
+        -------
+        str
+            Value of the layer.
+        """
+        try:
+            return word.getLayerInfo(layer)
+        except AttributeError:
+            # Dependency relations whose type is not a universal dependency type can not be converted to string.
+            return None
+
+    @staticmethod
+    def __dependencyLabel(relation) -> str:
+        """
+        Returns the dependency label of the relation, None if its type is not a universal dependency type.
+        """
+        try:
+            return relation.__str__()
+        except AttributeError:
+            return None
+
+    def __compareDependencies(self, word1: AnnotatedWord, word2: AnnotatedWord):
+        """
+        Adds the comparison of the dependency relations of the words, if both have one, to the dependency counts, as
+        compareRelations of UniversalDependencyRelation compares them.
+        """
+        relation1 = word1.getUniversalDependency()
+        relation2 = word2.getUniversalDependency()
+        if relation1 is None or relation2 is None:
+            return
+        self.__dependency_counts[0] += 1
+        same_head = relation1.to() == relation2.to()
+        label1 = CorpusComparison.__dependencyLabel(relation1)
+        same_label = label1 is not None and label1 == CorpusComparison.__dependencyLabel(relation2)
+        if same_head:
+            self.__dependency_counts[1] += 1
+        if same_head and same_label:
+            self.__dependency_counts[2] += 1
+        if same_label:
+            self.__dependency_counts[3] += 1
+
+    def addSentences(self, name: str, sentence1, sentence2):
+        """
+        Compares the layers of the words of the given sentences having the same name, and adds the result to the
+        comparison. A word is compared if it has the layer in at least one of the sentences. If the sentences have a
+        different number of words, only the words of the shorter sentence are compared.
+
+        PARAMETERS
+        ----------
+        name : str
+            Name of the sentences.
+        sentence1 : AnnotatedSentence
+            Sentence of the first corpus.
+        sentence2 : AnnotatedSentence
+            Sentence of the second corpus.
+        """
+        self.__matched_count += 1
+        words1 = sentence1.words
+        words2 = sentence2.words
+        if len(words1) != len(words2):
+            self.__length_mismatches.append(name)
+        word_count = min(len(words1), len(words2))
+        for layer in self.__layers:
+            compared = 0
+            agreed = 0
+            for i in range(word_count):
+                value1 = CorpusComparison.layerValue(words1[i], layer)
+                value2 = CorpusComparison.layerValue(words2[i], layer)
+                if value1 is not None or value2 is not None:
+                    compared += 1
+                    if value1 == value2:
+                        agreed += 1
+            self.__compared_counts[layer] += compared
+            self.__agreed_counts[layer] += agreed
+            if agreed < compared:
+                self.__disagreements[layer].append(name)
+        if ViewLayerType.DEPENDENCY in self.__compared_counts:
+            for i in range(word_count):
+                self.__compareDependencies(words1[i], words2[i])
+
+    def addMissing(self, name: str, inFirst: bool):
+        """
+        Records a sentence found only in one of the corpora.
+
+        PARAMETERS
+        ----------
+        name : str
+            Name of the sentence.
+        inFirst : bool
+            True if the sentence is found only in the first corpus, False if it is found only in the second corpus.
+        """
+        if inFirst:
+            self.__missing_from_second.append(name)
+        else:
+            self.__missing_from_first.append(name)
+
+    def addDuplicate(self, name: str, inFirst: bool):
+        """
+        Records a sentence whose name has already been seen in its corpus. The sentence is not compared.
+
+        PARAMETERS
+        ----------
+        name : str
+            Name of the sentence.
+        inFirst : bool
+            True if the sentence is in the first corpus, False if it is in the second corpus.
+        """
+        if inFirst:
+            self.__duplicates_in_first.append(name)
+        else:
+            self.__duplicates_in_second.append(name)
+
+    def getLayers(self) -> list:
+        """
+        Returns the compared layers.
+
+        RETURNS
+        -------
+        list
+            Compared layers.
+        """
+        return self.__layers
+
+    def matchedCount(self) -> int:
+        """
+        Returns the number of sentences found in both corpora.
+
+        RETURNS
+        -------
+        int
+            Number of compared sentence pairs.
+        """
+        return self.__matched_count
+
+    def getMissingFromFirst(self) -> list:
+        """
+        Returns the names of the sentences found only in the second corpus.
+
+        RETURNS
+        -------
+        list
+            Names of the sentences.
+        """
+        return self.__missing_from_first
+
+    def getMissingFromSecond(self) -> list:
+        """
+        Returns the names of the sentences found only in the first corpus.
+
+        RETURNS
+        -------
+        list
+            Names of the sentences.
+        """
+        return self.__missing_from_second
+
+    def getDuplicatesInFirst(self) -> list:
+        """
+        Returns the names occurring more than once in the first corpus, once for each repeated occurrence.
+
+        RETURNS
+        -------
+        list
+            Names of the sentences.
+        """
+        return self.__duplicates_in_first
+
+    def getDuplicatesInSecond(self) -> list:
+        """
+        Returns the names occurring more than once in the second corpus, once for each repeated occurrence.
+
+        RETURNS
+        -------
+        list
+            Names of the sentences.
+        """
+        return self.__duplicates_in_second
+
+    def getLengthMismatches(self) -> list:
+        """
+        Returns the names of the matched sentences having a different number of words in the two corpora.
+
+        RETURNS
+        -------
+        list
+            Names of the sentences.
+        """
+        return self.__length_mismatches
+
+    def comparedWordCount(self, layer: ViewLayerType) -> int:
+        """
+        Returns the number of words compared in the given layer.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Compared layer.
+
+        RETURNS
+        -------
+        int
+            Number of words having the layer in at least one of the corpora.
+        """
+        return self.__compared_counts[layer]
+
+    def getAgreement(self, layer: ViewLayerType) -> float:
+        """
+        Returns the ratio of the compared words having the same value of the given layer in both corpora.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Compared layer.
+
+        RETURNS
+        -------
+        float
+            Agreement ratio, 1 if no words are compared.
+        """
+        if self.__compared_counts[layer] == 0:
+            return 1.0
+        return self.__agreed_counts[layer] / self.__compared_counts[layer]
+
+    def getDisagreements(self, layer: ViewLayerType) -> list:
+        """
+        Returns the names of the matched sentences having a word with a different value of the given layer.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Compared layer.
+
+        RETURNS
+        -------
+        list
+            Names of the sentences.
+        """
+        return self.__disagreements[layer]
+
+    def getParserEvaluationScore(self) -> ParserEvaluationScore:
+        """
+        Returns the parser evaluation score of the dependency relations of the matched sentences, computed as
+        compareParses computes it. Available only if the DEPENDENCY layer is compared.
+
+        RETURNS
+        -------
+        ParserEvaluationScore
+            LAS, UAS and LS of the second corpus with respect to the first corpus.
+        """
+        word_count = self.__dependency_counts[0]
+        if word_count == 0:
+            return ParserEvaluationScore()
+        return ParserEvaluationScore(self.__dependency_counts[2] / word_count, self.__dependency_counts[1] / word_count,
+                                     self.__dependency_counts[3] / word_count, word_count)
+
+    def __repr__(self):
+        return f"matched: {self.__matched_count} missing from first: {len(self.__missing_from_first)} " \
+               f"missing from second: {len(self.__missing_from_second)} " \
+               f"duplicates: {len(self.__duplicates_in_first) + len(self.__duplicates_in_second)} " + \
+               " ".join(f"{layer.name}: {round(self.getAgreement(layer), 4)}" for layer in self.__layers)
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import itertools
+import time
+
+from AnnotatedSentence.AnnotatedCorpus import AnnotatedCorpus
+from AnnotatedSentence.AnnotatedSentence import AnnotatedSentence
+from AnnotatedSentence.LayerIndex import LayerIndex
+from AnnotatedSentence.QueryStatistics import QueryStatistics
+
+
+class CorpusQuery:
+
+    __patterns: list
+    __index_conditions: list
+    __adjacent: bool
+    __where: object
+    __statistics: QueryStatistics
+
+    def __init__(self,
+                 patterns: list,
+                 adjacent: bool = True,
+                 where=None):
+        """
+        Constructor for CorpusQuery. A query consists of word patterns, each of which maps annotation layers to the
+        conditions a word must satisfy. A condition is either a string, which must be one of the values of the layer,
+        a set or list of strings, one of which must be one of the values of the layer, or a function taking a value of
+        the layer and returning True for the accepted values. Values of a layer are the ones kept by LayerIndex, so
+        PROPBANK conditions are checked against the individual arguments such as ARG0$TUR10-0100 and DEPENDENCY
+        conditions against values such as 3$NSUBJ. For example
+
+            CorpusQuery([{ViewLayerType.SHALLOW_PARSE: "ÖZNE", ViewLayerType.DEPENDENCY: lambda value:
+                          value.endswith("$NSUBJ")}])
+
+        finds the subjects which are nominal subjects of their heads. The conditions are compiled once, so the query
+        can be run on many corpora.
+
+        PARAMETERS
+        ----------
+        patterns : list
+            Word patterns, each a dictionary from ViewLayerType to a condition.
+        adjacent : bool
+            If True, the patterns must match consecutive words in the given order. If False, each pattern must match
+            a different word of the sentence, in any order.
+        where
+            If given, a function taking the sentence and the word indexes matched by the patterns, and returning True
+            for the matches to be kept, such as the ones where the ARG0 of a word is the predicate of the other.
+        """
+        self.__patterns = []
+        self.__index_conditions = []
+        for pattern in patterns:
+            compiled = []
+            for layer, condition in pattern.items():
+                if isinstance(condition, str):
+                    compiled.append((0, layer, CorpusQuery.__valueTest(condition)))
+                    self.__index_conditions.append((layer, [condition]))
+                elif callable(condition):
+                    compiled.append((2, layer, CorpusQuery.__functionTest(condition)))
+                else:
+                    compiled.append((1, layer, CorpusQuery.__setTest(frozenset(condition))))
+                    self.__index_conditions.append((layer, list(condition)))
+            compiled.sort(key=lambda item: item[0])
+            self.__patterns.append([(layer, test) for cost, layer, test in compiled])
+        self.__adjacent = adjacent
+        self.__where = where
+        self.__statistics = QueryStatistics()
+
+    @staticmethod
+    def __valueTest(value: str):
+        """
+        Returns the test accepting the layer values containing the given value.
+        """
+        return lambda values: value in values
+
+    @staticmethod
+    def __setTest(accepted: frozenset):
+        """
+        Returns the test accepting the layer values containing one of the given values.
+        """
+        return lambda values: not accepted.isdisjoint(values)
+
+    @staticmethod
+    def __functionTest(function):
+        """
+        Returns the test accepting the layer values containing a value accepted by the given function.
+        """
+        return lambda values: any(function(value) for value in values)
+
+    @staticmethod
+    def __matchesWord(word, pattern: list) -> bool:
+        """
+        Checks if the word satisfies all conditions of the compiled pattern.
+        """
+        for layer, test in pattern:
+            if not test(LayerIndex.layerValues(word, layer)):
+                return False
+        return True
+
+    def matchSentence(self, sentence: AnnotatedSentence) -> list:
+        """
+        Returns the matches of the query in the given sentence.
+
+        PARAMETERS
+        ----------
+        sentence : AnnotatedSentence
+            Sentence to be searched.
+
+        RETURNS
+        -------
+        list
+            Tuples of the word indexes matched by the patterns, in the order of the patterns.
+        """
+        words = sentence.words
+        result = []
+        if self.__adjacent:
+            for i in range(len(words) - len(self.__patterns) + 1):
+                matched = True
+                for k in range(len(self.__patterns)):
+                    if not CorpusQuery.__matchesWord(words[i + k], self.__patterns[k]):
+                        matched = False
+                        break
+                if matched:
+                    result.append(tuple(range(i, i + len(self.__patterns))))
+        else:
+            candidates = []
+            for pattern in self.__patterns:
+                candidates.append([i for i in range(len(words)) if CorpusQuery.__matchesWord(words[i], pattern)])
+                if len(candidates[-1]) == 0:
+                    return result
+            for positions in itertools.product(*candidates):
+                if len(set(positions)) == len(positions):
+                    result.append(positions)
+        if self.__where is not None:
+            result = [positions for positions in result if self.__where(sentence, positions)]
+        return result
+
+    def __candidateSentences(self, corpus: AnnotatedCorpus) -> list:
+        """
+        Returns the indexes of the sentences containing words with the string valued conditions of the query, as
+        found with the layer index of the corpus, or None if the index covers none of these conditions.
+        """
+        index = corpus.getLayerIndex()
+        if index is None:
+            return None
+        result = None
+        for layer, values in self.__index_conditions:
+            if layer in index.getLayers():
+                sentences = set()
+                for value in values:
+                    sentences.update(position[0] for position in index.lookup(layer, value))
+                result = sentences if result is None else result & sentences
+        if result is None:
+            return None
+        return sorted(result)
+
+    def iterate(self, corpus):
+        """
+        Runs the query on the corpus, returning the matches one sentence at a time. If the corpus is an
+        AnnotatedCorpus with a layer index covering one of the string valued conditions, only the sentences found with
+        the index are visited, otherwise all sentences are visited once, so a streamed corpus can be queried as
+        well. The statistics of the run are available with getStatistics after all matches are returned.
+
+        PARAMETERS
+        ----------
+        corpus
+            Annotated corpus, or any iterable of annotated sentences such as an AnnotatedCorpusStream.
+
+        RETURNS
+        -------
+        Generator of tuples of the sentence index, the sentence and the tuple of the matched word indexes.
+        """
+        start = time.perf_counter()
+        candidates = None
+        if isinstance(corpus, AnnotatedCorpus):
+            candidates = self.__candidateSentences(corpus)
+        sentence_count = 0
+        candidate_count = 0
+        match_count = 0
+        if candidates is not None:
+            sentence_count = corpus.sentenceCount()
+            sentences = ((i, corpus.sentences[i]) for i in candidates)
+        else:
+            sentences = enumerate(corpus)
+        for i, sentence in sentences:
+            candidate_count += 1
+            for positions in self.matchSentence(sentence):
+                match_count += 1
+                yield i, sentence, positions
+        if candidates is None:
+            sentence_count = candidate_count
+        self.__statistics = QueryStatistics(sentence_count, candidate_count, match_count, candidates is not None,
+                                            time.perf_counter() - start)
+
+    def run(self, corpus) -> list:
+        """
+        Runs the query on the corpus as iterate does and returns all matches.
+
+        PARAMETERS
+        ----------
+        corpus
+            Annotated corpus, or any iterable of annotated sentences such as an AnnotatedCorpusStream.
+
+        RETURNS
+        -------
+        list
+            Tuples of the sentence index, the sentence and the tuple of the matched word indexes.
+        """
+        return list(self.iterate(corpus))
+
+    def getStatistics(self) -> QueryStatistics:
+        """
+        Returns the statistics of the last completed run of the query.
+
+        RETURNS
+        -------
+        QueryStatistics
+            Number of sentences visited, number of matches and the duration of the last run.
+        """
+        return self.__statistics
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from AnnotatedSentence.AnnotatedWord import AnnotatedWord
+from AnnotatedSentence.ViewLayerType import ViewLayerType
+
+
+class CoverageReport:
+
+    __layers: list
+    __file_names: list
+    __word_counts: list
+    __covered_counts: dict
+    __missing_words: dict
+
+    layer_getters = {ViewLayerType.PART_OF_SPEECH: AnnotatedWord.getParse,
+                     ViewLayerType.INFLECTIONAL_GROUP: AnnotatedWord.getParse,
+                     ViewLayerType.SEMANTICS: AnnotatedWord.getSemantic,
+                     ViewLayerType.NER: AnnotatedWord.getNamedEntityType,
+                     ViewLayerType.SHALLOW_PARSE: AnnotatedWord.getShallowParse,
+                     ViewLayerType.SLOT: AnnotatedWord.getSlot,
+                     ViewLayerType.POLARITY: AnnotatedWord.getPolarity,
+                     ViewLayerType.DEPENDENCY: AnnotatedWord.getUniversalDependency,
+                     ViewLayerType.CCG: AnnotatedWord.getCcg,
+                     ViewLayerType.POS_TAG: AnnotatedWord.getPosTag}
+
+    def __init__(self, layers: list):
+        """
+        Constructor for CoverageReport. A coverage report keeps, for each checked annotation layer, the positions of
+        the words that do not have the layer, and for each sentence the number of words having each layer, so that
+        the coverage ratio of a layer in a sentence or in the whole corpus can be computed.
+
+        PARAMETERS
+        ----------
+        layers : list
+            Checked layers.
+        """
+        self.__layers = layers
+        self.__file_names = []
+        self.__word_counts = []
+        self.__covered_counts = {layer: [] for layer in layers}
+        self.__missing_words = {layer: [] for layer in layers}
+
+    @staticmethod
+    def hasLayer(word: AnnotatedWord, layer: ViewLayerType) -> bool:
+        """
+        Checks if the word has the given annotation layer. Layers with a getter in layer_getters are checked with the
+        getter, which returns the stored value without converting it to string; PART_OF_SPEECH and
+        INFLECTIONAL_GROUP are checked with the morphological parse. The other layers are checked with getLayerInfo.
+
+        PARAMETERS
+        ----------
+        word : AnnotatedWord
+            Word to be checked.
+        layer : ViewLayerType
+            Layer to be checked.
+
+        RETURNS
+        -------
+        bool
+            True if the word has the layer, False otherwise.
+        """
+        getter = CoverageReport.layer_getters.get(layer)
+        if getter is not None:
+            return getter(word) is not None
+        return word.getLayerInfo(layer) is not None
+
+    def addSentence(self, sentence):
+        """
+        Checks all layers of all words of the sentence and adds the result to the report.
+
+        PARAMETERS
+        ----------
+        sentence : AnnotatedSentence
+            Sentence to be checked.
+        """
+        sentence_index = len(self.__file_names)
+        self.__file_names.append(sentence.getFileName())
+        self.__word_counts.append(len(sentence.words))
+        for layer in self.__layers:
+            getter = CoverageReport.layer_getters.get(layer)
+            missing_words = self.__missing_words[layer]
+            missing_count = len(missing_words)
+            for j in range(len(sentence.words)):
+                word = sentence.words[j]
+                if (getter(word) if getter is not None else word.getLayerInfo(layer)) is None:
+                    missing_words.append((sentence_index, j))
+            self.__covered_counts[layer].append(len(sentence.words) - len(missing_words) + missing_count)
+
+    def add(self, report: CoverageReport):
+        """
+        Appends the sentences of the given report, which must check the same layers, to the sentences of this report.
+
+        PARAMETERS
+        ----------
+        report : CoverageReport
+            Report of the sentences following the sentences of this report.
+        """
+        offset = len(self.__file_names)
+        self.__file_names.extend(report.getFileNames())
+        self.__word_counts.extend(report.__word_counts)
+        for layer in self.__layers:
+            self.__covered_counts[layer].extend(report.__covered_counts[layer])
+            self.__missing_words[layer].extend((i + offset, j) for i, j in report.getMissingWords(layer))
+
+    def getLayers(self) -> list:
+        """
+        Returns the checked layers.
+
+        RETURNS
+        -------
+        list
+            Checked layers.
+        """
+        return self.__layers
+
+    def getFileNames(self) -> list:
+        """
+        Returns the file names of the checked sentences, in the order they are checked.
+
+        RETURNS
+        -------
+        list
+            File names of the sentences.
+        """
+        return self.__file_names
+
+    def sentenceCount(self) -> int:
+        """
+        Returns the number of checked sentences.
+
+        RETURNS
+        -------
+        int
+            Number of sentences.
+        """
+        return len(self.__file_names)
+
+    def getMissingWords(self, layer: ViewLayerType) -> list:
+        """
+        Returns the positions of the words that do not have the given layer.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Checked layer.
+
+        RETURNS
+        -------
+        list
+            List of (sentence index, word index) pairs.
+        """
+        return self.__missing_words[layer]
+
+    def getIncompleteSentences(self, layer: ViewLayerType) -> list:
+        """
+        Returns the indexes of the sentences having words without the given layer.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Checked layer.
+
+        RETURNS
+        -------
+        list
+            Indexes of the sentences in increasing order.
+        """
+        covered_counts = self.__covered_counts[layer]
+        return [i for i in range(len(covered_counts)) if covered_counts[i] < self.__word_counts[i]]
+
+    def getSentenceCoverage(self, sentenceIndex: int, layer: ViewLayerType) -> float:
+        """
+        Returns the ratio of the words of the given sentence having the given layer.
+
+        PARAMETERS
+        ----------
+        sentenceIndex : int
+            Index of the sentence.
+        layer : ViewLayerType
+            Checked layer.
+
+        RETURNS
+        -------
+        float
+            Coverage ratio, 1 for a sentence without words.
+        """
+        if self.__word_counts[sentenceIndex] == 0:
+            return 1.0
+        return self.__covered_counts[layer][sentenceIndex] / self.__word_counts[sentenceIndex]
+
+    def getCoverage(self, layer: ViewLayerType) -> float:
+        """
+        Returns the ratio of all checked words having the given layer.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Checked layer.
+
+        RETURNS
+        -------
+        float
+            Coverage ratio, 1 if no words are checked.
+        """
+        word_count = sum(self.__word_counts)
+        if word_count == 0:
+            return 1.0
+        return sum(self.__covered_counts[layer]) / word_count
+
+    def __repr__(self):
+        return f"sentences: {len(self.__file_names)} " + \
+               " ".join(f"{layer.name}: {round(self.getCoverage(layer), 4)}" for layer in self.__layers)
@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from array import array
+
+
+class DependencyTree:
+
+    __heads: array
+    __child_offsets: array
+    __children: array
+    __depths: array
+    __subtree_starts: array
+    __subtree_ends: array
+    __subtree_sizes: array
+    __root_count: int
+    __out_of_range_count: int
+    __missing_count: int
+    __has_cycle: bool
+
+    def __init__(self, heads: array):
+        """
+        Constructor for DependencyTree. A dependency tree keeps the dependency structure of a sentence in flat
+        arrays, so that children, depths and subtrees are not searched again by each user of the universal dependency
+        layer. Nodes are numbered as in the universal dependency layer: node 0 is the artificial root and node i is
+        the i'th word of the sentence. The children of node k are the items of the children array from child offset
+        k up to but not including child offset k + 1, in increasing order. The depth, subtree start, subtree end and
+        subtree size arrays have an item for each word: the subtree of a word spans the nodes from its subtree start
+        to its subtree end, both included. Words that can not be reached from the root, because they are on a cycle,
+        or one of their ancestors has no head or a head out of range, have depth -1 and are not in any subtree.
+
+        All arrays are computed in time linear in the length of the sentence.
+
+        PARAMETERS
+        ----------
+        heads : array
+            Head of each word, 0 for the root and -1 for a word without a dependency relation.
+        """
+        word_count = len(heads)
+        self.__heads = heads
+        self.__root_count = 0
+        self.__out_of_range_count = 0
+        self.__missing_count = 0
+        counts = array('i', [0]) * (word_count + 2)
+        for head in heads:
+            if head == 0:
+                self.__root_count += 1
+            elif head == -1:
+                self.__missing_count += 1
+            elif head < 0 or head > word_count:
+                self.__out_of_range_count += 1
+            if 0 <= head <= word_count:
+                counts[head + 1] += 1
+        for k in range(word_count + 1):
+            counts[k + 1] += counts[k]
+        self.__child_offsets = counts
+        children = array('i', [0]) * counts[word_count + 1]
+        positions = array('i', counts)
+        for i in range(word_count):
+            head = heads[i]
+            if 0 <= head <= word_count:
+                children[positions[head]] = i + 1
+                positions[head] += 1
+        self.__children = children
+        self.__has_cycle = self.__findCycle()
+        depths = array('i', [-1]) * (word_count + 1)
+        depths[0] = 0
+        order = [0]
+        for node in order:
+            for k in range(counts[node], counts[node + 1]):
+                child = children[k]
+                depths[child] = depths[node] + 1
+                order.append(child)
+        starts = array('i', range(word_count + 1))
+        ends = array('i', range(word_count + 1))
+        sizes = array('i', [1]) * (word_count + 1)
+        for node in reversed(order):
+            if node != 0:
+                head = heads[node - 1]
+                if starts[node] < starts[head]:
+                    starts[head] = starts[node]
+                if ends[node] > ends[head]:
+                    ends[head] = ends[node]
+                sizes[head] += sizes[node]
+        for i in range(1, word_count + 1):
+            if depths[i] == -1:
+                starts[i] = -1
+                ends[i] = -1
+                sizes[i] = 0
+        self.__depths = depths[1:]
+        self.__subtree_starts = starts[1:]
+        self.__subtree_ends = ends[1:]
+        self.__subtree_sizes = sizes[1:]
+
+    def __findCycle(self) -> bool:
+        """
+        Follows the heads of each word until the root, a word without a valid head, or a word visited before is
+        reached. Returns True if a word is reached again while its own path is followed.
+        """
+        word_count = len(self.__heads)
+        states = bytearray(word_count + 1)
+        for i in range(1, word_count + 1):
+            node = i
+            path = []
+            while 0 < node <= word_count and states[node] == 0:
+                states[node] = 1
+                path.append(node)
+                node = self.__heads[node - 1]
+            if 0 < node <= word_count and states[node] == 1:
+                return True
+            for visited in path:
+                states[visited] = 2
+        return False
+
+    def wordCount(self) -> int:
+        """
+        Returns the number of words in the tree.
+
+        RETURNS
+        -------
+        int
+            Number of words.
+        """
+        return len(self.__heads)
+
+    def getHeads(self) -> array:
+        """
+        Returns the head of each word, 0 for the root and -1 for a word without a dependency relation.
+
+        RETURNS
+        -------
+        array
+            Heads of the words.
+        """
+        return self.__heads
+
+    def getChildOffsets(self) -> array:
+        """
+        Returns the offsets of the children of each node, including the artificial root, in the children array.
+
+        RETURNS
+        -------
+        array
+            Child offsets, one more than the number of nodes.
+        """
+        return self.__child_offsets
+
+    def getChildren(self, node: int = None):
+        """
+        Returns the children of the given node, or the children of all nodes one after another if no node is given.
+
+        PARAMETERS
+        ----------
+        node : int
+            Node whose children are requested, 0 for the artificial root.
+
+        RETURNS
+        -------
+        array
+            Children of the node in increasing order.
+        """
+        if node is None:
+            return self.__children
+        return self.__children[self.__child_offsets[node]:self.__child_offsets[node + 1]]
+
+    def getDepths(self) -> array:
+        """
+        Returns the depth of each word, 1 for the words attached to the root and -1 for unreachable words.
+
+        RETURNS
+        -------
+        array
+            Depths of the words.
+        """
+        return self.__depths
+
+    def getSubtreeStarts(self) -> array:
+        """
+        Returns the smallest node in the subtree of each word, -1 for unreachable words.
+
+        RETURNS
+        -------
+        array
+            Subtree starts of the words.
+        """
+        return self.__subtree_starts
+
+    def getSubtreeEnds(self) -> array:
+        """
+        Returns the largest node in the subtree of each word, -1 for unreachable words.
+
+        RETURNS
+        -------
+        array
+            Subtree ends of the words.
+        """
+        return self.__subtree_ends
+
+    def getSubtreeSizes(self) -> array:
+        """
+        Returns the number of words in the subtree of each word, including itself, 0 for unreachable words.
+
+        RETURNS
+        -------
+        array
+            Subtree sizes of the words.
+        """
+        return self.__subtree_sizes
+
+    def rootCount(self) -> int:
+        """
+        Returns the number of words attached to the artificial root.
+
+        RETURNS
+        -------
+        int
+            Number of roots.
+        """
+        return self.__root_count
+
+    def missingHeadCount(self) -> int:
+        """
+        Returns the number of words without a dependency relation.
+
+        RETURNS
+        -------
+        int
+            Number of words without a head.
+        """
+        return self.__missing_count
+
+    def outOfRangeHeadCount(self) -> int:
+        """
+        Returns the number of words whose head is not a node of the sentence.
+
+        RETURNS
+        -------
+        int
+            Number of words with a head out of range.
+        """
+        return self.__out_of_range_count
+
+    def hasCycle(self) -> bool:
+        """
+        Checks if the heads of the words form a cycle.
+
+        RETURNS
+        -------
+        bool
+            True if there is a cycle, False otherwise.
+        """
+        return self.__has_cycle
+
+    def isTree(self) -> bool:
+        """
+        Checks if the words form a single tree: every word has a head in range, exactly one word is attached to the
+        root and there is no cycle.
+
+        RETURNS
+        -------
+        bool
+            True if the words form a tree, False otherwise.
+        """
+        return self.__root_count == 1 and self.__missing_count == 0 and self.__out_of_range_count == 0 \
+            and not self.__has_cycle
+
+    def isProjective(self) -> bool:
+        """
+        Checks if the reachable part of the tree is projective, that is, if the subtree of every reachable word
+        consists of consecutive words.
+
+        RETURNS
+        -------
+        bool
+            True if the tree is projective, False otherwise.
+        """
+        for i in range(len(self.__heads)):
+            if self.__subtree_sizes[i] > 0 and \
+                    self.__subtree_ends[i] - self.__subtree_starts[i] + 1 != self.__subtree_sizes[i]:
+                return False
+        return True
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+
+class ExportStatistics:
+
+    __sentence_count: int
+    __word_count: int
+    __column_hit_count: int
+    __column_miss_count: int
+
+    def __init__(self,
+                 sentenceCount: int = 0,
+                 wordCount: int = 0,
+                 columnHitCount: int = 0,
+                 columnMissCount: int = 0):
+        """
+        Constructor for ExportStatistics. Keeps the number of sentences and words written by an export in connlu
+        format, together with the number of words whose lemma, universal pos and feature columns are taken from the
+        parse cache and the number of words for which they are computed.
+
+        PARAMETERS
+        ----------
+        sentenceCount : int
+            Number of sentences written.
+        wordCount : int
+            Number of words written.
+        columnHitCount : int
+            Number of words whose columns are taken from the parse cache.
+        columnMissCount : int
+            Number of words whose columns are computed.
+        """
+        self.__sentence_count = sentenceCount
+        self.__word_count = wordCount
+        self.__column_hit_count = columnHitCount
+        self.__column_miss_count = columnMissCount
+
+    def add(self, statistics: ExportStatistics):
+        """
+        Adds the counts of the given statistics to the counts of this statistics.
+
+        PARAMETERS
+        ----------
+        statistics : ExportStatistics
+            Statistics to be added.
+        """
+        self.__sentence_count += statistics.getSentenceCount()
+        self.__word_count += statistics.getWordCount()
+        self.__column_hit_count += statistics.getColumnHitCount()
+        self.__column_miss_count += statistics.getColumnMissCount()
+
+    def getSentenceCount(self) -> int:
+        """
+        Returns the number of sentences written.
+
+        RETURNS
+        -------
+        int
+            Number of sentences written.
+        """
+        return self.__sentence_count
+
+    def getWordCount(self) -> int:
+        """
+        Returns the number of words written.
+
+        RETURNS
+        -------
+        int
+            Number of words written.
+        """
+        return self.__word_count
+
+    def getColumnHitCount(self) -> int:
+        """
+        Returns the number of words whose lemma, universal pos and feature columns are taken from the parse cache.
+
+        RETURNS
+        -------
+        int
+            Number of column cache hits.
+        """
+        return self.__column_hit_count
+
+    def getColumnMissCount(self) -> int:
+        """
+        Returns the number of words whose lemma, universal pos and feature columns are computed.
+
+        RETURNS
+        -------
+        int
+            Number of column cache misses.
+        """
+        return self.__column_miss_count
+
+    def getColumnHitRatio(self) -> float:
+        """
+        Returns the ratio of the column requests answered from the parse cache.
+
+        RETURNS
+        -------
+        float
+            Column cache hit ratio, 0 if no columns are requested.
+        """
+        total = self.__column_hit_count + self.__column_miss_count
+        if total == 0:
+            return 0.0
+        return self.__column_hit_count / total
+
+    def __repr__(self):
+        return f"sentences: {self.__sentence_count} words: {self.__word_count} " \
+               f"column hits: {self.__column_hit_count} column misses: {self.__column_miss_count}"
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+from NamedEntityRecognition.NamedEntityType import NamedEntityType
+
+from AnnotatedSentence.AnnotatedSentence import AnnotatedSentence
+from AnnotatedSentence.AnnotatedWord import AnnotatedWord
+from AnnotatedSentence.ViewLayerType import ViewLayerType
+
+
+class LayerIndex:
+
+    __sentences: list
+    __layers: list
+    __positions: dict
+    __sentence_indexes: dict
+
+    def __init__(self,
+                 sentences: list,
+                 layers: list = None,
+                 listen: bool = True):
+        """
+        Constructor for LayerIndex. A layer index maps each value of the given annotation layers to the positions of
+        the words having that value, so that the words with a given semantic id, predicate, named entity type or
+        shallow parse tag are found without visiting the whole corpus. The index is built in one pass over the
+        sentences. It becomes the listener of the sentences, so that it is kept up to date when a setter of a word
+        changes a layer, or when words are added, removed or replaced. Layers modified without a setter, such as an
+        argument list changed through the object returned by getArgumentList, are not seen by the index.
+
+        Values of a layer are the ones returned by getLayerInfo, with the following exceptions: PROPBANK and FRAMENET
+        values are the individual arguments and frame elements of a word, such as PREDICATE$TUR10-0100 or
+        ARG0$TUR10-0100, NER values are the named entity types as they are written in the sentence files, such
+        as PERSON, PART_OF_SPEECH values are the universal dependency pos of the morphological parse, and
+        DEPENDENCY values are the head and the type of the relation, such as 3$NSUBJ.
+
+        PARAMETERS
+        ----------
+        sentences : list
+            Annotated sentences to be indexed.
+        layers : list
+            Layers to be indexed. If not given, all layers are indexed.
+        listen : bool
+            If False, the index does not become the listener of the sentences and is not updated when they are
+            modified, as for an index used only once.
+        """
+        if layers is None:
+            layers = list(ViewLayerType)
+        self.__sentences = sentences
+        self.__layers = layers
+        self.__positions = {}
+        self.__sentence_indexes = {}
+        for i in range(len(sentences)):
+            sentence = sentences[i]
+            if isinstance(sentence, AnnotatedSentence):
+                self.__sentence_indexes[id(sentence)] = i
+                self.__indexSentence(i, sentence)
+                if listen:
+                    sentence.setListener(self)
+
+    @staticmethod
+    def layerValues(word: AnnotatedWord, layer: ViewLayerType) -> list:
+        """
+        Returns the values of the given layer of the word, as they are kept in the index.
+
+        PARAMETERS
+        ----------
+        word : AnnotatedWord
+            Word whose layer values are requested.
+        layer : ViewLayerType
+            Layer whose values are requested.
+
+        RETURNS
+        -------
+        list
+            Values of the layer, empty if the word does not have the layer.
+        """
+        if layer == ViewLayerType.PROPBANK or layer == ViewLayerType.FRAMENET:
+            # Read from the string form, so that the argument and frame element lists, which may be modified in
+            # place, are neither decoded nor handed out.
+            value = word.getLayerString(layer)
+            if value is None:
+                return []
+            return value.split("#")
+        elif layer == ViewLayerType.NER:
+            named_entity_type = word.getNamedEntityType()
+            if named_entity_type is None:
+                return []
+            return [NamedEntityType.getNamedEntityString(named_entity_type)]
+        elif layer == ViewLayerType.PART_OF_SPEECH:
+            parse = word.getParse()
+            if parse is None:
+                return []
+            return [parse.getUniversalDependencyPos()]
+        try:
+            value = word.getLayerInfo(layer)
+        except AttributeError:
+            # Dependency relations whose type is not a universal dependency type can not be converted to string.
+            return []
+        if value is None:
+            return []
+        return [value]
+
+    def __indexWord(self, sentenceIndex: int, wordIndex: int, word: AnnotatedWord):
+        """
+        Adds the position of the word to the positions of all its values in the indexed layers.
+        """
+        position = (sentenceIndex, wordIndex)
+        for layer in self.__layers:
+            for value in LayerIndex.layerValues(word, layer):
+                key = (layer, value)
+                positions = self.__positions.get(key)
+                if positions is None:
+                    self.__positions[key] = {position}
+                else:
+                    positions.add(position)
+
+    def __indexSentence(self, sentenceIndex: int, sentence: AnnotatedSentence):
+        """
+        Adds the positions of all words of the sentence to the index.
+        """
+        for j in range(len(sentence.words)):
+            word = sentence.words[j]
+            if isinstance(word, AnnotatedWord):
+                self.__indexWord(sentenceIndex, j, word)
+
+    def wordModified(self, sentence: AnnotatedSentence, wordIndex: int):
+        """
+        Called by an indexed sentence after one of its words is modified. The position of the word is added to its
+        new values; the positions kept for its old values are removed when they are next looked up.
+
+        PARAMETERS
+        ----------
+        sentence : AnnotatedSentence
+            Sentence of the modified word.
+        wordIndex : int
+            Index of the modified word in the sentence.
+        """
+        sentence_index = self.__sentence_indexes.get(id(sentence))
+        if sentence_index is not None:
+            self.__indexWord(sentence_index, wordIndex, sentence.words[wordIndex])
+
+    def sentenceModified(self, sentence: AnnotatedSentence):
+        """
+        Called by an indexed sentence after words are added, removed or replaced. Since the positions of the
+        following words may have changed, all words of the sentence are indexed again.
+
+        PARAMETERS
+        ----------
+        sentence : AnnotatedSentence
+            Modified sentence.
+        """
+        sentence_index = self.__sentence_indexes.get(id(sentence))
+        if sentence_index is not None:
+            self.__indexSentence(sentence_index, sentence)
+
+    def __hasValue(self, position: tuple, layer: ViewLayerType, value: str) -> bool:
+        """
+        Checks if the word at the given position still has the given value of the layer.
+        """
+        sentence_index, word_index = position
+        words = self.__sentences[sentence_index].words
+        return word_index < len(words) and value in LayerIndex.layerValues(words[word_index], layer)
+
+    def lookup(self, layer: ViewLayerType, value: str) -> list:
+        """
+        Returns the positions of the words whose given layer has the given value. Positions of words that no longer
+        have the value are removed from the index.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Layer to be searched.
+        value : str
+            Value of the layer.
+
+        RETURNS
+        -------
+        list
+            Sorted list of (sentence index, word index) pairs.
+        """
+        key = (layer, value)
+        positions = self.__positions.get(key)
+        if positions is None:
+            return []
+        stale = [position for position in positions if not self.__hasValue(position, layer, value)]
+        if len(stale) > 0:
+            positions.difference_update(stale)
+            if len(positions) == 0:
+                del self.__positions[key]
+        return sorted(positions)
+
+    def getWords(self, layer: ViewLayerType, value: str) -> list:
+        """
+        Returns the words whose given layer has the given value.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Layer to be searched.
+        value : str
+            Value of the layer.
+
+        RETURNS
+        -------
+        list
+            Words having the value, in the order of the corpus.
+        """
+        return [self.__sentences[i].words[j] for i, j in self.lookup(layer, value)]
+
+    def getValues(self, layer: ViewLayerType) -> list:
+        """
+        Returns the values of the given layer kept in the index. Values whose words have all been modified since the
+        index was built may still be returned, but looking them up gives no positions.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Layer whose values are requested.
+
+        RETURNS
+        -------
+        list
+            Values of the layer.
+        """
+        return [value for key_layer, value in self.__positions if key_layer == layer]
+
+    def getLayers(self) -> list:
+        """
+        Returns the indexed layers.
+
+        RETURNS
+        -------
+        list
+            Indexed layers.
+        """
+        return self.__layers
+
+    def close(self):
+        """
+        Stops updating the index, disconnecting it from the sentences.
+        """
+        for sentence in self.__sentences:
+            if isinstance(sentence, AnnotatedSentence) and sentence.getListener() is self:
+                sentence.setListener(None)
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import numpy as np
+
+from AnnotatedSentence.ColumnarCorpus import ColumnarCorpus
+from AnnotatedSentence.ViewLayerType import ViewLayerType
+
+
+class LayerStatistics:
+
+    __layers: list
+    __pairs: list
+    __file_names: list
+    __word_count: int
+    __counts: dict
+    __co_occurrences: dict
+    __sentence_histograms: dict
+
+    def __init__(self,
+                 layers: list,
+                 pairs: list = None):
+        """
+        Constructor for LayerStatistics. Layer statistics keep, for each given annotation layer, the number of words
+        having each value of the layer, the number of words having each value in each sentence, and, for each given
+        pair of layers, the number of words having each pair of values. The statistics are computed from columnar
+        corpora with array operations, and statistics of consecutive parts of a corpus, such as the shards counted by
+        different processes, are merged with add.
+
+        PARAMETERS
+        ----------
+        layers : list
+            Counted layers. PART_OF_SPEECH is counted as the universal dependency pos of the morphological parse,
+            DEPENDENCY as the dependency label, NER as the named entity type such as PERSON, any other layer as the
+            value returned by getLayerInfo.
+        pairs : list
+            Pairs of layers whose co-occurrences are counted, such as (ViewLayerType.NER,
+            ViewLayerType.SHALLOW_PARSE). Both layers of a pair must be in layers.
+        """
+        self.__layers = layers
+        self.__pairs = [] if pairs is None else [tuple(pair) for pair in pairs]
+        self.__file_names = []
+        self.__word_count = 0
+        self.__counts = {layer: {} for layer in layers}
+        self.__co_occurrences = {pair: {} for pair in self.__pairs}
+        self.__sentence_histograms = {layer: [] for layer in layers}
+
+    @staticmethod
+    def __addCounts(counts: dict, values, valueCounts):
+        """
+        Adds the given counts of the given values to the counts dictionary.
+        """
+        for value, count in zip(values, valueCounts):
+            counts[value] = counts.get(value, 0) + count
+
+    def addColumnarCorpus(self, columns: ColumnarCorpus):
+        """
+        Counts the layer values of the words in the given columnar corpus, which must store all counted layers, and
+        adds the counts to these statistics. The sentences of the columnar corpus follow the sentences counted so far.
+
+        PARAMETERS
+        ----------
+        columns : ColumnarCorpus
+            Columnar corpus to be counted.
+        """
+        self.__file_names.extend(columns.getFileNames())
+        self.__word_count += columns.wordCount()
+        sentence_count = columns.sentenceCount()
+        sentence_indexes = columns.getSentenceIndexes()
+        for layer in self.__layers:
+            codes = columns.getCodes(layer).astype(np.int64)
+            vocabulary = columns.getVocabulary(layer)
+            counts = np.bincount(codes[codes >= 0], minlength=len(vocabulary))
+            nonzero = np.flatnonzero(counts)
+            LayerStatistics.__addCounts(self.__counts[layer], [vocabulary[i] for i in nonzero],
+                                        counts[nonzero].tolist())
+            histograms = [{} for i in range(sentence_count)]
+            keys, key_counts = np.unique(sentence_indexes[codes >= 0] * len(vocabulary) + codes[codes >= 0],
+                                         return_counts=True)
+            for key, count in zip(keys.tolist(), key_counts.tolist()):
+                histograms[key // len(vocabulary)][vocabulary[key % len(vocabulary)]] = count
+            self.__sentence_histograms[layer].extend(histograms)
+        for pair in self.__pairs:
+            codes1 = columns.getCodes(pair[0]).astype(np.int64)
+            codes2 = columns.getCodes(pair[1]).astype(np.int64)
+            vocabulary1 = columns.getVocabulary(pair[0])
+            vocabulary2 = columns.getVocabulary(pair[1])
+            both = (codes1 >= 0) & (codes2 >= 0)
+            keys, key_counts = np.unique(codes1[both] * len(vocabulary2) + codes2[both], return_counts=True)
+            LayerStatistics.__addCounts(self.__co_occurrences[pair],
+                                        [(vocabulary1[key // len(vocabulary2)], vocabulary2[key % len(vocabulary2)])
+                                         for key in keys.tolist()],
+                                        key_counts.tolist())
+
+    def add(self, statistics: LayerStatistics):
+        """
+        Adds the counts of the given statistics, which must count the same layers and pairs, to these statistics.
+        The sentences of the given statistics follow the sentences counted so far.
+
+        PARAMETERS
+        ----------
+        statistics : LayerStatistics
+            Statistics to be added.
+        """
+        self.__file_names.extend(statistics.getFileNames())
+        self.__word_count += statistics.wordCount()
+        for layer in self.__layers:
+            counts = statistics.getCounts(layer)
+            LayerStatistics.__addCounts(self.__counts[layer], counts.keys(), counts.values())
+            self.__sentence_histograms[layer].extend(statistics.getSentenceHistograms(layer))
+        for pair in self.__pairs:
+            counts = statistics.getCoOccurrences(pair[0], pair[1])
+            LayerStatistics.__addCounts(self.__co_occurrences[pair], counts.keys(), counts.values())
+
+    def getLayers(self) -> list:
+        """
+        Returns the counted layers.
+
+        RETURNS
+        -------
+        list
+            Counted layers.
+        """
+        return self.__layers
+
+    def getFileNames(self) -> list:
+        """
+        Returns the file names of the counted sentences, in the order they are counted.
+
+        RETURNS
+        -------
+        list
+            File names of the sentences.
+        """
+        return self.__file_names
+
+    def sentenceCount(self) -> int:
+        """
+        Returns the number of counted sentences.
+
+        RETURNS
+        -------
+        int
+            Number of sentences.
+        """
+        return len(self.__file_names)
+
+    def wordCount(self) -> int:
+        """
+        Returns the number of counted words.
+
+        RETURNS
+        -------
+        int
+            Number of words.
+        """
+        return self.__word_count
+
+    def getCounts(self, layer: ViewLayerType) -> dict:
+        """
+        Returns the number of words having each value of the given layer.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Counted layer.
+
+        RETURNS
+        -------
+        dict
+            Number of words for each value of the layer. Values no word has are not included.
+        """
+        return self.__counts[layer]
+
+    def getCoOccurrences(self, layer1: ViewLayerType, layer2: ViewLayerType) -> dict:
+        """
+        Returns the number of words having each pair of values of the given layers.
+
+        PARAMETERS
+        ----------
+        layer1 : ViewLayerType
+            First layer of a counted pair.
+        layer2 : ViewLayerType
+            Second layer of a counted pair.
+
+        RETURNS
+        -------
+        dict
+            Number of words for each (value of layer1, value of layer2) pair.
+        """
+        return self.__co_occurrences[(layer1, layer2)]
+
+    def getSentenceHistograms(self, layer: ViewLayerType) -> list:
+        """
+        Returns the number of words having each value of the given layer in each sentence.
+
+        PARAMETERS
+        ----------
+        layer : ViewLayerType
+            Counted layer.
+
+        RETURNS
+        -------
+        list
+            Dictionary of the value counts of each sentence, in the order of the sentences.
+        """
+        return self.__sentence_histograms[layer]
+
+    def getSentenceHistogram(self, sentenceIndex: int, layer: ViewLayerType) -> dict:
+        """
+        Returns the number of words having each value of the given layer in the given sentence.
+
+        PARAMETERS
+        ----------
+        sentenceIndex : int
+            Index of the sentence.
+        layer : ViewLayerType
+            Counted layer.
+
+        RETURNS
+        -------
+        dict
+            Number of words of the sentence for each value of the layer.
+        """
+        return self.__sentence_histograms[layer][sentenceIndex]
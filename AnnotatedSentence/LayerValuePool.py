@@ -0,0 +1,41 @@
+class LayerValuePool:
+
+    __values: dict
+
+    def __init__(self):
+        """
+        Constructor for LayerValuePool. A layer value pool keeps one copy of each distinct layer value, such as a
+        semantic id, a shallow parse tag or a surface form, so that the words of a corpus sharing the same value
+        refer to the same string object.
+        """
+        self.__values = {}
+
+    def intern(self, value: str) -> str:
+        """
+        Returns the pooled copy of the given value. If the value is not in the pool, it is added and returned as it
+        is.
+
+        PARAMETERS
+        ----------
+        value : str
+            Layer value to be pooled.
+
+        RETURNS
+        -------
+        str
+            The pooled string equal to the given value.
+        """
+        if value is None:
+            return None
+        return self.__values.setdefault(value, value)
+
+    def size(self) -> int:
+        """
+        Returns the number of distinct values in the pool.
+
+        RETURNS
+        -------
+        int
+            Number of distinct values in the pool.
+        """
+        return len(self.__values)
@@ -0,0 +1,205 @@
+from DataStructure.Cache.LRUCache import LRUCache
+from MorphologicalAnalysis.MorphologicalParse import MorphologicalParse
+
+
+class ParseCache:
+
+    __cache: LRUCache
+    __column_cache: LRUCache
+    __cache_size: int
+    __hit_count: int
+    __miss_count: int
+    __column_hit_count: int
+    __column_miss_count: int
+
+    def __init__(self, cacheSize: int = 100000):
+        """
+        Constructor for ParseCache. A parse cache keeps the most recently used morphological parses with their string
+        forms as keys, so that words having the same analysis share one MorphologicalParse object instead of parsing
+        the same string again. Only morphological parses are cached: MorphologicalParse has no methods modifying it,
+        therefore a cached parse is shared as it is and AnnotatedWord.setParse always replaces the parse of a word.
+        Metamorphic parses, argument lists and frame element lists are modified in place through their own methods,
+        so each word builds its own copy of them and they are never put in the cache. Together with each parse, its
+        string form is cached, so that writing the words does not convert the same parse to string again, and the
+        lemma, universal pos and feature columns of its connlu form are cached as well.
+
+        PARAMETERS
+        ----------
+        cacheSize : int
+            Maximum number of parses kept in the cache. If it is 0, nothing is cached.
+        """
+        self.__cache_size = cacheSize
+        self.__cache = LRUCache(cacheSize)
+        self.__column_cache = LRUCache(cacheSize)
+        self.__hit_count = 0
+        self.__miss_count = 0
+        self.__column_hit_count = 0
+        self.__column_miss_count = 0
+
+    def getMorphologicalParse(self, parse: str) -> MorphologicalParse:
+        """
+        Returns the morphological parse of the given string. If the parse is in the cache it is returned, otherwise
+        the string is parsed and the result is added to the cache.
+
+        PARAMETERS
+        ----------
+        parse : str
+            Morphological parse in string form such as ölçek+NOUN+A3SG+PNON+NOM^DB+ADJ+WITH
+
+        RETURNS
+        -------
+        MorphologicalParse
+            Morphological parse of the string.
+        """
+        return self.getParseAndString(parse)[0]
+
+    def getParseAndString(self, parse: str) -> tuple:
+        """
+        Returns the morphological parse of the given string together with the string form of that parse, which is
+        the value its __str__ method returns. If the parse is in the cache both are returned from the cache,
+        otherwise the string is parsed and the result is added to the cache.
+
+        PARAMETERS
+        ----------
+        parse : str
+            Morphological parse in string form such as ölçek+NOUN+A3SG+PNON+NOM^DB+ADJ+WITH
+
+        RETURNS
+        -------
+        tuple
+            Morphological parse of the string and its string form. If caching is disabled, the string form is None.
+        """
+        if self.__cache_size == 0:
+            self.__miss_count = self.__miss_count + 1
+            return MorphologicalParse(parse), None
+        result = self.__cache.get(parse)
+        if result is not None:
+            self.__hit_count = self.__hit_count + 1
+            return result
+        self.__miss_count = self.__miss_count + 1
+        morphological_parse = MorphologicalParse(parse)
+        parse_string = morphological_parse.__str__()
+        if parse_string == parse:
+            parse_string = parse
+        result = (morphological_parse, parse_string)
+        self.__cache.add(parse, result)
+        return result
+
+    @staticmethod
+    def universalDependencyColumns(parse: MorphologicalParse) -> str:
+        """
+        Returns the lemma, universal pos, language specific pos and feature columns of the connlu form of a word
+        with the given morphological parse, separated by tabs.
+
+        PARAMETERS
+        ----------
+        parse : MorphologicalParse
+            Morphological parse of the word.
+
+        RETURNS
+        -------
+        str
+            Lemma, universal pos, language specific pos and feature columns.
+        """
+        u_pos = parse.getUniversalDependencyPos()
+        features = parse.getUniversalDependencyFeatures(u_pos)
+        if len(features) == 0:
+            return parse.getWord().getName() + "\t" + u_pos + "\t_\t_"
+        return parse.getWord().getName() + "\t" + u_pos + "\t_\t" + "|".join(features)
+
+    def getUniversalDependencyColumns(self, parse: str, morphologicalParse: MorphologicalParse = None) -> str:
+        """
+        Returns the lemma, universal pos, language specific pos and feature columns of the connlu form of a word
+        with the given morphological parse. Since these only depend on the parse, they are computed once for each
+        parse string and kept in the cache, shared by all words and all exports.
+
+        PARAMETERS
+        ----------
+        parse : str
+            Morphological parse in string form such as ölçek+NOUN+A3SG+PNON+NOM^DB+ADJ+WITH
+        morphologicalParse : MorphologicalParse
+            The parse itself. If not given, it is taken from the cache when the columns are computed.
+
+        RETURNS
+        -------
+        str
+            Lemma, universal pos, language specific pos and feature columns, separated by tabs.
+        """
+        if self.__cache_size != 0:
+            result = self.__column_cache.get(parse)
+            if result is not None:
+                self.__column_hit_count = self.__column_hit_count + 1
+                return result
+        self.__column_miss_count = self.__column_miss_count + 1
+        if morphologicalParse is None:
+            morphologicalParse = self.getMorphologicalParse(parse)
+        result = ParseCache.universalDependencyColumns(morphologicalParse)
+        if self.__cache_size != 0:
+            self.__column_cache.add(parse, result)
+        return result
+
+    def getColumnHitCount(self) -> int:
+        """
+        Returns the number of connlu column requests answered from the cache.
+
+        RETURNS
+        -------
+        int
+            Number of column cache hits.
+        """
+        return self.__column_hit_count
+
+    def getColumnMissCount(self) -> int:
+        """
+        Returns the number of connlu column requests that required computing the universal pos and features.
+
+        RETURNS
+        -------
+        int
+            Number of column cache misses.
+        """
+        return self.__column_miss_count
+
+    def getHitCount(self) -> int:
+        """
+        Returns the number of requests answered from the cache.
+
+        RETURNS
+        -------
+        int
+            Number of cache hits.
+        """
+        return self.__hit_count
+
+    def getMissCount(self) -> int:
+        """
+        Returns the number of requests that required parsing.
+
+        RETURNS
+        -------
+        int
+            Number of cache misses.
+        """
+        return self.__miss_count
+
+    def getCacheSize(self) -> int:
+        """
+        Returns the maximum number of parses kept in the cache.
+
+        RETURNS
+        -------
+        int
+            Maximum number of parses kept in the cache.
+        """
+        return self.__cache_size
+
+    def clear(self):
+        """
+        Removes all parses and connlu columns from the cache and resets the hit and miss counts.
+        """
+        self.__cache = LRUCache(self.__cache_size)
+        self.__column_cache = LRUCache(self.__cache_size)
+        self.__hit_count = 0
+        self.__miss_count = 0
+        self.__column_hit_count = 0
+        self.__column_miss_count = 0
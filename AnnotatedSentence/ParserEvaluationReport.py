@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import numpy as np
+from DependencyParser.ParserEvaluationScore import ParserEvaluationScore
+
+from AnnotatedSentence.ColumnarCorpus import ColumnarCorpus
+from AnnotatedSentence.ViewLayerType import ViewLayerType
+
+
+class ParserEvaluationReport:
+
+    __length_bucket_size: int
+    __sentence_count: int
+    __counts: np.ndarray
+    __label_counts: dict
+    __pos_counts: dict
+    __length_counts: dict
+
+    def __init__(self, lengthBucketSize: int = 10):
+        """
+        Constructor for ParserEvaluationReport. A parser evaluation report keeps the number of evaluated words, and the
+        number of words with a correct head, a correct head and label, and a correct label, for the whole corpus and
+        separately for each gold dependency label, each gold universal dependency pos and each range of gold sentence
+        lengths. The i'th words of the i'th sentences are compared, so both corpora must have the same number of
+        sentences and corresponding sentences the same number of words; only the words having a dependency relation
+        in both corpora are evaluated. The counts are computed from columnar corpora with array operations, and
+        reports of consecutive parts of a corpus are merged with add.
+
+        PARAMETERS
+        ----------
+        lengthBucketSize : int
+            Number of different sentence lengths in a range of sentence lengths. The sentences with 1 to
+            lengthBucketSize words are in the first range, the next lengthBucketSize lengths in the second range, and
+            so on.
+        """
+        self.__length_bucket_size = lengthBucketSize
+        self.__sentence_count = 0
+        self.__counts = np.zeros(4, dtype=np.int64)
+        self.__label_counts = {}
+        self.__pos_counts = {}
+        self.__length_counts = {}
+
+    @staticmethod
+    def __addCounts(counts: dict, keys: list, keyCounts: np.ndarray):
+        """
+        Adds the rows of the given count matrix to the counts of the given keys in the counts dictionary.
+        """
+        for key, row in zip(keys, keyCounts):
+            if row[0] > 0:
+                if key in counts:
+                    counts[key] = counts[key] + row
+                else:
+                    counts[key] = row.copy()
+
+    @staticmethod
+    def __countByKey(keys: np.ndarray, keyCount: int, correct: list) -> np.ndarray:
+        """
+        Returns a matrix whose k'th row contains the number of words with key k, and the number of correct words of
+        each given correctness array among them. Words with a negative key are not counted.
+        """
+        counted = keys >= 0
+        keys = keys[counted]
+        result = np.zeros((keyCount, 1 + len(correct)), dtype=np.int64)
+        result[:, 0] = np.bincount(keys, minlength=keyCount)
+        for k in range(len(correct)):
+            result[:, k + 1] = np.bincount(keys, weights=correct[k][counted], minlength=keyCount)
+        return result
+
+    def addColumnarCorpora(self, gold: ColumnarCorpus, predicted: ColumnarCorpus):
+        """
+        Compares the dependency layers of the given columnar corpora and adds the counts to this report. The gold
+        corpus must store the DEPENDENCY and PART_OF_SPEECH layers, the predicted corpus the DEPENDENCY layer. Since
+        the gold corpus is not modified, it can be built once and compared with the outputs of many parsers. A word
+        whose gold label is not a known universal dependency type is never counted as correctly labelled.
+
+        PARAMETERS
+        ----------
+        gold : ColumnarCorpus
+            Columnar corpus of the gold sentences.
+        predicted : ColumnarCorpus
+            Columnar corpus of the parsed sentences.
+
+        RAISES
+        ------
+        ValueError
+            If the corpora have a different number of sentences, or two corresponding sentences have a different
+            number of words.
+        """
+        if gold.sentenceCount() != predicted.sentenceCount():
+            raise ValueError("Compared corpora have a different number of sentences")
+        lengths = gold.getSentenceLengths()
+        if not np.array_equal(lengths, predicted.getSentenceLengths()):
+            index = int(np.flatnonzero(lengths != predicted.getSentenceLengths())[0])
+            raise ValueError(f"Compared sentences {index} have a different number of words")
+        sentence_count = gold.sentenceCount()
+        self.__sentence_count += sentence_count
+        gold_offsets = gold.getSentenceOffsets()[:sentence_count]
+        predicted_offsets = predicted.getSentenceOffsets()[:sentence_count]
+        gold_lengths = lengths
+        positions = np.arange(int(lengths.sum())) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        gold_words = np.repeat(gold_offsets, lengths) + positions
+        predicted_words = np.repeat(predicted_offsets, lengths) + positions
+        gold_heads = gold.getHeads()[gold_words]
+        predicted_heads = predicted.getHeads()[predicted_words]
+        evaluated = (gold_heads >= 0) & (predicted_heads >= 0)
+        gold_words = gold_words[evaluated]
+        predicted_words = predicted_words[evaluated]
+        gold_labels = gold.getCodes(ViewLayerType.DEPENDENCY)[gold_words].astype(np.int64)
+        vocabulary = gold.getVocabulary(ViewLayerType.DEPENDENCY)
+        label_codes = {vocabulary[i]: i for i in range(len(vocabulary))}
+        # Predicted labels are mapped to the codes of the gold vocabulary; labels not in it, and words without a
+        # known label, get -2, which is never equal to a gold code.
+        label_map = np.array([label_codes.get(label, -2) for label in predicted.getVocabulary(ViewLayerType.DEPENDENCY)]
+                             + [-2], dtype=np.int64)
+        predicted_labels = label_map[predicted.getCodes(ViewLayerType.DEPENDENCY)[predicted_words]]
+        unlabelled = gold_heads[evaluated] == predicted_heads[evaluated]
+        label = (gold_labels >= 0) & (gold_labels == predicted_labels)
+        correct = [unlabelled, unlabelled & label, label]
+        self.__counts += [len(gold_words)] + [int(np.count_nonzero(array)) for array in correct]
+        ParserEvaluationReport.__addCounts(self.__label_counts, vocabulary,
+                                           ParserEvaluationReport.__countByKey(gold_labels, len(vocabulary), correct))
+        pos_vocabulary = gold.getVocabulary(ViewLayerType.PART_OF_SPEECH)
+        ParserEvaluationReport.__addCounts(self.__pos_counts, pos_vocabulary,
+                                           ParserEvaluationReport.__countByKey(
+                                               gold.getCodes(ViewLayerType.PART_OF_SPEECH)[gold_words].astype(np.int64),
+                                               len(pos_vocabulary), correct))
+        buckets = (np.repeat(gold_lengths, lengths)[evaluated] - 1) // self.__length_bucket_size
+        bucket_count = int(buckets.max()) + 1 if len(buckets) > 0 else 0
+        ParserEvaluationReport.__addCounts(self.__length_counts,
+                                           [(k * self.__length_bucket_size + 1, (k + 1) * self.__length_bucket_size)
+                                            for k in range(bucket_count)],
+                                           ParserEvaluationReport.__countByKey(buckets, bucket_count, correct))
+
+    def add(self, report: ParserEvaluationReport):
+        """
+        Adds the counts of the given report, which must use the same sentence length ranges, to this report.
+
+        PARAMETERS
+        ----------
+        report : ParserEvaluationReport
+            Report to be added.
+        """
+        self.__sentence_count += report.sentenceCount()
+        self.__counts += report.__counts
+        for counts, other_counts in [(self.__label_counts, report.__label_counts),
+                                     (self.__pos_counts, report.__pos_counts),
+                                     (self.__length_counts, report.__length_counts)]:
+            ParserEvaluationReport.__addCounts(counts, list(other_counts.keys()), list(other_counts.values()))
+
+    @staticmethod
+    def __toScore(counts: np.ndarray) -> ParserEvaluationScore:
+        """
+        Converts a row of counts to a parser evaluation score.
+        """
+        word_count = int(counts[0])
+        if word_count == 0:
+            return ParserEvaluationScore()
+        return ParserEvaluationScore(float(counts[2] / word_count), float(counts[1] / word_count),
+                                     float(counts[3] / word_count), word_count)
+
+    def sentenceCount(self) -> int:
+        """
+        Returns the number of compared sentences.
+
+        RETURNS
+        -------
+        int
+            Number of sentences.
+        """
+        return self.__sentence_count
+
+    def wordCount(self) -> int:
+        """
+        Returns the number of evaluated words.
+
+        RETURNS
+        -------
+        int
+            Number of words having a dependency relation in both corpora.
+        """
+        return int(self.__counts[0])
+
+    def getScore(self) -> ParserEvaluationScore:
+        """
+        Returns the scores of all evaluated words, which are equal to the scores compareParses returns.
+
+        RETURNS
+        -------
+        ParserEvaluationScore
+            LAS, UAS and LS of the corpus.
+        """
+        return ParserEvaluationReport.__toScore(self.__counts)
+
+    def getScoresByLabel(self) -> dict:
+        """
+        Returns the scores of the words having each gold dependency label.
+
+        RETURNS
+        -------
+        dict
+            Parser evaluation score of each dependency label.
+        """
+        return {label: ParserEvaluationReport.__toScore(counts) for label, counts in self.__label_counts.items()}
+
+    def getScoresByPos(self) -> dict:
+        """
+        Returns the scores of the words having each gold universal dependency pos.
+
+        RETURNS
+        -------
+        dict
+            Parser evaluation score of each universal dependency pos.
+        """
+        return {pos: ParserEvaluationReport.__toScore(counts) for pos, counts in self.__pos_counts.items()}
+
+    def getScoresBySentenceLength(self) -> dict:
+        """
+        Returns the scores of the words in the sentences whose gold length is in each range of sentence lengths.
+
+        RETURNS
+        -------
+        dict
+            Parser evaluation score of each (shortest length, longest length) range, in increasing order.
+        """
+        return {lengths: ParserEvaluationReport.__toScore(self.__length_counts[lengths])
+                for lengths in sorted(self.__length_counts)}
+
+    def __repr__(self):
+        score = self.getScore()
+        return f"sentences: {self.__sentence_count} words: {score.getWordCount()} " \
+               f"LAS: {round(score.getLAS(), 4)} UAS: {round(score.getUAS(), 4)} LS: {round(score.getLS(), 4)}"
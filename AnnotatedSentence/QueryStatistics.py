@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+
+class QueryStatistics:
+
+    __sentence_count: int
+    __candidate_count: int
+    __match_count: int
+    __index_used: bool
+    __elapsed_time: float
+
+    def __init__(self,
+                 sentenceCount: int = 0,
+                 candidateCount: int = 0,
+                 matchCount: int = 0,
+                 indexUsed: bool = False,
+                 elapsedTime: float = 0.0):
+        """
+        Constructor for QueryStatistics. Keeps the number of sentences visited by a run of a CorpusQuery, the number
+        of them that are matched against the word patterns, the number of matches found, whether the candidate
+        sentences are taken from a layer index, and the time the run took.
+
+        PARAMETERS
+        ----------
+        sentenceCount : int
+            Number of sentences in the corpus.
+        candidateCount : int
+            Number of sentences matched against the word patterns.
+        matchCount : int
+            Number of matches found.
+        indexUsed : bool
+            True if the candidate sentences are taken from a layer index.
+        elapsedTime : float
+            Duration of the run in seconds.
+        """
+        self.__sentence_count = sentenceCount
+        self.__candidate_count = candidateCount
+        self.__match_count = matchCount
+        self.__index_used = indexUsed
+        self.__elapsed_time = elapsedTime
+
+    def getSentenceCount(self) -> int:
+        """
+        Returns the number of sentences in the corpus.
+
+        RETURNS
+        -------
+        int
+            Number of sentences in the corpus.
+        """
+        return self.__sentence_count
+
+    def getCandidateCount(self) -> int:
+        """
+        Returns the number of sentences matched against the word patterns.
+
+        RETURNS
+        -------
+        int
+            Number of candidate sentences.
+        """
+        return self.__candidate_count
+
+    def getMatchCount(self) -> int:
+        """
+        Returns the number of matches found.
+
+        RETURNS
+        -------
+        int
+            Number of matches.
+        """
+        return self.__match_count
+
+    def isIndexUsed(self) -> bool:
+        """
+        Checks if the candidate sentences are taken from a layer index.
+
+        RETURNS
+        -------
+        bool
+            True if a layer index is used, False if all sentences are visited.
+        """
+        return self.__index_used
+
+    def getElapsedTime(self) -> float:
+        """
+        Returns the duration of the run.
+
+        RETURNS
+        -------
+        float
+            Duration of the run in seconds.
+        """
+        return self.__elapsed_time
+
+    def __repr__(self):
+        return f"sentences: {self.__sentence_count} candidates: {self.__candidate_count} " \
+               f"matches: {self.__match_count} index used: {self.__index_used} " \
+               f"time: {round(self.__elapsed_time * 1000, 3)} ms"
@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+from collections import deque
+
+from AnnotatedSentence.AbstractAnnotatedCorpus import AbstractAnnotatedCorpus
+from AnnotatedSentence.AnnotatedSentence import AnnotatedSentence
+from AnnotatedSentence.AnnotatedWord import AnnotatedWord
+
+
+class UniversalDependencyCorpusStream(AbstractAnnotatedCorpus):
+
+    __file_name: str
+    __lazy: bool
+    __worker_count: int
+    __chunk_size: int
+    __file: object
+    __sentence_index: int
+
+    pos_tags = {"NOUN": "NOUN",
+                "PROPN": "NOUN+PROP",
+                "ADJ": "ADJ",
+                "ADV": "ADV",
+                "VERB": "VERB",
+                "PUNCT": "PUNC",
+                "DET": "DET",
+                "NUM": "NUM+CARD",
+                "PRON": "PRON",
+                "ADP": "POSTP",
+                "CCONJ": "CONJ",
+                "SCONJ": "CONJ",
+                "INTJ": "INTERJ"}
+
+    question_lemmas = {"mi", "mı", "mu", "mü"}
+
+    case_tags = {"Nom": "NOM", "Acc": "ACC", "Dat": "DAT", "Gen": "GEN", "Loc": "LOC", "Ins": "INS", "Abl": "ABL",
+                 "Equ": "EQU"}
+
+    pronoun_tags = {"Prs": "PERS", "Dem": "DEMONSP", "Int": "QUESP"}
+
+    mood_tags = {"Imp": "IMP", "Opt": "OPT", "Cnd": "COND", "Nec": "NECES", "Des": "DESR"}
+
+    def __init__(self,
+                 fileName: str,
+                 lazy: bool = False,
+                 workerCount: int = 1,
+                 chunkSize: int = 256):
+        """
+        Constructor for UniversalDependencyCorpusStream. Reads a treebank in connlu format as annotated sentences,
+        one sentence at a time, so that files of any size are read in constant memory. Files ending with .gz, .bz2 or
+        .xz are decompressed while they are read.
+
+        Each word gets its surface form, a morphological parse built from its lemma, universal pos and features, and
+        its universal dependency relation. The morphological parse consists of the root tags of the universal pos,
+        the agreement, possessive and case tags of nominals, and the polarity, tense, mood and agreement tags of
+        finite verbs; features that can not be expressed with these tags are not kept. Words with the universal pos
+        X, SYM or PART, and auxiliaries other than the question particle and değil, get no morphological parse.
+        Dependency subtypes may be written either as nmod:poss or as nmod_poss. Multiword token and empty node lines
+        are skipped. The sentence id given in a sent_id comment is used as the file name of the sentence.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the file in connlu format.
+        lazy : bool
+            If True, object valued annotation layers of the words are converted only when they are first accessed.
+        workerCount : int
+            Number of processes converting the sentences while iterating. If it is larger than 1, the sentences are
+            read in chunks and each chunk is converted by one of the worker processes; the sentences are returned in
+            the order of the file.
+        chunkSize : int
+            Number of sentences converted by a worker process in one task.
+        """
+        self.file_name = fileName
+        self.__file_name = fileName
+        self.__lazy = lazy
+        self.__worker_count = workerCount
+        self.__chunk_size = chunkSize
+        self.__file = None
+        self.__sentence_index = 0
+
+    @staticmethod
+    def __features(features: str) -> dict:
+        """
+        Splits the feature column of a word into a dictionary of feature names and values.
+        """
+        result = {}
+        if features != "_":
+            for feature in features.split("|"):
+                index = feature.find("=")
+                if index != -1:
+                    result[feature[:index]] = feature[index + 1:]
+        return result
+
+    @staticmethod
+    def __agreement(person: str, number: str) -> str:
+        """
+        Returns the agreement or possessive agreement suffix of the given person and number features.
+        """
+        return (person if person is not None else "3") + ("PL" if number == "Plur" else "SG")
+
+    @staticmethod
+    def morphologicalParseString(lemma: str, universalPos: str, features: str) -> str:
+        """
+        Converts the lemma, universal pos and feature columns of a word into a morphological parse in string form.
+
+        PARAMETERS
+        ----------
+        lemma : str
+            Lemma of the word.
+        universalPos : str
+            Universal pos of the word.
+        features : str
+            Features of the word in connlu format, such as Case=Nom|Number=Sing|Person=3.
+
+        RETURNS
+        -------
+        str
+            Morphological parse such as ev+NOUN+A3SG+PNON+NOM, None if the universal pos has no corresponding tag.
+        """
+        if universalPos == "AUX":
+            # Only the question particle and değil have a root tag; copulas such as i and ol get no parse.
+            if lemma == "değil":
+                root_tag = "VERB"
+            elif lemma in UniversalDependencyCorpusStream.question_lemmas:
+                root_tag = "QUES"
+            else:
+                root_tag = None
+        else:
+            root_tag = UniversalDependencyCorpusStream.pos_tags.get(universalPos)
+        if root_tag is None or lemma == "_":
+            return None
+        feature_map = UniversalDependencyCorpusStream.__features(features)
+        tags = [lemma, root_tag]
+        if universalPos == "NUM" and feature_map.get("NumType") == "Ord":
+            tags[1] = "NUM+ORD"
+        elif universalPos == "NOUN" or universalPos == "PROPN" or universalPos == "PRON":
+            if universalPos == "PRON":
+                if feature_map.get("Reflex") == "Yes":
+                    tags.append("REFLEXP")
+                elif feature_map.get("PronType") in UniversalDependencyCorpusStream.pronoun_tags:
+                    tags.append(UniversalDependencyCorpusStream.pronoun_tags[feature_map["PronType"]])
+            tags.append("A" + UniversalDependencyCorpusStream.__agreement(feature_map.get("Person"),
+                                                                          feature_map.get("Number")))
+            if "Person[psor]" in feature_map or "Number[psor]" in feature_map:
+                tags.append("P" + UniversalDependencyCorpusStream.__agreement(feature_map.get("Person[psor]"),
+                                                                              feature_map.get("Number[psor]")))
+            else:
+                tags.append("PNON")
+            tags.append(UniversalDependencyCorpusStream.case_tags.get(feature_map.get("Case"), "NOM"))
+        elif root_tag == "VERB":
+            tags.append("NEG" if feature_map.get("Polarity") == "Neg" else "POS")
+            if feature_map.get("VerbForm", "Fin") == "Fin":
+                tense = feature_map.get("Tense")
+                aspect = feature_map.get("Aspect")
+                if aspect == "Prog":
+                    tags.append("PROG1")
+                    if tense == "Past":
+                        tags.append("PAST")
+                elif aspect == "Hab":
+                    tags.append("AOR")
+                elif tense == "Fut":
+                    tags.append("FUT")
+                elif tense == "Pqp":
+                    tags.append("NARR+PAST")
+                elif tense == "Past":
+                    tags.append("NARR" if feature_map.get("Evident") == "Nfh" else "PAST")
+                elif feature_map.get("Mood") in UniversalDependencyCorpusStream.mood_tags:
+                    tags.append(UniversalDependencyCorpusStream.mood_tags[feature_map["Mood"]])
+                if "Person" in feature_map:
+                    tags.append("A" + UniversalDependencyCorpusStream.__agreement(feature_map.get("Person"),
+                                                                                  feature_map.get("Number")))
+        return "+".join(tags)
+
+    @staticmethod
+    def sentenceLayers(lines: list) -> tuple:
+        """
+        Converts the lines of a sentence in connlu format into the sentence id and the layers of its words, in the
+        form accepted by the AnnotatedWord constructor. Used by the worker processes of the parallel read, since
+        the layers are transferred to the parent process much faster than the words.
+
+        PARAMETERS
+        ----------
+        lines : list
+            Comment and word lines of the sentence without the new line characters.
+
+        RETURNS
+        -------
+        tuple
+            Sentence id, None if there is no sent_id comment, and the list of the layers of each word.
+        """
+        sentence_id = None
+        words = []
+        for line in lines:
+            if line.startswith("#"):
+                if line.startswith("# sent_id = "):
+                    sentence_id = line[12:].strip()
+                continue
+            items = line.split("\t")
+            if len(items) < 8 or not items[0].isdigit():
+                continue
+            layers = [("turkish", items[1])]
+            parse = UniversalDependencyCorpusStream.morphologicalParseString(items[2], items[3], items[5])
+            if parse is not None:
+                layers.append(("morphologicalAnalysis", parse))
+            if items[6].isdigit() and items[7] != "_":
+                # Subtypes are accepted both as nmod:poss and as nmod_poss, the form exportUniversalDependencyFormat
+                # writes.
+                layers.append(("universalDependency", items[6] + "$" + items[7].replace("_", ":").upper()))
+            words.append(layers)
+        return sentence_id, words
+
+    @staticmethod
+    def sentenceLayersOfChunk(chunk: list) -> list:
+        """
+        Converts the sentences of a chunk with sentenceLayers. Used by the worker processes of the parallel read.
+
+        PARAMETERS
+        ----------
+        chunk : list
+            Lines of each sentence in the chunk.
+
+        RETURNS
+        -------
+        list
+            Sentence id and word layers of each sentence.
+        """
+        return [UniversalDependencyCorpusStream.sentenceLayers(lines) for lines in chunk]
+
+    def __createSentence(self, sentenceLayers: tuple) -> AnnotatedSentence:
+        """
+        Creates the annotated sentence with the given sentence id and word layers. Sentences without a sent_id
+        comment are named after their order in the file.
+        """
+        self.__sentence_index = self.__sentence_index + 1
+        sentence_id, words = sentenceLayers
+        if sentence_id is None:
+            sentence_id = str(self.__sentence_index)
+        sentence = AnnotatedSentence(fileName=sentence_id)
+        for layers in words:
+            sentence.addWord(AnnotatedWord(layers, lazy=self.__lazy))
+        sentence.clearModified()
+        return sentence
+
+    @staticmethod
+    def __nextSentenceLines(file) -> list:
+        """
+        Reads the lines of the next sentence from the file, skipping empty lines before it. Returns None at the end of
+        the file.
+        """
+        lines = []
+        for line in file:
+            line = line.rstrip("\r\n")
+            if line == "":
+                if len(lines) > 0:
+                    return lines
+            else:
+                lines.append(line)
+        if len(lines) > 0:
+            return lines
+        return None
+
+    def open(self):
+        """
+        Implements open method in AbstractCorpus. Opens the file and initializes the sentence pointer to zero.
+        """
+        self.__file = AbstractAnnotatedCorpus.openInputFile(self.__file_name)
+        self.__sentence_index = 0
+
+    def close(self):
+        """
+        Implements close method in AbstractCorpus. Closes the file.
+        """
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    def getNextSentence(self) -> AnnotatedSentence:
+        """
+        Implements getNextSentence method in AbstractCorpus. Reads the next sentence from the file. If there are no
+        sentences to be read, returns None.
+        :return: Next read sentence or None.
+        """
+        lines = UniversalDependencyCorpusStream.__nextSentenceLines(self.__file)
+        if lines is None:
+            return None
+        return self.__createSentence(UniversalDependencyCorpusStream.sentenceLayers(lines))
+
+    def __chunks(self, file):
+        """
+        Reads the lines of the sentences in the file as lists of at most chunkSize sentences.
+        """
+        chunk = []
+        lines = UniversalDependencyCorpusStream.__nextSentenceLines(file)
+        while lines is not None:
+            chunk.append(lines)
+            if len(chunk) == self.__chunk_size:
+                yield chunk
+                chunk = []
+            lines = UniversalDependencyCorpusStream.__nextSentenceLines(file)
+        if len(chunk) > 0:
+            yield chunk
+
+    def __iter__(self):
+        """
+        Iterates over the sentences of the file in order. If the worker count is larger than 1, the sentences are
+        converted by worker processes, keeping at most two chunks per worker in memory.
+        """
+        self.open()
+        if self.__worker_count > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=self.__worker_count) as executor:
+                pending = deque()
+                for chunk in self.__chunks(self.__file):
+                    pending.append(executor.submit(UniversalDependencyCorpusStream.sentenceLayersOfChunk, chunk))
+                    if len(pending) > 2 * self.__worker_count:
+                        for sentence_layers in pending.popleft().result():
+                            yield self.__createSentence(sentence_layers)
+                while len(pending) > 0:
+                    for sentence_layers in pending.popleft().result():
+                        yield self.__createSentence(sentence_layers)
+        else:
+            sentence = self.getNextSentence()
+            while sentence is not None:
+                yield sentence
+                sentence = self.getNextSentence()
+        self.close()
@@ -0,0 +1,27 @@
+"""
+Measures the time needed to import the modules of the package in a fresh interpreter, as a short lived script that
+only reads and writes sentences would do. Each module is imported repeat times, every time in a new process, and the
+best time is reported. Run from the root of the repository:
+
+    python -m benchmark.ImportTimeBenchmark [repeat]
+"""
+import subprocess
+import sys
+
+modules = ["AnnotatedSentence.AnnotatedWord",
+           "AnnotatedSentence.AnnotatedSentence",
+           "AnnotatedSentence.AnnotatedCorpus",
+           "AnnotatedSentence.AnnotatedCorpusStream"]
+
+
+def importTime(module: str) -> float:
+    command = "import time; start = time.perf_counter(); import " + module + "; print(time.perf_counter() - start)"
+    output = subprocess.run([sys.executable, "-c", command], capture_output=True, text=True, check=True).stdout
+    return float(output)
+
+
+if __name__ == '__main__':
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for module in modules:
+        best = min(importTime(module) for i in range(repeat))
+        print(module + ": " + str(round(best * 1000, 1)) + " ms")
@@ -0,0 +1,33 @@
+"""
+Measures the memory used by the annotated sentences in the sentences folder, read scale times. Run from the root of
+the repository:
+
+    python -m benchmark.MemoryBenchmark [scale] [lazy]
+"""
+import os
+import sys
+import tracemalloc
+
+from AnnotatedSentence.AnnotatedSentence import AnnotatedSentence
+
+
+def readLines(folder: str) -> list:
+    lines = []
+    for file_name in sorted(os.listdir(folder)):
+        file = open(os.path.join(folder, file_name), "r", encoding='utf8')
+        lines.append(file.readline().rstrip())
+        file.close()
+    return lines
+
+
+if __name__ == '__main__':
+    scale = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    lazy = len(sys.argv) > 2 and sys.argv[2] == "lazy"
+    lines = readLines(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "sentences"))
+    tracemalloc.start()
+    sentences = [AnnotatedSentence(line, lazy=lazy) for i in range(scale) for line in lines]
+    used = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    word_count = sum(sentence.wordCount() for sentence in sentences)
+    print("sentences: " + str(len(sentences)) + " words: " + str(word_count))
+    print("total: " + str(used // 1024) + " KB, per word: " + str(used // word_count) + " bytes")
@@ -14,6 +14,7 @@ setup(
     author_email='olcaytaner@isikun.edu.tr',
     description='Annotated Sentence Processing Library',
     install_requires=['NlpToolkit-WordNet', 'NlpToolkit-NamedEntityRecognition', 'NlpToolkit-PropBank', 'NlpToolkit-DependencyParser', 'NlpToolkit-FrameNet', 'NlpToolkit-SentiNet'],
+    extras_require={'numpy': ['numpy']},
     long_description=long_description,
     long_description_content_type='text/markdown'
 )
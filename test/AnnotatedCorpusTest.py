@@ -0,0 +1,553 @@
+import unittest
+
+import contextlib
+import gzip
+import io
+import os
+import pickle
+import shutil
+import tempfile
+
+from AnnotatedSentence.AnnotatedCorpus import AnnotatedCorpus
+from AnnotatedSentence.AnnotatedCorpusBundle import AnnotatedCorpusBundle
+from AnnotatedSentence.AnnotatedCorpusStream import AnnotatedCorpusStream
+from AnnotatedSentence.AnnotatedSentence import AnnotatedSentence
+from AnnotatedSentence.ColumnarCorpus import ColumnarCorpus
+from AnnotatedSentence.CorpusQuery import CorpusQuery
+from AnnotatedSentence.LayerValuePool import LayerValuePool
+from AnnotatedSentence.ParserEvaluationReport import ParserEvaluationReport
+from AnnotatedSentence.UniversalDependencyCorpusStream import UniversalDependencyCorpusStream
+from AnnotatedSentence.ViewLayerType import ViewLayerType
+
+
+class AnnotatedCorpusTest(unittest.TestCase):
+
+    corpus: AnnotatedCorpus
+
+    def setUp(self) -> None:
+        self.corpus = AnnotatedCorpus("../sentences")
+
+    def test_LazyLoading(self):
+        lazy_corpus = AnnotatedCorpus("../sentences", lazy=True)
+        self.assertEqual(self.corpus.sentenceCount(), lazy_corpus.sentenceCount())
+        word = lazy_corpus.getSentence(0).getWord(0)
+        self.assertFalse(word.isDecoded())
+        self.assertEqual(self.corpus.getSentence(0).getWord(0).getLayerInfo(ViewLayerType.DEPENDENCY),
+                         word.getLayerInfo(ViewLayerType.DEPENDENCY))
+        self.assertFalse(word.isDecoded())
+        for i in range(self.corpus.sentenceCount()):
+            sentence = self.corpus.getSentence(i)
+            lazy_sentence = lazy_corpus.getSentence(i)
+            for j in range(sentence.wordCount()):
+                for layer in [ViewLayerType.INFLECTIONAL_GROUP, ViewLayerType.META_MORPHEME, ViewLayerType.PROPBANK,
+                              ViewLayerType.SEMANTICS, ViewLayerType.SHALLOW_PARSE]:
+                    self.assertEqual(sentence.getWord(j).getLayerInfo(layer),
+                                     lazy_sentence.getWord(j).getLayerInfo(layer))
+                self.assertEqual(sentence.getWord(j).getUniversalDependency().to(),
+                                 lazy_sentence.getWord(j).getUniversalDependency().to())
+        self.assertTrue(word.isDecoded())
+
+    def test_ParallelLoading(self):
+        parallel_corpus = AnnotatedCorpus("../sentences", workerCount=2, chunkSize=3)
+        self.assertEqual(self.corpus.sentenceCount(), parallel_corpus.sentenceCount())
+        for i in range(self.corpus.sentenceCount()):
+            self.assertEqual(self.corpus.getSentence(i).getFileName(), parallel_corpus.getSentence(i).getFileName())
+            self.assertEqual(self.corpus.getSentence(i).toStems(), parallel_corpus.getSentence(i).toStems())
+        self.assertTrue(parallel_corpus.getSentence(0).getWord(0).isDecoded())
+
+    def test_Stream(self):
+        stream = AnnotatedCorpusStream("../sentences")
+        count = 0
+        for sentence, streamed in zip(self.corpus, stream):
+            self.assertEqual(sentence.getFileName(), streamed.getFileName())
+            self.assertEqual(sentence.toStems(), streamed.toStems())
+            count += 1
+        self.assertEqual(self.corpus.sentenceCount(), count)
+        stream.open()
+        self.assertEqual(self.corpus.getSentence(0).getFileName(), stream.getNextSentence().getFileName())
+        stream.close()
+        corpus = AnnotatedCorpus("../sentences", "0001")
+        stream = AnnotatedCorpusStream("../sentences", "0001")
+        self.assertEqual(1.0, corpus.compareParses(stream).getUAS())
+        self.assertEqual(1.0, stream.compareParses(corpus).getLAS())
+        with self.assertRaises(ValueError):
+            self.corpus.compareParses(stream)
+
+    def test_StreamExport(self):
+        output_folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_folder)
+        AnnotatedCorpus("../sentences", "0000").exportUniversalDependencyFormat(os.path.join(output_folder, "a.conllu"))
+        AnnotatedCorpusStream("../sentences", "0000").exportUniversalDependencyFormat(os.path.join(output_folder,
+                                                                                                   "b.conllu"))
+        self.assertEqual(open(os.path.join(output_folder, "a.conllu")).read(),
+                         open(os.path.join(output_folder, "b.conllu")).read())
+
+    def test_BufferedExport(self):
+        output_folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_folder)
+        self.corpus.sentences = [sentence for sentence in self.corpus.sentences
+                                 if not sentence.getFileName().endswith("0006.dev")]
+        statistics = self.corpus.exportUniversalDependencyFormat(os.path.join(output_folder, "a.conllu"))
+        self.assertEqual(9, statistics.getSentenceCount())
+        self.assertEqual(93, statistics.getWordCount())
+        self.assertEqual(93, statistics.getColumnHitCount() + statistics.getColumnMissCount())
+        statistics = self.corpus.exportUniversalDependencyFormat(os.path.join(output_folder, "b.conllu"),
+                                                                 workerCount=2, chunkSize=2)
+        self.assertEqual(93, statistics.getWordCount())
+        statistics = self.corpus.exportUniversalDependencyFormat(os.path.join(output_folder, "c.conllu.gz"))
+        self.assertEqual(0, statistics.getColumnMissCount())
+        expected = open(os.path.join(output_folder, "a.conllu"), encoding="utf8").read()
+        self.assertEqual(9, expected.count("# sent_id"))
+        self.assertEqual(expected, open(os.path.join(output_folder, "b.conllu"), encoding="utf8").read())
+        self.assertEqual(expected, gzip.open(os.path.join(output_folder, "c.conllu.gz"), "rt", encoding="utf8").read())
+
+    def test_UniversalDependencyImport(self):
+        output_folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_folder)
+        output_file_name = os.path.join(output_folder, "corpus.conllu.gz")
+        self.corpus.sentences = [sentence for sentence in self.corpus.sentences
+                                 if not sentence.getFileName().endswith("0006.dev")]
+        self.corpus.exportUniversalDependencyFormat(output_file_name)
+        for worker_count in [1, 2]:
+            sentences = list(UniversalDependencyCorpusStream(output_file_name, workerCount=worker_count, chunkSize=2))
+            self.assertEqual(self.corpus.sentenceCount(), len(sentences))
+            for i in range(len(sentences)):
+                sentence = self.corpus.getSentence(i)
+                self.assertEqual(sentence.getFileName(), sentences[i].getFileName())
+                for j in range(sentence.wordCount()):
+                    word = sentence.getWord(j)
+                    read_word = sentences[i].getWord(j)
+                    self.assertEqual(word.getName(), read_word.getName())
+                    self.assertEqual(word.getParse().getWord().getName(), read_word.getParse().getWord().getName())
+                    self.assertEqual(word.getParse().getUniversalDependencyPos(),
+                                     read_word.getParse().getUniversalDependencyPos())
+                    self.assertEqual(word.getUniversalDependency().to(), read_word.getUniversalDependency().to())
+                    self.assertEqual(word.getUniversalDependency().__str__(),
+                                     read_word.getUniversalDependency().__str__())
+        self.assertEqual("ev+NOUN+A3PL+P1SG+ACC", UniversalDependencyCorpusStream.morphologicalParseString(
+            "ev", "NOUN", "Case=Acc|Number=Plur|Number[psor]=Sing|Person=3|Person[psor]=1"))
+
+    def test_UniversalDependencyRoundTrip(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        input_file_name = os.path.join(folder, "input.conllu")
+        output_file_name = os.path.join(folder, "output.conllu")
+        with open(input_file_name, "w", encoding="utf8") as file:
+            file.write("# sent_id = s1\n"
+                       "1\tEvin\tev\tNOUN\t_\tCase=Gen|Number=Sing|Person=3\t2\tnmod:poss\t_\t_\n"
+                       "2\tkapısı\tkapı\tNOUN\t_\tCase=Nom|Number=Sing|Number[psor]=Sing|Person=3|Person[psor]=3\t3\t"
+                       "nsubj\t_\t_\n"
+                       "3\taçık\taçık\tADJ\t_\t_\t0\troot\t_\t_\n"
+                       "4\tmı\tmi\tAUX\t_\tNumber=Sing|Person=3\t3\taux:q\t_\t_\n"
+                       "5\t?\t?\tPUNCT\t_\t_\t3\tpunct\t_\t_\n"
+                       "\n"
+                       "# sent_id = s2\n"
+                       "1\tEv\tev\tNOUN\t_\tCase=Nom|Number=Sing|Person=3\t2\tnsubj\t_\t_\n"
+                       "2\tbüyük\tbüyük\tADJ\t_\t_\t0\troot\t_\t_\n"
+                       "3\tdeğil\tdeğil\tAUX\t_\tPolarity=Neg\t2\tcop\t_\t_\n"
+                       "4\tidi\ti\tAUX\t_\tTense=Past\t2\tcop\t_\t_\n"
+                       "5\t.\t.\tPUNCT\t_\t_\t2\tpunct\t_\t_\n")
+        sentences = list(UniversalDependencyCorpusStream(input_file_name))
+        self.assertEqual("NMOD_POSS", sentences[0].getWord(0).getUniversalDependency().__str__())
+        self.assertEqual("mi+QUES", sentences[0].getWord(3).getParse().__str__())
+        self.assertEqual("AUX_Q", sentences[0].getWord(3).getUniversalDependency().__str__())
+        self.assertEqual("değil+VERB+NEG", sentences[1].getWord(2).getParse().__str__())
+        self.assertIsNone(sentences[1].getWord(3).getParse())
+        self.assertEqual("COP", sentences[1].getWord(3).getUniversalDependency().__str__())
+        UniversalDependencyCorpusStream(input_file_name).exportUniversalDependencyFormat(output_file_name)
+        with open(input_file_name, encoding="utf8") as input_file, \
+                open(output_file_name, encoding="utf8") as output_file:
+            expected = [line.split("\t") for line in input_file if line[0].isdigit()]
+            exported = [line.split("\t") for line in output_file if line[0].isdigit()]
+        # The exporter writes subtypes as nmod_poss, and no relation for words without a parse.
+        expected[8][6:8] = ["_", "_"]
+        self.assertEqual([[items[6], items[7].replace(":", "_")] for items in expected],
+                         [items[6:8] for items in exported])
+        self.assertEqual(["NOUN", "NOUN", "ADJ", "AUX", "PUNCT", "NOUN", "ADJ", "AUX", "_", "PUNCT"],
+                         [items[3] for items in exported])
+        read_sentences = list(UniversalDependencyCorpusStream(output_file_name))
+        for sentence, read_sentence in zip(sentences, read_sentences):
+            for word, read_word in zip(sentence.words, read_sentence.words):
+                if word.getParse() is not None:
+                    self.assertEqual(word.__str__(), read_word.__str__())
+        self.assertEqual("NMOD_POSS", read_sentences[0].getWord(0).getUniversalDependency().__str__())
+        self.assertEqual("AUX_Q", read_sentences[0].getWord(3).getUniversalDependency().__str__())
+
+    def test_SaveModified(self):
+        temporary_folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temporary_folder)
+        folder = os.path.join(temporary_folder, "sentences")
+        shutil.copytree("../sentences", folder)
+        corpus = AnnotatedCorpus(folder)
+        self.assertEqual([], corpus.saveModified())
+        sentence = corpus.getSentence(2)
+        self.assertFalse(sentence.isModified())
+        sentence.getWord(0).setSemantic("TUR10-0000000")
+        self.assertTrue(sentence.isModified())
+        corpus.getSentence(4).removeWord(0)
+        self.assertEqual([sentence.getFileName(), corpus.getSentence(4).getFileName()], corpus.saveModified())
+        self.assertFalse(sentence.isModified())
+        self.assertEqual([], corpus.saveModified())
+        self.assertFalse(os.path.exists(sentence.getFileName() + ".tmp"))
+        self.assertEqual(sentence.__str__(), AnnotatedCorpus(folder).getSentence(2).__str__())
+
+    def test_LayerIndex(self):
+        index = self.corpus.createLayerIndex([ViewLayerType.NER, ViewLayerType.SEMANTICS, ViewLayerType.PROPBANK])
+        for layer in index.getLayers():
+            for value in index.getValues(layer):
+                self.assertEqual(self.corpus.findWords(layer, value), index.lookup(layer, value))
+                index_free = [(i, j) for i in range(self.corpus.sentenceCount())
+                              for j in range(self.corpus.getSentence(i).wordCount())
+                              if value in index.layerValues(self.corpus.getSentence(i).getWord(j), layer)]
+                self.assertEqual(index_free, index.lookup(layer, value))
+        self.assertEqual([], index.lookup(ViewLayerType.NER, "PERSON"))
+        self.corpus.getSentence(3).getWord(1).setNamedEntityType("PERSON")
+        self.assertEqual([(3, 1)], index.lookup(ViewLayerType.NER, "PERSON"))
+        self.assertEqual("NamedEntityType.PERSON", self.corpus.getSentence(3).getWord(1).getLayerInfo(ViewLayerType.NER))
+        self.corpus.getSentence(3).removeWord(0)
+        self.assertEqual([(3, 0)], index.lookup(ViewLayerType.NER, "PERSON"))
+        self.corpus.getSentence(3).getWord(0).setNamedEntityType("NONE")
+        self.assertEqual([], index.lookup(ViewLayerType.NER, "PERSON"))
+        lazy_corpus = AnnotatedCorpus("../sentences", lazy=True)
+        word = lazy_corpus.getSentence(0).getWord(0)
+        serialized = word.__str__()
+        lazy_corpus.createLayerIndex([ViewLayerType.PROPBANK, ViewLayerType.FRAMENET])
+        self.assertIs(serialized, word.__str__())
+        self.assertEqual(index.getValues(ViewLayerType.PROPBANK),
+                         lazy_corpus.getLayerIndex().getValues(ViewLayerType.PROPBANK))
+        self.assertFalse(lazy_corpus.getSentence(1).getWord(0).isDecoded())
+
+    def test_UpdateConnectedPredicates(self):
+        id_map = {"TUR10-0122530": "TUR10-0000001", "TUR10-0834470": "TUR10-0000002", "TUR10-9999999": "TUR10-0"}
+        expected = AnnotatedCorpus("../sentences")
+        expected_modified = []
+        for sentence in expected.sentences:
+            modified = False
+            for previous_id, current_id in id_map.items():
+                if sentence.updateConnectedPredicate(previous_id, current_id):
+                    modified = True
+            if modified:
+                expected_modified.append(sentence.getFileName())
+        index = self.corpus.createLayerIndex([ViewLayerType.PROPBANK])
+        modified = self.corpus.updateConnectedPredicates(id_map)
+        self.assertEqual(expected_modified, [sentence.getFileName() for sentence in modified])
+        self.assertTrue(len(modified) > 0)
+        for sentence, expected_sentence in zip(self.corpus.sentences, expected.sentences):
+            self.assertEqual(expected_sentence.isModified(), sentence.isModified())
+            for word, expected_word in zip(sentence.words, expected_sentence.words):
+                self.assertEqual(expected_word.getLayerInfo(ViewLayerType.PROPBANK),
+                                 word.getLayerInfo(ViewLayerType.PROPBANK))
+        self.assertEqual([], index.lookup(ViewLayerType.PROPBANK, "PREDICATE$TUR10-0122530"))
+        self.assertEqual(1, len(index.lookup(ViewLayerType.PROPBANK, "PREDICATE$TUR10-0000001")))
+        self.assertEqual([], self.corpus.updateConnectedPredicates(id_map))
+
+    def test_Query(self):
+        subject_query = CorpusQuery([{ViewLayerType.SHALLOW_PARSE: "ÖZNE",
+                                      ViewLayerType.DEPENDENCY: lambda value: value.endswith("$NSUBJ")}])
+        expected = []
+        for i in range(self.corpus.sentenceCount()):
+            sentence = self.corpus.getSentence(i)
+            for j in range(sentence.wordCount()):
+                relation = None
+                if not sentence.getFileName().endswith("0006.dev"):
+                    relation = sentence.getWord(j).getLayerInfo(ViewLayerType.DEPENDENCY)
+                if sentence.getWord(j).getShallowParse() == "ÖZNE" and relation is not None \
+                        and relation.endswith("$NSUBJ"):
+                    expected.append((i, (j,)))
+        self.assertTrue(len(expected) > 0)
+        self.assertEqual(expected, [(i, positions) for i, sentence, positions in subject_query.run(self.corpus)])
+        self.assertFalse(subject_query.getStatistics().isIndexUsed())
+        self.assertEqual(self.corpus.sentenceCount(), subject_query.getStatistics().getCandidateCount())
+        self.assertEqual(len(expected), len(subject_query.run(AnnotatedCorpusStream("../sentences"))))
+        self.corpus.createLayerIndex([ViewLayerType.SHALLOW_PARSE, ViewLayerType.NER])
+        self.assertEqual(expected, [(i, positions) for i, sentence, positions in subject_query.run(self.corpus)])
+        self.assertTrue(subject_query.getStatistics().isIndexUsed())
+        time_query = CorpusQuery([{ViewLayerType.NER: "TIME"}, {ViewLayerType.NER: "TIME"}])
+        matches = time_query.run(self.corpus)
+        for i, sentence, positions in matches:
+            self.assertEqual(positions[0] + 1, positions[1])
+        self.assertEqual(len(matches), time_query.getStatistics().getMatchCount())
+        self.assertTrue(time_query.getStatistics().getCandidateCount() < self.corpus.sentenceCount())
+        argument_query = CorpusQuery([{ViewLayerType.PROPBANK: lambda value: value.startswith("PREDICATE$")},
+                                      {ViewLayerType.PROPBANK: lambda value: value.startswith("ARG0$")}],
+                                     adjacent=False,
+                                     where=lambda sentence, positions: "ARG0$" + sentence.getWord(positions[0])
+                                     .getArgumentList().getArguments()[0][10:] in sentence.getWord(positions[1])
+                                     .getArgumentList().getArguments())
+        for i, sentence, positions in argument_query.run(self.corpus):
+            self.assertNotEqual(positions[0], positions[1])
+        self.assertTrue(argument_query.getStatistics().getMatchCount() > 0)
+
+    def test_CheckCoverage(self):
+        layers = [ViewLayerType.INFLECTIONAL_GROUP, ViewLayerType.SHALLOW_PARSE, ViewLayerType.PROPBANK,
+                  ViewLayerType.DEPENDENCY]
+        report = self.corpus.checkCoverage(layers)
+        self.assertEqual(self.corpus.sentenceCount(), report.sentenceCount())
+        missing = [(i, j) for i in range(self.corpus.sentenceCount())
+                   for j in range(self.corpus.getSentence(i).wordCount())
+                   if self.corpus.getSentence(i).getWord(j).getShallowParse() is None]
+        self.assertTrue(len(missing) > 0)
+        self.assertEqual(missing, report.getMissingWords(ViewLayerType.SHALLOW_PARSE))
+        self.assertEqual(sorted(set(i for i, j in missing)), report.getIncompleteSentences(ViewLayerType.SHALLOW_PARSE))
+        self.assertEqual([], report.getMissingWords(ViewLayerType.INFLECTIONAL_GROUP))
+        self.assertEqual(1.0, report.getCoverage(ViewLayerType.INFLECTIONAL_GROUP))
+        sentence_index = missing[0][0]
+        self.assertAlmostEqual(1 - len([1 for i, j in missing if i == sentence_index]) /
+                               self.corpus.getSentence(sentence_index).wordCount(),
+                               report.getSentenceCoverage(sentence_index, ViewLayerType.SHALLOW_PARSE))
+        parallel_report = self.corpus.checkCoverage(layers, workerCount=2, chunkSize=3)
+        self.assertEqual(report.getFileNames(), parallel_report.getFileNames())
+        for layer in layers:
+            self.assertEqual(report.getMissingWords(layer), parallel_report.getMissingWords(layer))
+            self.assertEqual(report.getCoverage(layer), parallel_report.getCoverage(layer))
+        self.corpus.sentences = [AnnotatedSentence(self.corpus.getSentence(sentence_index).__str__())]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            self.corpus.checkShallowParse()
+        self.assertEqual("Shallow parse annotation does not exist for sentence None\n", output.getvalue())
+
+    def test_LayerStatistics(self):
+        layers = [ViewLayerType.NER, ViewLayerType.SHALLOW_PARSE, ViewLayerType.PART_OF_SPEECH,
+                  ViewLayerType.SEMANTICS]
+        statistics = self.corpus.getLayerStatistics(layers, [(ViewLayerType.NER, ViewLayerType.SHALLOW_PARSE)])
+        self.assertEqual(101, statistics.wordCount())
+        self.assertEqual(101, sum(statistics.getCounts(ViewLayerType.PART_OF_SPEECH).values()))
+        for i in range(self.corpus.sentenceCount()):
+            sentence = self.corpus.getSentence(i)
+            histogram = {}
+            for j in range(sentence.wordCount()):
+                value = sentence.getWord(j).getLayerInfo(ViewLayerType.SHALLOW_PARSE)
+                if value is not None:
+                    histogram[value] = histogram.get(value, 0) + 1
+            self.assertEqual(histogram, statistics.getSentenceHistogram(i, ViewLayerType.SHALLOW_PARSE))
+        co_occurrences = statistics.getCoOccurrences(ViewLayerType.NER, ViewLayerType.SHALLOW_PARSE)
+        self.assertEqual(sum(statistics.getCounts(ViewLayerType.SHALLOW_PARSE).values()), sum(co_occurrences.values()))
+        parallel_statistics = self.corpus.getLayerStatistics(layers, [(ViewLayerType.NER, ViewLayerType.SHALLOW_PARSE)],
+                                                             workerCount=2, chunkSize=3)
+        self.assertEqual(statistics.getFileNames(), parallel_statistics.getFileNames())
+        self.assertEqual(co_occurrences, parallel_statistics.getCoOccurrences(ViewLayerType.NER,
+                                                                              ViewLayerType.SHALLOW_PARSE))
+        for layer in layers:
+            self.assertEqual(statistics.getCounts(layer), parallel_statistics.getCounts(layer))
+            self.assertEqual(statistics.getSentenceHistograms(layer), parallel_statistics.getSentenceHistograms(layer))
+
+    def test_Spans(self):
+        spans = self.corpus.getSpans(ViewLayerType.NER)
+        columns = self.corpus.getColumnarCorpus([ViewLayerType.NER, ViewLayerType.SHALLOW_PARSE])
+        sentences, starts, ends, codes = columns.getSpans(ViewLayerType.NER, ["NONE"])
+        vocabulary = columns.getVocabulary(ViewLayerType.NER)
+        self.assertEqual(spans, [(sentences[i], starts[i], ends[i], vocabulary[codes[i]]) for i in range(len(codes))])
+        spans = self.corpus.getSpans(ViewLayerType.SHALLOW_PARSE)
+        sentences, starts, ends, codes = columns.getSpans(ViewLayerType.SHALLOW_PARSE)
+        vocabulary = columns.getVocabulary(ViewLayerType.SHALLOW_PARSE)
+        self.assertEqual(spans, [(sentences[i], starts[i], ends[i], vocabulary[codes[i]] if codes[i] != -1 else None)
+                                 for i in range(len(codes))])
+        phrases = self.corpus.getPhrases(ViewLayerType.SHALLOW_PARSE)
+        self.assertEqual(len(spans), sum(len(sentence_phrases) for sentence_phrases in phrases))
+        self.assertEqual(self.corpus.getSentence(1).getShallowParseGroups()[2].getTag(), phrases[1][2].getTag())
+        sentence = self.corpus.getSentence(0)
+        sentence.getWord(0).setShallowParse(None)
+        sentence.getWord(3).setShallowParse(None)
+        sentence.getWord(4).setShallowParse(None)
+        expected = sentence.getShallowParseSpans()
+        self.assertEqual((0, expected[1][0], None), expected[0])
+        self.assertIsNone(expected[1][2])
+        columns = ColumnarCorpus([sentence], [ViewLayerType.SHALLOW_PARSE])
+        sentences, starts, ends, codes = columns.getSpans(ViewLayerType.SHALLOW_PARSE)
+        vocabulary = columns.getVocabulary(ViewLayerType.SHALLOW_PARSE)
+        self.assertEqual(expected, [(starts[i], ends[i], vocabulary[codes[i]] if codes[i] != -1 else None)
+                                    for i in range(len(codes))])
+        self.assertEqual([group.wordCount() for group in sentence.getShallowParseGroups()],
+                         [end - start for start, end, tag in expected])
+
+    def test_CheckDependencyTrees(self):
+        problems = self.corpus.checkDependencyTrees()
+        self.assertEqual([], problems["cycles"] + problems["multipleRoots"] + problems["outOfRangeHeads"])
+        sentence = self.corpus.getSentence(2)
+        root = sentence.getDependencyTree().getChildren(0)[0]
+        sentence.getWord(root % sentence.wordCount()).setUniversalDependency(0, "ROOT")
+        problems = self.corpus.checkDependencyTrees()
+        self.assertEqual([2], problems["multipleRoots"])
+
+    def test_EvaluateParses(self):
+        gold = AnnotatedCorpus("../sentences")
+        gold.sentences = [sentence for sentence in gold.sentences if not sentence.getFileName().endswith("0006.dev")]
+        self.corpus.sentences = [sentence for sentence in self.corpus.sentences
+                                 if not sentence.getFileName().endswith("0006.dev")]
+        self.assertEqual(1.0, gold.evaluateParses(self.corpus).getScore().getLAS())
+        for i in range(0, self.corpus.sentenceCount() - 1, 3):
+            self.corpus.getSentence(i).getWord(0).setUniversalDependency(1, "DEP")
+            word = self.corpus.getSentence(i + 1).getWord(1)
+            word.setUniversalDependency(word.getUniversalDependency().to(), "DEP")
+        expected = gold.compareParses(self.corpus)
+        report = gold.evaluateParses(self.corpus, 5)
+        score = report.getScore()
+        self.assertEqual(expected.getWordCount(), score.getWordCount())
+        self.assertAlmostEqual(expected.getUAS(), score.getUAS())
+        self.assertAlmostEqual(expected.getLAS(), score.getLAS())
+        self.assertAlmostEqual(expected.getLS(), score.getLS())
+        self.assertEqual(score.getWordCount(),
+                         sum(label_score.getWordCount() for label_score in report.getScoresByLabel().values()))
+        self.assertEqual(score.getWordCount(),
+                         sum(pos_score.getWordCount() for pos_score in report.getScoresByPos().values()))
+        self.assertEqual(1.0, report.getScoresByLabel()["ROOT"].getLAS())
+        lengths = list(report.getScoresBySentenceLength().keys())
+        self.assertEqual((6, 10), lengths[0])
+        half = ParserEvaluationReport(5)
+        half.addColumnarCorpora(ColumnarCorpus(gold.sentences[:4], [ViewLayerType.DEPENDENCY,
+                                                                    ViewLayerType.PART_OF_SPEECH]),
+                                ColumnarCorpus(self.corpus.sentences[:4], [ViewLayerType.DEPENDENCY]))
+        second = ParserEvaluationReport(5)
+        second.addColumnarCorpora(ColumnarCorpus(gold.sentences[4:], [ViewLayerType.DEPENDENCY,
+                                                                      ViewLayerType.PART_OF_SPEECH]),
+                                  ColumnarCorpus(self.corpus.sentences[4:], [ViewLayerType.DEPENDENCY]))
+        half.add(second)
+        self.assertEqual(report.sentenceCount(), half.sentenceCount())
+        self.assertAlmostEqual(score.getLAS(), half.getScore().getLAS())
+        with self.assertRaises(ValueError):
+            gold.evaluateParses(self.corpus.sentences[:-1])
+        self.corpus.getSentence(2).removeWord(0)
+        with self.assertRaises(ValueError):
+            gold.evaluateParses(self.corpus)
+
+    def test_CompareLayers(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        os.mkdir(os.path.join(folder, "train"))
+        os.mkdir(os.path.join(folder, "test"))
+        file_names = [sentence.getFileName() for sentence in self.corpus.sentences]
+        for i in range(len(file_names)):
+            name = os.path.basename(file_names[i])
+            shutil.copy(file_names[i], os.path.join(folder, "train", name))
+            shutil.copy(file_names[(i + 1) % len(file_names)], os.path.join(folder, "test", name))
+        corpus = AnnotatedCorpus(folder)
+        corpus.sentences.reverse()
+        corpus.sentences.append(corpus.sentences[0])
+        os.remove(os.path.join(folder, "train", "0003.dev"))
+        shutil.copy("../sentences/0001.dev", os.path.join(folder, "train", "9999.dev"))
+        stream = AnnotatedCorpusStream(folder)
+        changed = next(sentence for sentence in stream
+                       if sentence.getFileName() == os.path.join(folder, "train", "0002.dev"))
+        changed.getWord(0).setNamedEntityType("PERSON")
+        changed.save()
+        comparison = corpus.compareLayers(stream, [ViewLayerType.TURKISH_WORD, ViewLayerType.NER,
+                                                   ViewLayerType.DEPENDENCY])
+        self.assertEqual(2 * len(file_names) - 1, comparison.matchedCount())
+        self.assertEqual([os.path.join("train", "9999.dev")], comparison.getMissingFromFirst())
+        self.assertEqual([os.path.join("train", "0003.dev")], comparison.getMissingFromSecond())
+        self.assertEqual([corpus.sentenceName(corpus.sentences[0])], comparison.getDuplicatesInFirst())
+        self.assertEqual([], comparison.getDuplicatesInSecond())
+        self.assertEqual(1.0, comparison.getAgreement(ViewLayerType.TURKISH_WORD))
+        self.assertEqual([], comparison.getLengthMismatches())
+        self.assertEqual([os.path.join("train", "0002.dev")], comparison.getDisagreements(ViewLayerType.NER))
+        self.assertEqual([], comparison.getDisagreements(ViewLayerType.DEPENDENCY))
+        self.assertEqual(1.0, comparison.getParserEvaluationScore().getUAS())
+
+    def test_Bundle(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder)
+        bundle_file_name = os.path.join(folder, "sentences.bundle")
+        AnnotatedCorpusBundle.createBundle("../sentences", bundle_file_name)
+        bundle = AnnotatedCorpusBundle(bundle_file_name)
+        self.addCleanup(bundle.close)
+        self.assertEqual(self.corpus.sentenceCount(), bundle.sentenceCount())
+        for i in range(self.corpus.sentenceCount()):
+            sentence = self.corpus.getSentence(i)
+            file_name = os.path.relpath(sentence.getFileName(), "../sentences")
+            self.assertEqual(file_name, bundle.getFileNames()[i])
+            self.assertEqual(open(sentence.getFileName(), encoding='utf8').readline().rstrip(),
+                             bundle.getSentenceLine(i))
+            self.assertEqual(sentence.toStems(), bundle.getSentenceWithName(file_name).toStems())
+        self.assertEqual(self.corpus.getSentence(0).__str__(), bundle.getSentence(0).__str__())
+        self.assertIsNone(bundle.getSentenceWithName("missing.dev"))
+        self.assertFalse(hasattr(bundle, "save"))
+        with AnnotatedCorpusBundle(bundle_file_name) as other:
+            line = other.getSentenceLine(1)
+        os.replace(bundle_file_name, bundle_file_name + ".old")
+        self.assertEqual(line, bundle.getSentenceLine(1))
+        bundle.close()
+        os.replace(bundle_file_name + ".old", bundle_file_name)
+        self.assertEqual(line, bundle.getSentenceLine(1))
+
+    def test_Pool(self):
+        pool = LayerValuePool()
+        corpus = AnnotatedCorpus("../sentences", pool=pool)
+        shallow_parses = {}
+        for sentence in corpus:
+            for word in sentence.words:
+                shallow_parse = shallow_parses.setdefault(word.getShallowParse(), word.getShallowParse())
+                self.assertIs(shallow_parse, word.getShallowParse())
+        parallel_corpus = AnnotatedCorpus("../sentences", lazy=True, workerCount=2, chunkSize=3, pool=pool)
+        self.assertIs(corpus.getSentence(0).getWord(0).getSemantic(),
+                      parallel_corpus.getSentence(0).getWord(0).getSemantic())
+        self.assertGreater(pool.size(), 0)
+
+    def test_ColumnarCorpus(self):
+        columns = self.corpus.getColumnarCorpus([ViewLayerType.NER, ViewLayerType.SHALLOW_PARSE,
+                                                 ViewLayerType.PART_OF_SPEECH, ViewLayerType.DEPENDENCY])
+        self.assertEqual(self.corpus.sentenceCount(), columns.sentenceCount())
+        self.assertEqual(101, columns.wordCount())
+        offsets = columns.getSentenceOffsets()
+        heads = columns.getHeads()
+        ner_codes = columns.getCodes(ViewLayerType.NER)
+        ner_vocabulary = columns.getVocabulary(ViewLayerType.NER)
+        for i in range(self.corpus.sentenceCount()):
+            sentence = self.corpus.getSentence(i)
+            self.assertEqual(sentence.wordCount(), offsets[i + 1] - offsets[i])
+            for j in range(sentence.wordCount()):
+                word = sentence.getWord(j)
+                self.assertEqual(word.getUniversalDependency().to(), heads[offsets[i] + j])
+                self.assertEqual(word.getNamedEntityType().name, ner_vocabulary[ner_codes[offsets[i] + j]])
+        self.assertEqual(14, columns.getValueCounts(ViewLayerType.DEPENDENCY)["PUNCT"])
+        self.assertEqual(10, columns.getValueCounts(ViewLayerType.DEPENDENCY)["ROOT"])
+        self.assertEqual(-1, columns.getCodes(ViewLayerType.DEPENDENCY).min())
+        self.assertEqual(101, sum(columns.getValueCounts(ViewLayerType.PART_OF_SPEECH).values()))
+
+    def test_Snapshot(self):
+        temporary_folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temporary_folder)
+        folder = os.path.join(temporary_folder, "sentences")
+        shutil.copytree("../sentences", folder)
+        snapshot_file_name = os.path.join(folder, "..", "sentences.snapshot")
+        for use_content_hash in [False, True]:
+            corpus = AnnotatedCorpus(folder, snapshotFileName=snapshot_file_name, useContentHash=use_content_hash)
+            self.assertTrue(os.path.exists(snapshot_file_name))
+            snapshot_corpus = AnnotatedCorpus(folder, snapshotFileName=snapshot_file_name,
+                                              useContentHash=use_content_hash)
+            self.assertEqual(corpus.sentenceCount(), snapshot_corpus.sentenceCount())
+            for i in range(corpus.sentenceCount()):
+                self.assertEqual(corpus.getSentence(i).getFileName(), snapshot_corpus.getSentence(i).getFileName())
+                self.assertEqual(corpus.getSentence(i).toStems(), snapshot_corpus.getSentence(i).toStems())
+            self.assertTrue(snapshot_corpus.getSentence(0).getWord(0).isDecoded())
+        self.assertEqual(["sentences", "sentences.snapshot"], sorted(os.listdir(temporary_folder)))
+        for corrupt in [[1, 2], ((AnnotatedCorpus.snapshot_version, False), [1, 2]),
+                        ((AnnotatedCorpus.snapshot_version, False), {corpus.getSentence(0).getFileName(): "x"})]:
+            with open(snapshot_file_name, "wb") as snapshot_file:
+                pickle.dump(corrupt, snapshot_file)
+            snapshot_corpus = AnnotatedCorpus(folder, snapshotFileName=snapshot_file_name)
+            self.assertEqual(corpus.sentenceCount(), snapshot_corpus.sentenceCount())
+            self.assertEqual(corpus.getSentence(0).toStems(), snapshot_corpus.getSentence(0).toStems())
+        file_name = corpus.getSentence(0).getFileName()
+        name = corpus.getSentence(0).getWord(0).getName()
+        line = open(file_name, "r", encoding='utf8').readline().replace("{turkish=" + name + "}", "{turkish=Dev}")
+        open(file_name, "w", encoding='utf8').write(line)
+        os.utime(file_name, ns=(0, 0))
+        os.remove(corpus.getSentence(1).getFileName())
+        snapshot_corpus = AnnotatedCorpus(folder, lazy=True, snapshotFileName=snapshot_file_name)
+        self.assertEqual(corpus.sentenceCount() - 1, snapshot_corpus.sentenceCount())
+        for sentence in snapshot_corpus:
+            if sentence.getFileName() == file_name:
+                self.assertEqual("Dev", sentence.getWord(0).getName())
+        os.remove(snapshot_file_name)
+        pool = LayerValuePool()
+        parallel_corpus = AnnotatedCorpus(folder, workerCount=2, chunkSize=2, pool=pool,
+                                          snapshotFileName=snapshot_file_name)
+        self.assertEqual(snapshot_corpus.sentenceCount(), parallel_corpus.sentenceCount())
+        self.assertTrue(parallel_corpus.getSentence(0).getWord(0).isDecoded())
+        self.assertGreater(pool.size(), 0)
+        for i in range(parallel_corpus.sentenceCount()):
+            self.assertEqual(snapshot_corpus.getSentence(i).toStems(), parallel_corpus.getSentence(i).toStems())
+
+
+if __name__ == '__main__':
+    unittest.main()
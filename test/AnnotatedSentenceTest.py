@@ -1,5 +1,10 @@
 import unittest
 
+import os
+import subprocess
+import sys
+import tempfile
+
 from AnnotatedSentence.AnnotatedSentence import AnnotatedSentence
 
 
@@ -40,6 +45,45 @@ class AnnotatedSentenceTest(unittest.TestCase):
         self.assertEqual(5, len(self.sentence8.getShallowParseGroups()))
         self.assertEqual(3, len(self.sentence9.getShallowParseGroups()))
 
+    def test_Spans(self):
+        for sentence in [self.sentence0, self.sentence1, self.sentence2, self.sentence3]:
+            groups = sentence.getShallowParseGroups()
+            self.assertEqual([(group.getWordIndex(), group.getWordIndex() + group.wordCount(), group.getTag())
+                              for group in groups], sentence.getShallowParseSpans())
+        self.assertEqual([(0, 4, "ORGANIZATION"), (5, 6, "TIME")], self.sentence1.getNamedEntitySpans())
+        self.assertEqual([], self.sentence2.getNamedEntitySpans())
+        phrases = self.sentence1.getPhrases(self.sentence1.getNamedEntitySpans())
+        self.assertEqual("ORGANIZATION", phrases[0].getTag())
+        self.assertEqual(4, phrases[0].wordCount())
+        self.assertEqual(self.sentence1.getWord(5), phrases[1].getWord(0))
+
+    def test_DependencyTree(self):
+        tree = self.sentence0.getDependencyTree()
+        self.assertIs(tree, self.sentence0.getDependencyTree())
+        self.assertEqual([2, 4, 4, 5, 9, 9, 8, 6, 11, 11, 0, 11], list(tree.getHeads()))
+        self.assertEqual([11], list(tree.getChildren(0)))
+        self.assertEqual([9, 10, 12], list(tree.getChildren(11)))
+        self.assertEqual([6, 5, 5, 4, 3, 3, 5, 4, 2, 2, 1, 2], list(tree.getDepths()))
+        self.assertEqual(6, tree.getSubtreeStarts()[5])
+        self.assertEqual(8, tree.getSubtreeEnds()[5])
+        self.assertEqual(9, tree.getSubtreeSizes()[8])
+        self.assertTrue(tree.isTree())
+        self.assertTrue(tree.isProjective())
+        self.sentence0.getWord(11).setUniversalDependency(1, "DEP")
+        tree = self.sentence0.getDependencyTree()
+        self.assertEqual(1, tree.getHeads()[11])
+        self.assertTrue(tree.isTree())
+        self.assertFalse(tree.isProjective())
+        self.sentence0.getWord(3).setUniversalDependency(2, "DEP")
+        tree = self.sentence0.getDependencyTree()
+        self.assertTrue(tree.hasCycle())
+        self.assertEqual(-1, tree.getDepths()[0])
+        self.assertFalse(tree.isTree())
+        self.sentence0.removeWord(10)
+        tree = self.sentence0.getDependencyTree()
+        self.assertEqual(11, tree.wordCount())
+        self.assertEqual(0, tree.rootCount())
+
     def test_ContainsPredicate(self):
         self.assertTrue(self.sentence0.containsPredicate())
         self.assertTrue(self.sentence1.containsPredicate())
@@ -78,5 +122,50 @@ class AnnotatedSentenceTest(unittest.TestCase):
         self.assertEqual(1.0, self.sentence0.compareParses(self.sentence0).getLAS())
         self.assertEqual(1.0, self.sentence0.compareParses(self.sentence0).getLS())
 
+    def test_Save(self):
+        line = open("../sentences/0000.dev", "r", encoding='utf8').readline().rstrip()
+        self.assertEqual(line, self.sentence0.__str__())
+        with tempfile.TemporaryDirectory() as folder:
+            file_name = os.path.join(folder, "0000.dev")
+            self.sentence0.save(file_name)
+            self.assertEqual(line + "\n", open(file_name, "r", encoding='utf8').read())
+            os.chmod(file_name, 0o640)
+            self.sentence1.save(file_name, atomic=True)
+            self.assertEqual(self.sentence1.__str__() + "\n", open(file_name, "r", encoding='utf8').read())
+            self.assertEqual(0o640, os.stat(file_name).st_mode & 0o777)
+
+            def failingWrite(out_file):
+                out_file.write("partial")
+                raise OSError("disk full")
+
+            with self.assertRaises(OSError):
+                AnnotatedSentence.writeFileAtomically(file_name, failingWrite)
+            self.assertEqual(["0000.dev"], os.listdir(folder))
+            self.assertEqual(self.sentence1.__str__() + "\n", open(file_name, "r", encoding='utf8').read())
+
+    def test_SaveMutatedLayers(self):
+        word = self.sentence0.getWord(10)
+        argument_list = word.getArgumentList()
+        line = self.sentence0.__str__()
+        argument_list.updateConnectedId("TUR10-0122530", "TUR10-0122540")
+        self.assertIn("{propbank=PREDICATE$TUR10-0122540}", word.__str__())
+        self.sentence0.getWord(0).__str__()
+        self.sentence0.getWord(0).getMetamorphicParse().addMetaMorphemeList("lH")
+        self.assertIn("{metaMorphemes=devasa+lH}", self.sentence0.getWord(0).__str__())
+        with tempfile.TemporaryDirectory() as folder:
+            file_name = os.path.join(folder, "0000.dev")
+            self.sentence0.save(file_name)
+            saved = open(file_name, "r", encoding='utf8').read()
+        self.assertEqual(line.replace("PREDICATE$TUR10-0122530", "PREDICATE$TUR10-0122540")
+                         .replace("{metaMorphemes=devasa}", "{metaMorphemes=devasa+lH}") + "\n", saved)
+
+    def test_DeferredImports(self):
+        command = "import sys; import AnnotatedSentence.AnnotatedCorpus; " \
+                  "print(sorted(module for module in ['FrameNet.FrameNet', 'WordNet.WordNet', " \
+                  "'PropBank.FramesetList', 'MorphologicalAnalysis.FsmMorphologicalAnalyzer'] if module in sys.modules))"
+        output = subprocess.run([sys.executable, "-c", command], capture_output=True, text=True, check=True,
+                                cwd=os.path.join(os.getcwd(), "..")).stdout
+        self.assertEqual("[]", output.strip())
+
 if __name__ == '__main__':
     unittest.main()
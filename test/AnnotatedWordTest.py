@@ -0,0 +1,100 @@
+import unittest
+
+from AnnotatedSentence.AnnotatedWord import AnnotatedWord
+from AnnotatedSentence.AnnotatedWordParser import AnnotatedWordParser
+from AnnotatedSentence.ParseCache import ParseCache
+
+
+class AnnotatedWordTest(unittest.TestCase):
+
+    def test_SplitLayers(self):
+        self.assertEqual([("turkish", "Gelir"), ("morphologicalAnalysis", "gelir+NOUN+A3SG+PNON+NOM"),
+                          ("universalDependency", "10$NSUBJ")],
+                         AnnotatedWordParser.splitLayers("{turkish=Gelir}{morphologicalAnalysis=gelir+NOUN+A3SG+PNON+NOM}"
+                                                         "{universalDependency=10$NSUBJ}"))
+        self.assertEqual([(None, "ve")], AnnotatedWordParser.splitLayers("ve"))
+        self.assertEqual([[("turkish", "=")], [("turkish", "a"), ("ccg", "NP")]],
+                         AnnotatedWordParser.splitSentence("{turkish==}  {turkish=a}{ccg=NP}"))
+
+    def test_Constructor(self):
+        word = AnnotatedWord("{turkish=Gelir}{morphologicalAnalysis=gelir+NOUN+A3SG+PNON+NOM}{semantics=TUR10-0289950}"
+                             "{namedEntity=NONE}{propBank=ARG0$TUR10-0798130}{shallowParse=ÖZNE}"
+                             "{universalDependency=10$NSUBJ}")
+        self.assertEqual("Gelir", word.getName())
+        self.assertEqual("gelir", word.getParse().getWord().getName())
+        self.assertEqual("TUR10-0289950", word.getSemantic())
+        self.assertEqual("ÖZNE", word.getShallowParse())
+        self.assertEqual(10, word.getUniversalDependency().to())
+        self.assertEqual("{turkish=Gelir}{morphologicalAnalysis=gelir+NOUN+A3SG+PNON+NOM}{semantics=TUR10-0289950}"
+                         "{namedEntity=NONE}{propbank=ARG0$TUR10-0798130}{shallowParse=ÖZNE}"
+                         "{universalDependency=10$NSUBJ}", word.__str__())
+        self.assertEqual("ve", AnnotatedWord("ve").getName())
+
+    def test_ParseCache(self):
+        cache = ParseCache(2)
+        parse = cache.getMorphologicalParse("devasa+ADJ")
+        self.assertIs(parse, cache.getMorphologicalParse("devasa+ADJ"))
+        cache.getMorphologicalParse("yeni+ADJ")
+        cache.getMorphologicalParse("ölçek+NOUN+A3SG+PNON+NOM^DB+ADJ+WITH")
+        self.assertIsNot(parse, cache.getMorphologicalParse("devasa+ADJ"))
+        self.assertEqual(1, cache.getHitCount())
+        self.assertEqual(4, cache.getMissCount())
+        previous_cache = AnnotatedWord.getParseCache()
+        AnnotatedWord.setParseCache(ParseCache(10))
+        word1 = AnnotatedWord("{turkish=yeni}{morphologicalAnalysis=yeni+ADJ}")
+        word2 = AnnotatedWord("{turkish=Yeni}{morphologicalAnalysis=yeni+ADJ}")
+        self.assertIs(word1.getParse(), word2.getParse())
+        word2.setParse("yeni+NOUN+A3SG+PNON+NOM")
+        self.assertEqual("yeni+ADJ", word1.getParse().__str__())
+        self.assertEqual(1, AnnotatedWord.getParseCache().getHitCount())
+        AnnotatedWord.setParseCache(previous_cache)
+
+    def test_ParseCacheAliasing(self):
+        layers = "{turkish=ölçekli}{morphologicalAnalysis=ölçek+NOUN+A3SG+PNON+NOM^DB+ADJ+WITH}" \
+                 "{metaMorphemes=ölçek+lH}{propbank=ARG0$TUR10-1234}{framenet=AGENT$Frame$TUR10-1234}"
+        for lazy in [False, True]:
+            word1 = AnnotatedWord(layers, lazy=lazy)
+            word2 = AnnotatedWord(layers, lazy=lazy)
+            self.assertIs(word1.getParse(), word2.getParse())
+            self.assertIsNot(word1.getMetamorphicParse(), word2.getMetamorphicParse())
+            self.assertIsNot(word1.getArgumentList(), word2.getArgumentList())
+            self.assertIsNot(word1.getFrameElementList(), word2.getFrameElementList())
+            word1.getMetamorphicParse().addMetaMorphemeList("DA")
+            word1.getArgumentList().updateConnectedId("TUR10-1234", "TUR10-5678")
+            word1.getFrameElementList().updateConnectedId("TUR10-1234", "TUR10-5678")
+            self.assertEqual("{turkish=ölçekli}{morphologicalAnalysis=ölçek+NOUN+A3SG+PNON+NOM^DB+ADJ+WITH}"
+                             "{metaMorphemes=ölçek+lH+DA}{propbank=ARG0$TUR10-5678}"
+                             "{framenet=AGENT$Frame$TUR10-5678}", word1.__str__())
+            self.assertEqual(layers, word2.__str__())
+            self.assertEqual(layers, AnnotatedWord(layers, lazy=lazy).__str__())
+
+    def test_SerializedForm(self):
+        word = AnnotatedWord("{turkish=Gelir}{morphologicalAnalysis=gelir+NOUN+A3SG+PNON+NOM}"
+                             "{propbank=ARG0$TUR10-0100}{universalDependency=10$NSUBJ}")
+        serialized = word.__str__()
+        self.assertIs(serialized, word.__str__())
+        word.setSemantic("TUR10-0100")
+        self.assertEqual("{turkish=Gelir}{morphologicalAnalysis=gelir+NOUN+A3SG+PNON+NOM}{semantics=TUR10-0100}"
+                         "{propbank=ARG0$TUR10-0100}{universalDependency=10$NSUBJ}", word.__str__())
+        word.getArgumentList().updateConnectedId("TUR10-0100", "TUR10-0200")
+        self.assertIn("{propbank=ARG0$TUR10-0200}", word.__str__())
+        word.setName("Gider")
+        self.assertTrue(word.__str__().startswith("{turkish=Gider}"))
+
+    def test_Modified(self):
+        word = AnnotatedWord("{turkish=Gelir}{morphologicalAnalysis=gelir+NOUN+A3SG+PNON+NOM}"
+                             "{propbank=PREDICATE$TUR10-0100}{polarity=positive}")
+        self.assertFalse(word.isModified())
+        word.getArgumentList()
+        self.assertFalse(word.isModified())
+        self.assertFalse(word.updateConnectedPredicate("TUR10-0200", "TUR10-0300"))
+        self.assertFalse(word.isModified())
+        self.assertTrue(word.updateConnectedPredicate("TUR10-0100", "TUR10-0200"))
+        self.assertTrue(word.isModified())
+        word.clearModified()
+        word.setPosTag("NN")
+        self.assertTrue(word.isModified())
+
+
+if __name__ == '__main__':
+    unittest.main()